@@ -17,6 +17,7 @@ KEY FIXES:
 import csv
 import os
 import logging
+import weakref
 from typing import Callable, Any, Dict, List, Optional, Union, Tuple
 from .constants import SETTINGS_FILE, PRESSURE_DEFAULTS, TIME_DEFAULTS, CALIBRATION_CONFIG
 
@@ -400,14 +401,24 @@ class SettingsManager:
         
         return diagnostics
     
+    @staticmethod
+    def _observer_name(callback) -> str:
+        """Get a printable name for an observer, resolving weak references."""
+        if isinstance(callback, weakref.ref):
+            callback = callback()
+        return getattr(callback, '__qualname__', repr(callback))
+    
     def register_observer(self, callback: Callable[[str, Any], None]):
         """
         Register a callback to be called when settings are changed.
         The callback should accept (key, value) as arguments.
+        
+        The callback may also be a weak reference to one (e.g. weakref.WeakMethod),
+        so the observer does not keep its owner alive; it is dropped once dead.
         """
         if callback not in self._observers:
             self._observers.append(callback)
-            self.logger.debug(f"Registered observer {callback.__qualname__}")
+            self.logger.debug(f"Registered observer {self._observer_name(callback)}")
     
     def unregister_observer(self, callback: Callable[[str, Any], None]):
         """
@@ -418,7 +429,7 @@ class SettingsManager:
         """
         if callback in self._observers:
             self._observers.remove(callback)
-            self.logger.debug(f"Unregistered observer {callback.__qualname__}")
+            self.logger.debug(f"Unregistered observer {self._observer_name(callback)}")
     
     def _notify_observers(self, key: str, value: Any):
         """
@@ -429,7 +440,14 @@ class SettingsManager:
             value: The new value of the setting
         """
         self.logger.debug(f"Notifying observers of change to {key}")
-        for callback in self._observers:
+        for observer in list(self._observers):
+            callback = observer
+            if isinstance(observer, weakref.ref):
+                callback = observer()
+                if callback is None:
+                    # Owner was garbage collected without unregistering
+                    self._observers.remove(observer)
+                    continue
             try:
                 callback(key, value)
             except Exception as e:
@@ -36,6 +36,15 @@ class ChamberTestState:
     State container for an individual chamber during testing.
     """
     
+    # Fixed attribute set: read by the UI on every pressure update
+    __slots__ = (
+        'chamber_index', 'enabled', 'pressure_target', 'pressure_threshold',
+        'pressure_tolerance', 'current_pressure', 'start_pressure', 'final_pressure',
+        'mean_pressure', 'pressure_std', 'result', 'phase', 'test_complete',
+        'regulation_state', 'last_pressure', 'pressure_rates', 'consecutive_stable',
+        'pressure_readings', 'fill_start_time', 'stability_achieved'
+    )
+    
     def __init__(self, chamber_index: int):
         """
         Initialize the chamber state.
@@ -187,6 +196,7 @@ class TestManager:
         self.status_callback = None
         self.progress_callback = None
         self.result_callback = None
+        self.pressure_callback = None
                 
         # Database save tracking
         self._database_save_completed = False
@@ -207,11 +217,13 @@ class TestManager:
     
     def set_callbacks(self, status_callback: Optional[Callable] = None,
                      progress_callback: Optional[Callable] = None,
-                     result_callback: Optional[Callable] = None):
+                     result_callback: Optional[Callable] = None,
+                     pressure_callback: Optional[Callable] = None):
         with self._state_lock:
             self.status_callback = status_callback
             self.progress_callback = progress_callback
             self.result_callback = result_callback
+            self.pressure_callback = pressure_callback
     
     def set_test_mode(self, mode: str, reference: Optional[str] = None) -> bool:
         with self._state_lock:
@@ -301,6 +313,10 @@ class TestManager:
         self.logger.info(f"Updated parameters for chamber {chamber_index + 1}")
         return True
     
+    def is_running(self) -> bool:
+        # Plain bool reads, no lock needed; emptying counts as running
+        return self.running_test or self._emptying_in_progress
+    
     def get_test_status(self) -> Dict[str, Any]:
         with self._state_lock:
             chamber_info = []
@@ -377,6 +393,7 @@ class TestManager:
                             valid_pressures.append(0.0)  # Default to 0 for invalid readings
                     
                     self._consecutive_sensor_errors = 0  # Reset error counter
+                    self._update_pressures(valid_pressures)
                     return valid_pressures
                     
                 self.logger.warning(f"Invalid pressure reading attempt {attempt + 1}: {pressures}")
@@ -1721,6 +1738,14 @@ class TestManager:
             except Exception as e:
                 self.logger.error(f"Error in progress callback: {e}")
     
+    def _update_pressures(self, pressures: List[float]):
+
+        if self.pressure_callback:
+            try:
+                self.pressure_callback(pressures)
+            except Exception as e:
+                self.logger.error(f"Error in pressure callback: {e}")
+    
     def set_login_requirement(self, require_login: bool) -> None:
 
         with self._state_lock:
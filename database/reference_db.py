@@ -20,6 +20,13 @@ from multi_chamber_test.config.constants import PRESSURE_DEFAULTS, TIME_DEFAULTS
 DEFAULT_DB_PATH = "/home/Bot/Desktop/techmac_reference.db"
 FALLBACK_DB_PATH = os.path.join(os.path.dirname(__file__), "../../data/techmac_reference.db")
 
+# Column list shared by the queries that return full reference profiles
+_REFERENCE_COLUMNS = """barcode,
+                           ch1_pressure_target, ch1_pressure_threshold, ch1_pressure_tolerance, ch1_enabled,
+                           ch2_pressure_target, ch2_pressure_threshold, ch2_pressure_tolerance, ch2_enabled,
+                           ch3_pressure_target, ch3_pressure_threshold, ch3_pressure_tolerance, ch3_enabled,
+                           test_duration, created_at, last_used"""
+
 
 class ReferenceDatabase:
     """
@@ -282,6 +289,30 @@ class ReferenceDatabase:
             self.logger.error(f"General error deleting reference: {e}")
             return False
     
+    @staticmethod
+    def _row_to_reference(row: Tuple) -> Dict[str, Any]:
+        """
+        Convert a row selected with _REFERENCE_COLUMNS into a reference dict.
+        
+        Rows are plain tuples so the whole table is read in one query without
+        per-column name lookups.
+        """
+        return {
+            'barcode': row[0],
+            'test_duration': row[13],
+            'created_at': row[14],
+            'last_used': row[15],
+            'chambers': [
+                {
+                    'pressure_target': row[i],
+                    'pressure_threshold': row[i + 1],
+                    'pressure_tolerance': row[i + 2],
+                    'enabled': bool(row[i + 3])
+                }
+                for i in (1, 5, 9)
+            ]
+        }
+    
     def get_all_references(self) -> List[Dict[str, Any]]:
         """
         Get all reference profiles from the database.
@@ -291,48 +322,15 @@ class ReferenceDatabase:
         """
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Enable dictionary access for rows
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    SELECT barcode,
-                           ch1_pressure_target, ch1_pressure_threshold, ch1_pressure_tolerance, ch1_enabled,
-                           ch2_pressure_target, ch2_pressure_threshold, ch2_pressure_tolerance, ch2_enabled,
-                           ch3_pressure_target, ch3_pressure_threshold, ch3_pressure_tolerance, ch3_enabled,
-                           test_duration, created_at, last_used
+                    SELECT ''' + _REFERENCE_COLUMNS + '''
                     FROM ref_table
                     ORDER BY last_used DESC
                 ''')
                 
-                results = []
-                for row in cursor.fetchall():
-                    reference_data = {
-                        'barcode': row['barcode'],
-                        'test_duration': row['test_duration'],
-                        'created_at': row['created_at'],
-                        'last_used': row['last_used'],
-                        'chambers': [
-                            {
-                                'pressure_target': row['ch1_pressure_target'],
-                                'pressure_threshold': row['ch1_pressure_threshold'],
-                                'pressure_tolerance': row['ch1_pressure_tolerance'],
-                                'enabled': bool(row['ch1_enabled'])
-                            },
-                            {
-                                'pressure_target': row['ch2_pressure_target'],
-                                'pressure_threshold': row['ch2_pressure_threshold'],
-                                'pressure_tolerance': row['ch2_pressure_tolerance'],
-                                'enabled': bool(row['ch2_enabled'])
-                            },
-                            {
-                                'pressure_target': row['ch3_pressure_target'],
-                                'pressure_threshold': row['ch3_pressure_threshold'],
-                                'pressure_tolerance': row['ch3_pressure_tolerance'],
-                                'enabled': bool(row['ch3_enabled'])
-                            }
-                        ]
-                    }
-                    results.append(reference_data)
+                results = [self._row_to_reference(row) for row in cursor.fetchall()]
                 
                 self.logger.info(f"Retrieved {len(results)} references")
                 return results
@@ -359,49 +357,16 @@ class ReferenceDatabase:
             
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Enable dictionary access for rows
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    SELECT barcode,
-                           ch1_pressure_target, ch1_pressure_threshold, ch1_pressure_tolerance, ch1_enabled,
-                           ch2_pressure_target, ch2_pressure_threshold, ch2_pressure_tolerance, ch2_enabled,
-                           ch3_pressure_target, ch3_pressure_threshold, ch3_pressure_tolerance, ch3_enabled,
-                           test_duration, created_at, last_used
+                    SELECT ''' + _REFERENCE_COLUMNS + '''
                     FROM ref_table
                     WHERE barcode LIKE ?
                     ORDER BY last_used DESC
                 ''', (pattern,))
                 
-                results = []
-                for row in cursor.fetchall():
-                    reference_data = {
-                        'barcode': row['barcode'],
-                        'test_duration': row['test_duration'],
-                        'created_at': row['created_at'],
-                        'last_used': row['last_used'],
-                        'chambers': [
-                            {
-                                'pressure_target': row['ch1_pressure_target'],
-                                'pressure_threshold': row['ch1_pressure_threshold'],
-                                'pressure_tolerance': row['ch1_pressure_tolerance'],
-                                'enabled': bool(row['ch1_enabled'])
-                            },
-                            {
-                                'pressure_target': row['ch2_pressure_target'],
-                                'pressure_threshold': row['ch2_pressure_threshold'],
-                                'pressure_tolerance': row['ch2_pressure_tolerance'],
-                                'enabled': bool(row['ch2_enabled'])
-                            },
-                            {
-                                'pressure_target': row['ch3_pressure_target'],
-                                'pressure_threshold': row['ch3_pressure_threshold'],
-                                'pressure_tolerance': row['ch3_pressure_tolerance'],
-                                'enabled': bool(row['ch3_enabled'])
-                            }
-                        ]
-                    }
-                    results.append(reference_data)
+                results = [self._row_to_reference(row) for row in cursor.fetchall()]
                 
                 self.logger.info(f"Found {len(results)} references matching pattern '{pattern}'")
                 return results
@@ -473,49 +438,16 @@ class ReferenceDatabase:
         """
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Enable dictionary access for rows
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    SELECT barcode,
-                           ch1_pressure_target, ch1_pressure_threshold, ch1_pressure_tolerance, ch1_enabled,
-                           ch2_pressure_target, ch2_pressure_threshold, ch2_pressure_tolerance, ch2_enabled,
-                           ch3_pressure_target, ch3_pressure_threshold, ch3_pressure_tolerance, ch3_enabled,
-                           test_duration, created_at, last_used
+                    SELECT ''' + _REFERENCE_COLUMNS + '''
                     FROM ref_table
                     ORDER BY last_used DESC
                     LIMIT ?
                 ''', (limit,))
                 
-                results = []
-                for row in cursor.fetchall():
-                    reference_data = {
-                        'barcode': row['barcode'],
-                        'test_duration': row['test_duration'],
-                        'created_at': row['created_at'],
-                        'last_used': row['last_used'],
-                        'chambers': [
-                            {
-                                'pressure_target': row['ch1_pressure_target'],
-                                'pressure_threshold': row['ch1_pressure_threshold'],
-                                'pressure_tolerance': row['ch1_pressure_tolerance'],
-                                'enabled': bool(row['ch1_enabled'])
-                            },
-                            {
-                                'pressure_target': row['ch2_pressure_target'],
-                                'pressure_threshold': row['ch2_pressure_threshold'],
-                                'pressure_tolerance': row['ch2_pressure_tolerance'],
-                                'enabled': bool(row['ch2_enabled'])
-                            },
-                            {
-                                'pressure_target': row['ch3_pressure_target'],
-                                'pressure_threshold': row['ch3_pressure_threshold'],
-                                'pressure_tolerance': row['ch3_pressure_tolerance'],
-                                'enabled': bool(row['ch3_enabled'])
-                            }
-                        ]
-                    }
-                    results.append(reference_data)
+                results = [self._row_to_reference(row) for row in cursor.fetchall()]
                 
                 self.logger.info(f"Retrieved {len(results)} most recent references")
                 return results
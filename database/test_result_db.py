@@ -13,7 +13,9 @@ import sqlite3
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Iterator
 
 from multi_chamber_test.core.roles import get_current_username
 
@@ -305,6 +307,61 @@ class TestResultDatabase:
             self.logger.error(f"Error retrieving test results: {e}")
             return []
 
+    def iter_all_results(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every stored test run (oldest first), one record at a time.
+        
+        Same records as get_all_results, read with a single query and built
+        as the rows arrive, so exports do not hold all results in memory.
+        
+        Yields:
+            Test result dictionaries, as returned by get_all_results
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute("""
+                SELECT t.id, t.timestamp, t.operator_id, t.operator_name, t.reference,
+                       t.test_mode, t.test_duration, t.overall_result,
+                       c.chamber_id, c.enabled, c.pressure_target,
+                       c.pressure_threshold, c.pressure_tolerance,
+                       c.final_pressure, c.result
+                FROM test_results t
+                LEFT JOIN chamber_results c ON c.test_id = t.id
+                ORDER BY t.timestamp ASC, t.id ASC, c.chamber_id ASC
+            """)
+            
+            for test_id, rows in groupby(cursor, key=itemgetter(0)):
+                first = next(rows)
+                _, timestamp, operator_id, operator_name, reference, test_mode, duration, overall = first[:8]
+                
+                chambers = [
+                    {
+                        'chamber_id': row[8],
+                        'enabled': bool(row[9]),
+                        'pressure_target': row[10],
+                        'pressure_threshold': row[11],
+                        'pressure_tolerance': row[12],
+                        'final_pressure': row[13],
+                        'result': bool(row[14])
+                    }
+                    for row in chain((first,), rows)
+                    if row[8] is not None  # Test without chamber results
+                ]
+                
+                yield {
+                    'id': test_id,
+                    'timestamp': timestamp,
+                    'operator_id': operator_id,
+                    'operator_name': operator_name,
+                    'reference': reference,
+                    'test_mode': test_mode,
+                    'test_duration': duration,
+                    'overall_result': bool(overall),
+                    'chambers': chambers
+                }
+        finally:
+            conn.close()
+
     def get_recent_results(self, count: int = 10) -> List[Dict[str, Any]]:
         """
         Get the most recent test results.
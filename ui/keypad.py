@@ -22,7 +22,7 @@ class NumericKeypad(tk.Toplevel):
     def __init__(self, parent, variable, title: str = "Enter Value", 
                  is_pressure_target: bool = False, max_value: Optional[float] = None,
                  min_value: Optional[float] = 0, decimal_places: int = 2,
-                 callback: Optional[Callable] = None):
+                 callback: Optional[Callable] = None, reusable: bool = False):
         """
         Initialize the NumericKeypad with the specified parameters.
         
@@ -35,9 +35,14 @@ class NumericKeypad(tk.Toplevel):
             min_value: Minimum allowed value (0 by default)
             decimal_places: Number of decimal places allowed
             callback: Optional callback function to call when OK is pressed
+            reusable: Start withdrawn and withdraw instead of destroying on
+                      OK/Cancel, so the keypad can be shown again with reopen()
         """
         super().__init__(parent)
+        if reusable:
+            self.withdraw()
         
+        self.reusable = reusable
         self.variable = variable
         self.is_pressure_target = is_pressure_target
         self.result = ""
@@ -53,7 +58,8 @@ class NumericKeypad(tk.Toplevel):
         
         # Make this window modal
         self.transient(parent)
-        self.after_idle(self._safe_grab)
+        if not reusable:
+            self.after_idle(self._safe_grab)
         
         # Calculate an appropriate size based on screen dimensions
         screen_width = self.winfo_screenwidth()
@@ -88,9 +94,44 @@ class NumericKeypad(tk.Toplevel):
         # Bind keyboard events
         self.bind("<Escape>", self.cancel_click)
         self.bind("<Return>", self.ok_click)
+        self.protocol("WM_DELETE_WINDOW", self.cancel_click)
         
         # Focus on the entry field
-        self.display.focus_set()
+        if not reusable:
+            self.display.focus_set()
+    
+    def reopen(self, variable, title: str = "Enter Value",
+               is_pressure_target: bool = False, max_value: Optional[float] = None,
+               min_value: Optional[float] = 0, decimal_places: int = 2,
+               callback: Optional[Callable] = None):
+        """
+        Show a reusable keypad again for a new variable.
+        
+        Takes the same input arguments as the constructor.
+        """
+        self.variable = variable
+        self.is_pressure_target = is_pressure_target
+        self.max_value = max_value
+        self.min_value = min_value
+        self.decimal_places = decimal_places
+        self.callback = callback
+        
+        self.title(title)
+        self.title_label.config(text=title)
+        self.display_var.set(variable.get())
+        self.error_label.config(text="")
+        
+        self._grab_retry_count = 0
+        self.deiconify()
+        self.after_idle(self._safe_grab)
+    
+    def _close(self):
+        """Withdraw a reusable keypad, destroy any other."""
+        if self.reusable:
+            self.grab_release()
+            self.withdraw()
+        else:
+            self.destroy()
     
     def _safe_grab(self):
         """Safely set window grab after ensuring visibility and avoid errors if destroyed early."""
@@ -156,12 +197,13 @@ class NumericKeypad(tk.Toplevel):
         main_frame.pack(fill=tk.BOTH, expand=True)
     
         # Title label at top - larger for HD display
-        ttk.Label(
+        self.title_label = ttk.Label(
             main_frame,
             text=self.title(),
             font=('Helvetica', 24, 'bold'),
             anchor='center'
-        ).pack(fill=tk.X, pady=(0, 30))
+        )
+        self.title_label.pack(fill=tk.X, pady=(0, 30))
     
         # Display frame
         display_frame = ttk.Frame(main_frame)
@@ -175,9 +217,10 @@ class NumericKeypad(tk.Toplevel):
         ).pack(side=tk.LEFT)
     
         # Display entry
+        self.display_var = tk.StringVar(value=self.variable.get())
         self.display = ttk.Entry(
             display_frame,
-            textvariable=tk.StringVar(value=self.variable.get()),
+            textvariable=self.display_var,
             font=('Helvetica', 24),
             width=15,
             justify='right'
@@ -323,7 +366,7 @@ class NumericKeypad(tk.Toplevel):
     
     def cancel_click(self, event=None):
         """Close the keypad dialog without saving."""
-        self.destroy()
+        self._close()
     
     def ok_click(self, event=None):
         """Validate and save the entered value."""
@@ -350,7 +393,7 @@ class NumericKeypad(tk.Toplevel):
                 self.callback(self.variable.get())
             
             # Close the dialog
-            self.destroy()
+            self._close()
             
         except Exception as e:
             self.error_label.config(text=f"Error: {str(e)}")
@@ -820,6 +863,36 @@ def show_numeric_keypad(parent, variable, title="Enter Value", **kwargs):
     return keypad
 
 
+def show_reusable_numeric_keypad(keypad: Optional[NumericKeypad], parent, variable,
+                                 title="Enter Value", **kwargs) -> NumericKeypad:
+    """
+    Show a reusable numeric keypad, building it only when needed.
+    
+    The caller keeps the returned keypad and passes it back on the next call;
+    OK/Cancel withdraw it instead of destroying it. A new keypad is built if
+    none is given or the previous one has been destroyed, e.g. together with
+    its parent.
+    
+    Args:
+        keypad: Keypad returned by a previous call, or None
+        parent: Parent widget
+        variable: Variable to store the result
+        title: Dialog title
+        **kwargs: Additional arguments to pass to NumericKeypad.reopen
+        
+    Returns:
+        The keypad instance
+    """
+    if keypad is None or not keypad.winfo_exists():
+        keypad = NumericKeypad(parent, tk.StringVar(parent), reusable=True)
+    keypad.reopen(variable, title, **kwargs)
+    # Ensure the keypad is visible
+    keypad.lift()
+    # Schedule focus after dialog is fully realized
+    keypad.after(100, keypad.display.focus_set)
+    return keypad
+
+
 def show_alphanumeric_keyboard(parent, variable, title="Enter Text", **kwargs):
     """
     Convenience function to show an alphanumeric keyboard dialog with improved visibility.
@@ -1044,6 +1044,16 @@ class MainWindow:
         self.root.bind("<<SwitchToSettingsTab>>", lambda e: self.switch_tab("settings"))
         self.root.bind("<<SwitchToCalibrationTab>>", lambda e: self.switch_tab("calibration"))
         self.root.bind("<<SwitchToReferenceTab>>", lambda e: self.switch_tab("reference"))
+        
+        # Loading a reference updates its last_used time, which orders the
+        # reference list, so have the reference tab reload on its next selection
+        self.root.bind("<<ReferenceLoaded>>", self._on_reference_loaded)
+    
+    def _on_reference_loaded(self, event=None):
+        """Mark the reference tab's cached list as out of date."""
+        tab_instance = self.tab_instances.get("reference")
+        if tab_instance:
+            tab_instance.invalidate()
     
     def _setup_hardware_buffer(self):
         """Create a buffer between hardware and UI to prevent blocking."""
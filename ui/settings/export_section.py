@@ -9,12 +9,13 @@ from tkinter import ttk, messagebox
 import threading
 import time
 import os
+from itertools import chain
 from typing import Optional, Dict, Any
 
 from multi_chamber_test.config.constants import UI_COLORS, UI_FONTS
 from multi_chamber_test.ui.settings.base_section import BaseSection
 from multi_chamber_test.database.test_result_db import TestResultDatabase
-from multi_chamber_test.utils.file_exporter import FileExporter
+from multi_chamber_test.utils.file_exporter import get_file_exporter
 
 
 class ExportSection(BaseSection):
@@ -22,7 +23,7 @@ class ExportSection(BaseSection):
     
     def __init__(self, parent, test_manager=None):
         # Create file exporter and database
-        self.file_exporter = FileExporter()
+        self.file_exporter = get_file_exporter()
         self.database = TestResultDatabase()
         
         # test_manager is no longer used but kept for backward compatibility
@@ -278,13 +279,18 @@ class ExportSection(BaseSection):
         
         def do_export():
             try:
-                test_data = self._get_all_test_data()
-                if not test_data:
+                # Stream records straight from the database into the CSV file
+                records = self.database.iter_all_results()
+                first_record = next(records, None)
+                if first_record is None:
                     self._schedule_ui_update(lambda: messagebox.showinfo("No Data", "No test results found."))
                     return
                 
-                success = self.file_exporter.export_all_tests(test_data)
-                self._schedule_ui_update(lambda: self._show_export_result(success, len(test_data)))
+                record_count = self.file_exporter.export_all_tests(
+                    chain((first_record,), records),
+                    progress_cb=self._report_export_progress
+                )
+                self._schedule_ui_update(lambda: self._show_export_result(record_count > 0, record_count))
                 
             except Exception as e:
                 self.logger.error(f"Export error: {e}")
@@ -385,6 +391,12 @@ class ExportSection(BaseSection):
             self.logger.error(f"Error getting last test: {e}")
             return None
     
+    def _report_export_progress(self, record_count: int):
+        """Show the running record count of an export (called from the export thread)."""
+        self._schedule_ui_update(
+            lambda: self.show_feedback(f"Exporting... {record_count} records", duration=None)
+        )
+    
     def _show_export_result(self, success: bool, record_count: int = 0):
         """Show export result."""
         if success:
@@ -24,14 +24,522 @@ import tkinter as tk
 from tkinter import ttk
 import logging
 import math
+import queue
 import time
-from typing import List, Dict, Any, Optional
+import weakref
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 
+# PIL is used to render gauge faces off-screen; fall back to canvas drawing without it
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+    Image = None
+    ImageDraw = None
+    ImageFont = None
+    ImageTk = None
+
 from multi_chamber_test.config.constants import UI_COLORS, UI_FONTS, UI_DIMENSIONS, TEST_STATES, PRESSURE_DEFAULTS
 from multi_chamber_test.core.test_manager import TestManager
 from multi_chamber_test.config.settings import SettingsManager
 
+# Hot-path constants resolved once at import time
+_MAX_PRESSURE = PRESSURE_DEFAULTS['MAX_PRESSURE']
+_GAUGE_SIZE = UI_DIMENSIONS['GAUGE_SIZE']
+_BG_COLOR = UI_COLORS['BACKGROUND']
+_ERROR_COLOR = UI_COLORS['ERROR']
+_PRIMARY_COLOR = UI_COLORS['PRIMARY']
+_TEXT_PRIMARY_COLOR = UI_COLORS['TEXT_PRIMARY']
+
+# Scale angle (degrees) per mbar: the scale spans 300 degrees from 150 down to -150
+_DEG_PER_MBAR = 300.0 / _MAX_PRESSURE
+
+# (frame style, label style) applied to the status display for each bucket
+_BUCKET_STYLES = {
+    'idle': ('StatusBg.TFrame', 'Status.TLabel'),
+    'running': ('StatusRunning.TFrame', 'StatusRunning.TLabel'),
+    'warning': ('StatusWarning.TFrame', 'StatusWarning.TLabel'),
+    'success': ('StatusSuccess.TFrame', 'StatusSuccess.TLabel'),
+    'error': ('StatusError.TFrame', 'StatusError.TLabel'),
+}
+
+# Status style bucket for each test state; states sharing a bucket share a style
+_STATE_BUCKETS = {
+    "IDLE": 'idle',
+    "FILLING": 'running',
+    "REGULATING": 'running',
+    "STABILIZING": 'running',
+    "TESTING": 'running',
+    "EMPTYING": 'warning',
+    "COMPLETE": 'success',
+    "ERROR": 'error',
+}
+
+# Test state -> (bucket, frame style, label style), for every known styled state
+_STATE_STYLES = {
+    state: (bucket,) + _BUCKET_STYLES[bucket]
+    for state, bucket in _STATE_BUCKETS.items()
+    if state in TEST_STATES
+}
+
+# States in which a new test may be started
+_STARTABLE_STATES = frozenset({"IDLE", "COMPLETE", "ERROR"})
+
+
+@functools.lru_cache(maxsize=None)
+def _pil_font(font):
+    """Resolve a Tk font tuple to a PIL font of about the same pixel size."""
+    size = font[1]
+    pixel_size = -size if size < 0 else round(size * 4 / 3)  # Tk points at ~96 DPI
+    font_file = 'DejaVuSans-Bold.ttf' if 'bold' in font[2:] else 'DejaVuSans.ttf'
+    try:
+        return ImageFont.truetype(font_file, pixel_size)
+    except OSError:
+        return ImageFont.load_default(pixel_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _tick_geometry(gauge_size: int, max_pressure: int):
+    """
+    Precompute the scale marker geometry for a gauge of the given size.
+    
+    Returns:
+        Tuple of (label, x1, y1, x2, y2, label_x, label_y) per 100 mbar tick,
+        where (x1, y1)-(x2, y2) is the tick line and (label_x, label_y) the label centre.
+    """
+    center = gauge_size // 2
+    radius = center - 15
+    inner_radius = radius - 25
+    label_radius = inner_radius - 22
+    ticks = []
+    for i in range(0, max_pressure + 1, 100):
+        radian = math.radians(150 - (i * 300 / max_pressure))
+        cos_val = math.cos(radian)
+        sin_val = math.sin(radian)
+        ticks.append((
+            str(i),
+            center + inner_radius * cos_val, center - inner_radius * sin_val,
+            center + radius * cos_val, center - radius * sin_val,
+            center + label_radius * cos_val, center - label_radius * sin_val,
+        ))
+    return tuple(ticks)
+
+
+@functools.lru_cache(maxsize=512)
+def _pointer_tip(angle: int, gauge_size: int):
+    """
+    Compute the pointer tip for a whole-degree scale angle.
+    
+    Returns:
+        Tuple (x, y) of the pointer end opposite the pivot
+    """
+    center = gauge_size // 2
+    pointer_length = center - 15 - 20
+    radian = math.radians(angle)
+    return (center + pointer_length * math.cos(radian),
+            center - pointer_length * math.sin(radian))
+
+
+@functools.lru_cache(maxsize=256)
+def _triangle_points(pressure: float, gauge_size: int, max_pressure: int, triangle_size: int):
+    """
+    Compute the triangle marker polygon pointing at a pressure on the scale.
+    
+    Returns:
+        Tuple (p1_x, p1_y, p2_x, p2_y, p3_x, p3_y)
+    """
+    center = gauge_size // 2
+    radius = center - 15
+    radian = math.radians(150 - (pressure * 300 / max_pressure))
+    cos_val = math.cos(radian)
+    sin_val = math.sin(radian)
+    return (
+        center + (radius + 8) * cos_val,
+        center - (radius + 8) * sin_val,
+        center + (radius - triangle_size) * cos_val - triangle_size * sin_val,
+        center - (radius - triangle_size) * sin_val - triangle_size * cos_val,
+        center + (radius - triangle_size) * cos_val + triangle_size * sin_val,
+        center - (radius - triangle_size) * sin_val + triangle_size * cos_val,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _render_scale_layer(failed: bool, gauge_size: int, max_pressure: int):
+    """
+    Render the gauge scale (arc, tick marks and labels) onto a transparent image.
+    
+    The scale only depends on the failure state, so it is drawn once and
+    composited into every gauge face instead of issuing a line and a text
+    per tick. The returned image is shared and must not be modified.
+    
+    Returns:
+        PIL.Image.Image: gauge_size x gauge_size RGBA image
+    """
+    center = gauge_size // 2
+    radius = center - 15
+    
+    layer = Image.new('RGBA', (gauge_size, gauge_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    
+    # Main scale arc; PIL strokes inwards from the bbox, Tk centres the stroke on it
+    scale_color = _ERROR_COLOR if failed else UI_COLORS['BORDER']
+    draw.arc((center - radius - 7, center - radius - 7, center + radius + 7, center + radius + 7),
+             -150, 150, fill=scale_color, width=14)
+    
+    # Scale markers and labels
+    marker_color = _ERROR_COLOR if failed else _TEXT_PRIMARY_COLOR
+    label_font = _pil_font(UI_FONTS['GAUGE_UNIT'])
+    for label, x1, y1, x2, y2, label_x, label_y in _tick_geometry(gauge_size, max_pressure):
+        draw.line((x1, y1, x2, y2), fill=marker_color, width=3)
+        draw.text((label_x, label_y), label, font=label_font, fill=marker_color, anchor='mm')
+    
+    return layer
+
+
+def _render_gauge_face(target: float, threshold: float, tolerance: float,
+                       enabled: bool, failed: bool):
+    """
+    Render the static part of a pressure gauge into a PIL image.
+    
+    Mirrors the canvas drawing in GaugeRenderer._draw_static_on_canvas so
+    the whole face can be shown with a single canvas image item.
+    
+    Returns:
+        PIL.Image.Image: GAUGE_SIZE x GAUGE_SIZE RGB image
+    """
+    GAUGE_SIZE = _GAUGE_SIZE
+    CENTER_X, CENTER_Y = GAUGE_SIZE // 2, GAUGE_SIZE // 2
+    RADIUS = (GAUGE_SIZE // 2) - 15
+    MAX_PRESSURE = _MAX_PRESSURE
+    
+    image = Image.new('RGB', (GAUGE_SIZE, GAUGE_SIZE), _BG_COLOR)
+    draw = ImageDraw.Draw(image)
+    bbox = (CENTER_X - RADIUS, CENTER_Y - RADIUS, CENTER_X + RADIUS, CENTER_Y + RADIUS)
+    
+    # Tk measures angles counter-clockwise, PIL clockwise, hence the negated angles
+    if failed:
+        background_color, border_color, border_width = '#FFEBEE', _ERROR_COLOR, 3
+    elif not enabled:
+        background_color, border_color, border_width = '#F5F5F5', UI_COLORS['BORDER'], 2
+    else:
+        background_color, border_color, border_width = _BG_COLOR, UI_COLORS['BORDER'], 2
+    draw.ellipse(bbox, fill=background_color, outline=border_color, width=border_width)
+    
+    if not enabled:
+        draw.text((CENTER_X, CENTER_Y - 10), "Disabled", font=_pil_font(UI_FONTS['SUBHEADER']),
+                  fill=UI_COLORS['TEXT_SECONDARY'], anchor='mm')
+        return image
+    
+    if failed:
+        draw.text((CENTER_X, CENTER_Y - 50), "FAILED", font=_pil_font(UI_FONTS['SUBHEADER']),
+                  fill=_ERROR_COLOR, anchor='mm')
+    else:
+        # Tolerance zone background
+        tolerance_start_angle = 150.0 - (target - tolerance) * _DEG_PER_MBAR
+        tolerance_end_angle = 150.0 - (target + tolerance) * _DEG_PER_MBAR
+        draw.pieslice(bbox, -tolerance_start_angle, -tolerance_end_angle, fill='#E8F5E9')
+    
+    # Scale arc, markers and labels (shared by every gauge with the same failure state)
+    scale = _render_scale_layer(failed, GAUGE_SIZE, MAX_PRESSURE)
+    image.paste(scale, (0, 0), scale)
+    
+    # Pointer pivot
+    pivot_color = _ERROR_COLOR if failed else _PRIMARY_COLOR
+    draw.ellipse((CENTER_X - 5, CENTER_Y - 5, CENTER_X + 5, CENTER_Y + 5), fill=pivot_color)
+    
+    # Target (green) and threshold (red) triangle markers
+    if not failed:
+        for pressure, fill, outline in ((target, UI_COLORS['SUCCESS'], 'darkgreen'),
+                                        (threshold, _ERROR_COLOR, 'darkred')):
+            draw.polygon(
+                _triangle_points(pressure, GAUGE_SIZE, MAX_PRESSURE, 12),
+                fill=fill, outline=outline, width=2
+            )
+    
+    # Unit text
+    unit_color = _ERROR_COLOR if failed else UI_COLORS['TEXT_SECONDARY']
+    draw.text((CENTER_X, CENTER_Y + 40), "mbar", font=_pil_font(UI_FONTS['GAUGE_UNIT']),
+              fill=unit_color, anchor='mm')
+    
+    return image
+
+
+class GaugeRenderer:
+    """
+    Draws one chamber's pressure gauge on a persistent canvas.
+    
+    The static layer (face, scale, markers, failure state) is only redrawn when
+    its parameters change. The dynamic layer (pointer and value) reuses the
+    same canvas items for every reading. The canvas is never recreated.
+    """
+    
+    __slots__ = ('canvas', 'face_source', 'params', '_dynamic_items', '_drawn_dynamic')
+    
+    # Canvas item options per tag for a (not failed, failed) enabled gauge
+    _FAIL_STYLES = {
+        "background": (
+            {'fill': _BG_COLOR, 'outline': UI_COLORS['BORDER'], 'width': 2},
+            {'fill': '#FFEBEE', 'outline': _ERROR_COLOR, 'width': 3},  # Light red for failed chambers
+        ),
+        "scale_arc": ({'outline': UI_COLORS['BORDER']}, {'outline': _ERROR_COLOR}),
+        "scale_marker": ({'fill': _TEXT_PRIMARY_COLOR}, {'fill': _ERROR_COLOR}),
+        "scale_label": ({'fill': _TEXT_PRIMARY_COLOR}, {'fill': _ERROR_COLOR}),
+        "pivot": ({'fill': _PRIMARY_COLOR}, {'fill': _ERROR_COLOR}),
+        "unit_text": ({'fill': UI_COLORS['TEXT_SECONDARY']}, {'fill': _ERROR_COLOR}),
+    }
+    
+    def __init__(self, canvas: tk.Canvas, face_source: Optional[Callable[[tuple], Any]] = None):
+        """
+        Initialize the renderer for a gauge canvas.
+        
+        Args:
+            canvas: Canvas the gauge is drawn on
+            face_source: Callable returning a PhotoImage of the static face for a
+                (target, threshold, tolerance, enabled, failed) tuple, or None while
+                it is still being rendered (it is then delivered via set_face).
+                Without a face_source the static face is drawn with canvas items.
+        """
+        self.canvas = canvas
+        self.face_source = face_source
+        self.params = None  # Parameters the static face was drawn with
+        self._dynamic_items = None  # (pointer, value) canvas item ids
+        self._drawn_dynamic = None  # (angle, value, color) last drawn
+        
+        # Single image item showing the pre-rendered gauge face
+        if face_source is not None:
+            canvas.create_image(0, 0, anchor='nw', tags=("static", "face"))
+    
+    def draw_static(self, params: tuple):
+        """Draw the static face for a (target, threshold, tolerance, enabled, failed) tuple."""
+        previous = self.params
+        self.params = params
+        canvas = self.canvas
+        
+        # Preferred path: show a face rendered off-screen, cached per parameter set
+        if self.face_source is not None:
+            face = self.face_source(params)
+            if face is not None:
+                self.set_face(face)
+            canvas.delete("dynamic")
+            self._dynamic_items = None
+            return
+        
+        # Only the failure state changed: recolor the existing items by tag
+        if previous is not None and previous[:4] == params[:4] and params[3]:
+            self._apply_fail_state(params[4])
+            return
+        
+        canvas.delete("all")  # Clear the canvas completely for initialization
+        self._dynamic_items = None
+        self._draw_static_on_canvas(*params)
+    
+    def set_face(self, face):
+        """Show a rendered static face (PhotoImage) on the canvas."""
+        self.canvas.itemconfigure("face", image=face)
+    
+    def _draw_static_on_canvas(self, target: float, threshold: float, tolerance: float,
+                               enabled: bool, failed: bool):
+        """Draw the static face with individual canvas items (used without PIL)."""
+        canvas = self.canvas
+        
+        # Constants for gauge dimensions
+        GAUGE_SIZE = _GAUGE_SIZE
+        CENTER_X, CENTER_Y = GAUGE_SIZE // 2, GAUGE_SIZE // 2
+        RADIUS = (GAUGE_SIZE // 2) - 15
+        MAX_PRESSURE = _MAX_PRESSURE
+        
+        # Draw gauge background (colors for an enabled gauge come from _apply_fail_state)
+        canvas.create_oval(
+            CENTER_X - RADIUS,
+            CENTER_Y - RADIUS,
+            CENTER_X + RADIUS,
+            CENTER_Y + RADIUS,
+            fill='#F5F5F5',  # Gray background for disabled chambers
+            outline=UI_COLORS['BORDER'],
+            width=2,
+            tags=("static", "background")
+        )
+        
+        # Skip the rest if chamber is disabled
+        if not enabled:
+            canvas.create_text(
+                CENTER_X,
+                CENTER_Y - 10,
+                text="Disabled",
+                font=UI_FONTS['SUBHEADER'],
+                fill=UI_COLORS['TEXT_SECONDARY'],
+                tags=("static", "disabled_text")
+            )
+            return
+        
+        # Failure indicator, only shown for failed chambers
+        canvas.create_text(
+            CENTER_X,
+            CENTER_Y - 50,
+            text="FAILED",
+            font=UI_FONTS['SUBHEADER'],
+            fill=_ERROR_COLOR,
+            tags=("static", "failure_text")
+        )
+        
+        # Tolerance zone background (hidden if failed to avoid visual confusion)
+        tolerance_start = target - tolerance
+        tolerance_end = target + tolerance
+        tolerance_start_angle = 150.0 - tolerance_start * _DEG_PER_MBAR
+        tolerance_end_angle = 150.0 - tolerance_end * _DEG_PER_MBAR
+        
+        canvas.create_arc(
+            CENTER_X - RADIUS,
+            CENTER_Y - RADIUS,
+            CENTER_X + RADIUS,
+            CENTER_Y + RADIUS,
+            start=tolerance_start_angle,
+            extent=tolerance_end_angle - tolerance_start_angle,
+            fill='#E8F5E9',  # Light green background for tolerance zone
+            outline='',
+            tags=("static", "tolerance_zone")
+        )
+        
+        # Draw main scale arc
+        canvas.create_arc(
+            CENTER_X - RADIUS,
+            CENTER_Y - RADIUS,
+            CENTER_X + RADIUS,
+            CENTER_Y + RADIUS,
+            start=150,
+            extent=-300,
+            style=tk.ARC,
+            width=14,
+            tags=("static", "scale_arc")
+        )
+        
+        # Draw scale markers and labels (font resolved once, not per tick)
+        label_font = UI_FONTS['GAUGE_UNIT']
+        create_line = canvas.create_line
+        create_text = canvas.create_text
+        for label, x1, y1, x2, y2, label_x, label_y in _tick_geometry(GAUGE_SIZE, MAX_PRESSURE):
+            # Draw major tick marks
+            create_line(
+                x1, y1, x2, y2,
+                width=3,
+                tags=("static", "scale_marker")
+            )
+            
+            # Draw label
+            create_text(
+                label_x, label_y,
+                text=label,
+                font=label_font,
+                tags=("static", "scale_label")
+            )
+        
+        # Draw pointer pivot
+        canvas.create_oval(
+            CENTER_X - 5,
+            CENTER_Y - 5,
+            CENTER_X + 5,
+            CENTER_Y + 5,
+            outline="",
+            tags=("static", "pivot")
+        )
+        
+        # Add enhanced target marker (green triangle) - hidden if failed
+        canvas.create_polygon(
+            *_triangle_points(target, GAUGE_SIZE, MAX_PRESSURE, 12),
+            fill=UI_COLORS['SUCCESS'],
+            outline='darkgreen',
+            width=2,
+            tags=("static", "target_marker")
+        )
+        
+        # Add enhanced threshold marker (red triangle) - hidden if failed
+        canvas.create_polygon(
+            *_triangle_points(threshold, GAUGE_SIZE, MAX_PRESSURE, 12),
+            fill=_ERROR_COLOR,
+            outline='darkred',
+            width=2,
+            tags=("static", "threshold_marker")
+        )
+        
+        # Draw unit text
+        canvas.create_text(
+            CENTER_X,
+            CENTER_Y + 40,
+            text="mbar",
+            font=label_font,
+            tags=("static", "unit_text")
+        )
+        
+        self._apply_fail_state(failed)
+    
+    def _apply_fail_state(self, failed: bool):
+        """Recolor and show/hide the static canvas items of an enabled gauge by tag."""
+        canvas = self.canvas
+        for tag, options in self._FAIL_STYLES.items():
+            canvas.itemconfigure(tag, **options[failed])
+        
+        failed_state = tk.NORMAL if failed else tk.HIDDEN
+        passed_state = tk.HIDDEN if failed else tk.NORMAL
+        canvas.itemconfigure("failure_text", state=failed_state)
+        for tag in ("tolerance_zone", "target_marker", "threshold_marker"):
+            canvas.itemconfigure(tag, state=passed_state)
+    
+    def draw_dynamic(self, current_pressure: float, failed: bool = False):
+        """Move the pointer and update the value display for a new reading."""
+        canvas = self.canvas
+        
+        # Get dimensions
+        GAUGE_SIZE = _GAUGE_SIZE
+        CENTER_X, CENTER_Y = GAUGE_SIZE // 2, GAUGE_SIZE // 2
+        MAX_PRESSURE = _MAX_PRESSURE
+        
+        # Constrain pressure value to valid range for display
+        display_pressure = max(0, min(current_pressure, MAX_PRESSURE))
+        
+        # Calculate pointer angle from pressure value, quantized to whole
+        # degrees (2 mbar at full scale) so sub-pixel changes are not redrawn
+        angle = round(150.0 - display_pressure * _DEG_PER_MBAR)
+        display_value = int(round(current_pressure))
+        color = _ERROR_COLOR if failed else _PRIMARY_COLOR
+        
+        dynamic_items = self._dynamic_items
+        drawn_state = (angle, display_value, color)
+        if dynamic_items is not None and self._drawn_dynamic == drawn_state:
+            return
+        self._drawn_dynamic = drawn_state
+        
+        pointer_x, pointer_y = _pointer_tip(angle, GAUGE_SIZE)
+        
+        if dynamic_items is not None:
+            # Move/reconfigure the existing pointer and value in place
+            pointer_id, value_id = dynamic_items
+            canvas.coords(pointer_id, CENTER_X, CENTER_Y, pointer_x, pointer_y)
+            canvas.itemconfigure(pointer_id, fill=color)
+            canvas.itemconfigure(value_id, text=f"{display_value}", fill=color)
+            return
+        
+        # Draw pointer line with failure coloring
+        pointer_id = canvas.create_line(
+            CENTER_X, CENTER_Y,
+            pointer_x, pointer_y,
+            fill=color,
+            width=4,
+            tags=("dynamic", "pointer")
+        )
+        
+        # Draw digital value display as integer with failure coloring
+        value_id = canvas.create_text(
+            CENTER_X,
+            CENTER_Y + 20,
+            text=f"{display_value}",
+            font=UI_FONTS['VALUE'],
+            fill=color,
+            tags=("dynamic", "pressure_value")
+        )
+        self._dynamic_items = (pointer_id, value_id)
+
 
 class MainTab:
     """
@@ -42,6 +550,15 @@ class MainTab:
     FIXED: Proper support for both reference and manual test modes.
     """
     
+    # Maximum number of rendered gauge faces kept for reuse
+    _STATIC_GAUGE_CACHE_SIZE = 32
+    
+    # Minimum seconds between timeline redraws (~30 Hz)
+    _TIMELINE_MIN_INTERVAL = 1 / 30
+    
+    # Window (ms) over which bursts of settings notifications are coalesced
+    _SETTINGS_DEBOUNCE_MS = 50
+    
     def __init__(self, parent, test_manager: TestManager, settings_manager: SettingsManager):
         """
         Initialize the MainTab with the parent widget and TestManager.
@@ -58,26 +575,85 @@ class MainTab:
         self.test_manager = test_manager
         self.settings_manager = settings_manager
         
-        # Register as observer for settings changes
-        self.settings_manager.register_observer(self.on_setting_changed)
+        # Register as observer for settings changes (weakly, so a tab that
+        # failed to unregister does not stay alive through the settings manager)
+        self._settings_cb = weakref.WeakMethod(self.on_setting_changed)
+        self.settings_manager.register_observer(self._settings_cb)
 
         # Store colors for easy access
         self.colors = UI_COLORS
 
         # Set up internal state variables
-        self.test_running = False
         self.test_state = tk.StringVar(value="IDLE")
+        self._last_bucket = 'idle'  # Status widgets are created with the idle style
         
         # FIXED: Always initialize core variables regardless of test mode
         # These variables are needed by various methods regardless of the current mode
         self.current_reference = tk.StringVar(value="")
         self.barcode_var = tk.StringVar()
         
+        # Latest (elapsed, total) progress and the value last drawn on the timeline
+        self._pending_progress = (0, 0)
+        self._drawn_progress = None
+        self._timeline_flush_id = None  # Pending after id while the timeline is dirty
+        self._timeline_drawn_at = 0.0  # time.monotonic() of the last timeline redraw
+        
+        # Last pushed pressure per chamber, to skip unchanged samples
+        self._last_pressures = [None, None, None]
+        self._pending_chambers = set()  # Chambers awaiting a gauge redraw
+        self._flush_gauges_id = None  # Pending after_idle id for _flush_gauges
+        
+        # Pending after_idle id for _do_rebuild_reference_section, so bursts
+        # of settings notifications rebuild the reference section only once
+        self._rebuild_reference_id = None
+        
+        # Latest value per changed setting, applied by _apply_setting_changes
+        self._pending_settings = {}
+        self._apply_settings_id = None
+        
+        # Set by cleanup; stops worker callbacks from scheduling new UI work
+        self._destroyed = False
+        
+        # Bumped whenever the tab is left, to discard display updates queued before
+        self._view_generation = 0
+        self._tab_shown = True  # False between on_tab_deselected and on_tab_selected
+        
+        # Cached heights of the main frame's direct children, keyed by widget
+        # path and refreshed from their <Configure> events
+        self._child_heights = {}
+        self._content_h = 0
+        
+        # Per-mode reference section content, hidden rather than destroyed on
+        # mode switches; entries drop out once their widgets are destroyed
+        self._mode_frames = weakref.WeakValueDictionary()
+        
+        # Cached 'test_mode' setting, refreshed only from on_setting_changed
+        self._test_mode = self.settings_manager.get_setting('test_mode', "reference")
+        
         # Track current test mode for proper UI management
-        self.current_test_mode = self.settings_manager.get_setting('test_mode', "reference")
+        self.current_test_mode = self._test_mode
         
-        # Set up variable traces
-        self.test_state.trace_add('write', self._handle_state_change)
+        # Set up variable traces (the id lets cleanup remove it again)
+        self._state_trace_id = self.test_state.trace_add('write', self._handle_state_change)
+        
+        # Rendered gauge faces keyed by (target, threshold, tolerance, enabled, failed)
+        self._static_gauge_cache: Dict[tuple, Any] = {}
+        
+        # Faces are rendered with PIL on a worker thread and handed back to
+        # the Tk thread through the event queue; keys currently being rendered
+        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='GaugeRender') if ImageTk else None
+        self._rendering_faces = set()
+        
+        # Queue of worker thread callbacks for the Tk thread, drained in
+        # _process_test_events. Set up before any gauge face can be submitted
+        # to the render pool, whose done-callbacks post through it.
+        self._test_events = queue.Queue()
+        self.parent.bind('<<TestEvent>>', self._process_test_events)
+        
+        # Widgets referenced by layout helpers before/without being built
+        self.barcode_frame = None
+        self.timeline_canvas = None
+        self.pressure_gauges = []
         
         # Setup TTK styles
         self._setup_styles()
@@ -93,11 +669,18 @@ class MainTab:
         self.create_timeline()
         self.create_control_buttons()
         
-        # Register callbacks with test manager
+        # Track section heights so layout checks don't query every child
+        for child in self.main_frame.winfo_children():
+            self._track_child_height(child)
+        
+        # Register callbacks with test manager. They are invoked from the
+        # TestManager worker threads, so they only enqueue the event and wake
+        # the Tk thread, which applies it in _process_test_events.
         self.test_manager.set_callbacks(
-            status_callback=self.update_status,
-            progress_callback=self.update_progress,
-            result_callback=self.show_test_results
+            status_callback=lambda *args: self._post_test_event(self.update_status, args),
+            progress_callback=lambda *args: self._post_test_event(self.update_progress, args, view_only=True),
+            result_callback=lambda *args: self._post_test_event(self.show_test_results, args),
+            pressure_callback=lambda *args: self._post_test_event(self._on_pressure_update, args, view_only=True)
         )
         
         # Initialize the UI with current test state
@@ -263,27 +846,43 @@ class MainTab:
         self.ref_frame.pack(fill=tk.X, pady=(0, 10))
         
         # Get the current test mode from settings
-        test_mode = self.settings_manager.get_setting('test_mode', "reference")
+        test_mode = self._get_mode()
         
         # Build content based on mode
         self._build_reference_content(test_mode)
     
     def _build_reference_content(self, test_mode, current_ref=""):
         """FIXED: Build reference section content based on test mode with proper support for manual mode."""
-        # Clear existing content
-        for widget in self.ref_frame.winfo_children():
-            widget.destroy()
+        mode_key = "reference" if test_mode == "reference" else "manual"
+        
+        # Hide the other mode's content; it stays pooled for reuse on re-entry
+        for pooled_mode, pooled_frame in list(self._mode_frames.items()):
+            if pooled_mode != mode_key:
+                pooled_frame.pack_forget()
+        
+        # Reuse this mode's content if it was already built
+        mode_frame = self._mode_frames.get(mode_key)
+        if mode_frame is not None and mode_frame.winfo_exists():
+            mode_frame.pack(fill=tk.X)
+            if mode_key == "reference":
+                self._apply_current_reference(current_ref)
+                self.barcode_entry.focus_set()
+            return
+        
+        mode_frame = ttk.Frame(self.ref_frame)
+        mode_frame.pack(fill=tk.X)
+        self._mode_frames[mode_key] = mode_frame
         
         # Title
         title_text = "Test Reference" if test_mode == "reference" else "Test Configuration"
         ttk.Label(
-            self.ref_frame,
+            mode_frame,
             text=title_text,
             style='CardTitle.TLabel'
         ).pack(anchor=tk.W, padx=15, pady=(10, 0))
         
         # Description text about the current mode
-        description_frame = ttk.Frame(self.ref_frame, padding=(15, 10))
+        description_frame = ttk.Frame(mode_frame, padding=(15, 10))
         description_frame.pack(fill=tk.X)
         
         if test_mode == "reference":
@@ -299,14 +898,14 @@ class MainTab:
         
         # Mode-specific content
         if test_mode == "reference":
-            self._create_reference_mode_content(current_ref)
+            self._create_reference_mode_content(mode_frame, current_ref)
         else:  # manual mode
-            self._create_manual_mode_content()
+            self._create_manual_mode_content(mode_frame)
 
-    def _create_reference_mode_content(self, current_ref=""):
+    def _create_reference_mode_content(self, parent, current_ref=""):
         """Create content for reference mode with barcode scanner input and current reference display."""
         # Create container for reference mode content
-        reference_frame = ttk.Frame(self.ref_frame, padding=(15, 5, 15, 10))
+        reference_frame = ttk.Frame(parent, padding=(15, 5, 15, 10))
         reference_frame.pack(fill=tk.X)
         
         # Barcode scanner input row
@@ -330,6 +929,7 @@ class MainTab:
         self.barcode_entry.pack(side=tk.LEFT, padx=(0, 10), fill=tk.X, expand=True)
         self.barcode_entry.bind('<Return>', self.handle_barcode_scan)
         self.barcode_entry.bind('<KeyRelease>', self._on_barcode_input)
+        self.barcode_entry.bind('<FocusOut>', self._on_barcode_focus_out)
         
         # Set focus on the barcode entry
         self.barcode_entry.focus_set()
@@ -353,20 +953,20 @@ class MainTab:
         )
         self.ref_value_label.pack(side=tk.LEFT)
         
-        # Set current reference if provided
+        self._apply_current_reference(current_ref)
+
+    def _apply_current_reference(self, current_ref=""):
+        """Show the given reference, or a placeholder if none is loaded."""
         if current_ref:
             self.current_reference.set(current_ref)
         elif not self.current_reference.get():
             # Show placeholder if no reference loaded
             self.current_reference.set("No reference loaded")
-        
-        # Schedule focus maintenance
-        self._maintain_barcode_focus()
 
-    def _create_manual_mode_content(self):
+    def _create_manual_mode_content(self, parent):
         """Create simplified content for manual mode (description text only)."""
         # Create container for manual mode content
-        manual_frame = ttk.Frame(self.ref_frame, padding=(15, 5, 15, 10))
+        manual_frame = ttk.Frame(parent, padding=(15, 5, 15, 10))
         manual_frame.pack(fill=tk.X)
         
         # Simple description text only
@@ -513,6 +1113,26 @@ class MainTab:
         if self.current_reference.get():
             self.ref_display_frame.pack(fill=tk.X)
 
+    def _track_child_height(self, child):
+        """Start caching the height of a direct child of the main frame."""
+        self._child_heights[str(child)] = child.winfo_reqheight()
+        self._content_h = sum(self._child_heights.values())
+        child.bind('<Configure>', self._on_child_resize, add='+')
+        child.bind('<Destroy>', self._on_child_destroy, add='+')
+    
+    def _on_child_resize(self, event):
+        """Refresh the cached height of the child that was resized."""
+        key = str(event.widget)
+        if key in self._child_heights:
+            self._content_h += event.height - self._child_heights[key]
+            self._child_heights[key] = event.height
+    
+    def _on_child_destroy(self, event):
+        """Drop a destroyed child from the cached content height."""
+        height = self._child_heights.pop(str(event.widget), None)
+        if height is not None:
+            self._content_h -= height
+    
     def _calculate_available_height(self):
         """Calculate available screen height for content."""
         try:
@@ -522,9 +1142,11 @@ class MainTab:
             # Account for title bar, status bar, etc.
             reserved_height = 150
             
-            # Calculate current content height
+            # Calculate current content height. Only pending geometry work is
+            # flushed here; a full update() would also dispatch user events and
+            # could re-enter this tab (https://wiki.tcl-lang.org/page/Update+considered+harmful)
             self.main_frame.update_idletasks()
-            current_height = sum(child.winfo_reqheight() for child in self.main_frame.winfo_children())
+            current_height = self._content_h
             
             # Return available height
             return screen_height - reserved_height - current_height
@@ -535,11 +1157,11 @@ class MainTab:
     def _ensure_reference_frame_visibility(self):
         """Ensure reference frame and all other frames remain visible."""
         try:
-            # Force geometry update
+            # Force geometry update (idle tasks only, never a full update())
             self.main_frame.update_idletasks()
             
             # Check total height
-            total_height = sum(child.winfo_reqheight() for child in self.main_frame.winfo_children())
+            total_height = self._content_h
             screen_height = self.parent.winfo_screenheight()
             available_height = screen_height - 150  # Account for window decorations
             
@@ -553,12 +1175,12 @@ class MainTab:
     def _apply_space_optimization(self):
         """Apply space optimizations when content exceeds screen height."""
         # Reduce padding on reference frame if it exists
-        if hasattr(self, 'barcode_frame'):
+        if self.barcode_frame is not None:
             # Reduce padding
             self.barcode_frame.configure(padding=(10, 2, 10, 5))
         
         # Slightly reduce gauge sizes
-        if hasattr(self, 'pressure_gauges'):
+        if self.pressure_gauges:
             for canvas in self.pressure_gauges:
                 current_size = canvas.winfo_reqwidth()
                 if current_size > 120:  # Only reduce if reasonably large
@@ -566,7 +1188,7 @@ class MainTab:
                     canvas.configure(width=new_size, height=new_size)
         
         # Reduce timeline height
-        if hasattr(self, 'timeline_canvas'):
+        if self.timeline_canvas is not None:
             current_height = self.timeline_canvas.winfo_reqheight()
             if current_height > 40:
                 new_height = max(30, int(current_height * 0.8))
@@ -597,6 +1219,7 @@ class MainTab:
         # Create enhanced gauges for each chamber
         self.chamber_frames = []
         self.pressure_gauges = []
+        self.gauge_renderers = []
         
         for i in range(3):
             # Gauge frame
@@ -613,9 +1236,9 @@ class MainTab:
             # Pressure gauge (Canvas)
             gauge_canvas = tk.Canvas(
                 chamber_frame,
-                width=UI_DIMENSIONS['GAUGE_SIZE'],
-                height=UI_DIMENSIONS['GAUGE_SIZE'],
-                bg=UI_COLORS['BACKGROUND'],
+                width=_GAUGE_SIZE,
+                height=_GAUGE_SIZE,
+                bg=_BG_COLOR,
                 highlightthickness=0
             )
             gauge_canvas.pack(pady=5)
@@ -623,6 +1246,10 @@ class MainTab:
             # Store references
             self.chamber_frames.append(chamber_frame)
             self.pressure_gauges.append(gauge_canvas)
+            self.gauge_renderers.append(GaugeRenderer(
+                gauge_canvas,
+                face_source=self._get_static_gauge_image if ImageTk is not None else None
+            ))
             
             # Initial draw - initialize the enhanced gauge
             self.initialize_enhanced_pressure_gauge(i, enabled=True)
@@ -647,11 +1274,39 @@ class MainTab:
         self.timeline_canvas = tk.Canvas(
             timeline_content,
             height=UI_DIMENSIONS['TIMELINE_HEIGHT'],
-            bg=UI_COLORS['BACKGROUND'],
+            bg=_BG_COLOR,
             highlightthickness=0
         )
         self.timeline_canvas.pack(fill=tk.X, expand=True)
         
+        # Create the timeline items once; redraws only move/reconfigure them
+        self._timeline_bg = self.timeline_canvas.create_rectangle(
+            0, 0, 0, 0,
+            fill=UI_COLORS['BACKGROUND_ALT'],
+            outline=UI_COLORS['BORDER'],
+            width=1
+        )
+        self._progress_rect = self.timeline_canvas.create_rectangle(
+            0, 0, 0, 0,
+            fill=UI_COLORS['PRIMARY'],
+            outline="",
+            state='hidden'
+        )
+        self._timeline_start_label = self.timeline_canvas.create_text(
+            0, 0,
+            text="0:00",
+            font=UI_FONTS['LABEL'],
+            fill=UI_COLORS['TEXT_PRIMARY'],
+            anchor='w'
+        )
+        self._timeline_end_label = self.timeline_canvas.create_text(
+            0, 0,
+            text="",
+            font=UI_FONTS['LABEL'],
+            fill=UI_COLORS['TEXT_PRIMARY'],
+            anchor='e'
+        )
+        
         # Initial draw
         self.draw_simplified_timeline(0, 0)
     
@@ -693,32 +1348,21 @@ class MainTab:
         if state in TEST_STATES:
             self.status_label.config(text=TEST_STATES[state])
         
-        # Update status colors based on state
-        if state == "IDLE":
-            self.status_bg_frame.configure(style='StatusBg.TFrame')
-            self.status_label.configure(style='Status.TLabel')
-        elif state in ["FILLING", "REGULATING", "STABILIZING", "TESTING"]:
-            self.status_bg_frame.configure(style='StatusRunning.TFrame')
-            self.status_label.configure(style='StatusRunning.TLabel')
-        elif state == "EMPTYING":
-            self.status_bg_frame.configure(style='StatusWarning.TFrame')
-            self.status_label.configure(style='StatusWarning.TLabel')
-        elif state == "COMPLETE":
-            self.status_bg_frame.configure(style='StatusSuccess.TFrame')
-            self.status_label.configure(style='StatusSuccess.TLabel')
-        elif state == "ERROR":
-            self.status_bg_frame.configure(style='StatusError.TFrame')
-            self.status_label.configure(style='StatusError.TLabel')
+        # Update status colors only when the style bucket actually changes
+        # (e.g. FILLING -> TESTING keeps the same running style)
+        state_style = _STATE_STYLES.get(state)
+        if state_style is not None and state_style[0] != self._last_bucket:
+            self._last_bucket, frame_style, label_style = state_style
+            self.status_bg_frame.configure(style=frame_style)
+            self.status_label.configure(style=label_style)
         
         # Update button states based on test state
-        if state in ["IDLE", "COMPLETE", "ERROR"]:
+        if state in _STARTABLE_STATES:
             self.start_button.config(state='normal')
             self.stop_button.config(state='disabled')
-            self.test_running = False
         else:
             self.start_button.config(state='disabled')
             self.stop_button.config(state='normal')
-            self.test_running = True
     
     def handle_barcode_scan(self, event=None):
         """Handle barcode scanner input."""
@@ -734,13 +1378,17 @@ class MainTab:
             # Update the StringVar; the label on the same line will update automatically.
             self.current_reference.set(f"Current: {barcode}")
             
+            # Loading moved the reference up the reference tab's list
+            self.parent.event_generate("<<ReferenceLoaded>>")
+            
             # Clear barcode field for next scan
             self.barcode_var.set("")
             
             # Show success message
             self.update_status("IDLE", f"Reference {barcode} loaded successfully")
+            update_chamber_display = self.update_chamber_display
             for chamber_index in range(len(self.test_manager.chamber_states)):
-                self.update_chamber_display(chamber_index)
+                update_chamber_display(chamber_index)
         else:
             # Show error and clear field
             self.barcode_var.set("")
@@ -750,9 +1398,6 @@ class MainTab:
                                          threshold: float = None, tolerance: float = None, 
                                          enabled: bool = True, failed: bool = False):
         """Initialize the enhanced pressure gauge with target and threshold indicators and failure highlighting."""
-        canvas = self.pressure_gauges[chamber_index]
-        canvas.delete("all")  # Clear the canvas completely for initialization
-        
         # Get chamber state from test manager for default values if needed
         chamber_state = self.test_manager.chamber_states[chamber_index]
         chamber_target = target if target is not None else chamber_state.pressure_target
@@ -760,251 +1405,66 @@ class MainTab:
         chamber_tolerance = tolerance if tolerance is not None else chamber_state.pressure_tolerance
         chamber_enabled = enabled if enabled is not None else chamber_state.enabled
         
-        # Constants for gauge dimensions
-        GAUGE_SIZE = UI_DIMENSIONS['GAUGE_SIZE']
-        CENTER_X, CENTER_Y = GAUGE_SIZE // 2, GAUGE_SIZE // 2
-        RADIUS = (GAUGE_SIZE // 2) - 15
-        INNER_RADIUS = RADIUS - 25
-        MAX_PRESSURE = PRESSURE_DEFAULTS['MAX_PRESSURE']
-        
-        # Determine background color based on failure state
-        if failed:
-            background_color = '#FFEBEE'  # Light red background for failed chambers
-            border_color = UI_COLORS['ERROR']
-            border_width = 3
-        elif not chamber_enabled:
-            background_color = '#F5F5F5'  # Gray background for disabled chambers
-            border_color = UI_COLORS['BORDER']
-            border_width = 2
-        else:
-            background_color = UI_COLORS['BACKGROUND']
-            border_color = UI_COLORS['BORDER']
-            border_width = 2
-        
-        # Draw gauge background with failure highlighting
-        canvas.create_oval(
-            CENTER_X - RADIUS,
-            CENTER_Y - RADIUS,
-            CENTER_X + RADIUS,
-            CENTER_Y + RADIUS,
-            fill=background_color,
-            outline=border_color,
-            width=border_width,
-            tags=("static", "background")
+        self.gauge_renderers[chamber_index].draw_static(
+            (chamber_target, chamber_threshold, chamber_tolerance, chamber_enabled, failed)
         )
+    
+    def _get_static_gauge_image(self, key: tuple):
+        """
+        Get the rendered gauge face for a (target, threshold, tolerance, enabled, failed) key.
         
-        # Skip the rest if chamber is disabled
-        if not chamber_enabled:
-            canvas.create_text(
-                CENTER_X,
-                CENTER_Y - 10,
-                text="Disabled",
-                font=UI_FONTS['SUBHEADER'],
-                fill=UI_COLORS['TEXT_SECONDARY'],
-                tags=("static", "disabled_text")
+        Faces are shared by all gauges. A face that is not cached yet is rendered
+        on the worker thread and None is returned; _on_static_gauge_rendered then
+        shows it on every gauge still using that key.
+        """
+        photo = self._static_gauge_cache.get(key)
+        if photo is None and key not in self._rendering_faces:
+            self._rendering_faces.add(key)
+            future = self._render_pool.submit(_render_gauge_face, *key)
+            future.add_done_callback(
+                lambda f, key=key: self._post_test_event(self._on_static_gauge_rendered, (key, f))
             )
+        return photo
+    
+    def _on_static_gauge_rendered(self, key: tuple, future):
+        """Wrap a face rendered on the worker thread and show it (Tk thread only)."""
+        self._rendering_faces.discard(key)
+        try:
+            image = future.result()
+        except Exception as e:
+            self.logger.error(f"Error rendering gauge face: {e}")
             return
         
-        # Show failure indicator for failed chambers
-        if failed:
-            canvas.create_text(
-                CENTER_X,
-                CENTER_Y - 50,
-                text="FAILED",
-                font=UI_FONTS['SUBHEADER'],
-                fill=UI_COLORS['ERROR'],
-                tags=("static", "failure_text")
-            )
-        
-        # Draw tolerance zone background (skip if failed to avoid visual confusion)
-        if not failed:
-            tolerance_start = chamber_target - chamber_tolerance
-            tolerance_end = chamber_target + chamber_tolerance
-            tolerance_start_angle = 150 - (tolerance_start * 300 / MAX_PRESSURE)
-            tolerance_end_angle = 150 - (tolerance_end * 300 / MAX_PRESSURE)
-            
-            canvas.create_arc(
-                CENTER_X - RADIUS,
-                CENTER_Y - RADIUS,
-                CENTER_X + RADIUS,
-                CENTER_Y + RADIUS,
-                start=tolerance_start_angle,
-                extent=tolerance_end_angle - tolerance_start_angle,
-                fill='#E8F5E9',  # Light green background for tolerance zone
-                outline='',
-                tags=("static", "tolerance_zone")
-            )
-        
-        # Draw main scale arc with failure coloring
-        scale_color = UI_COLORS['ERROR'] if failed else UI_COLORS['BORDER']
-        canvas.create_arc(
-            CENTER_X - RADIUS,
-            CENTER_Y - RADIUS,
-            CENTER_X + RADIUS,
-            CENTER_Y + RADIUS,
-            start=150,
-            extent=-300,
-            style=tk.ARC,
-            outline=scale_color,
-            width=14,
-            tags=("static", "scale_arc")
-        )
-        
-        # Draw scale markers and labels
-        for i in range(0, MAX_PRESSURE + 1, 100):
-            angle = 150 - (i * 300 / MAX_PRESSURE)
-            radian = math.radians(angle)
-            
-            # Draw major tick marks
-            cos_val = math.cos(radian)
-            sin_val = math.sin(radian)
-            
-            marker_color = UI_COLORS['ERROR'] if failed else UI_COLORS['TEXT_PRIMARY']
-            canvas.create_line(
-                CENTER_X + INNER_RADIUS * cos_val,
-                CENTER_Y - INNER_RADIUS * sin_val,
-                CENTER_X + RADIUS * cos_val,
-                CENTER_Y - RADIUS * sin_val,
-                fill=marker_color,
-                width=3,
-                tags=("static", "scale_marker")
-            )
-            
-            # Draw label
-            label_radius = INNER_RADIUS - 22
-            label_color = UI_COLORS['ERROR'] if failed else UI_COLORS['TEXT_PRIMARY']
-            canvas.create_text(
-                CENTER_X + label_radius * cos_val,
-                CENTER_Y - label_radius * sin_val,
-                text=str(i),
-                font=UI_FONTS['GAUGE_UNIT'],
-                fill=label_color,
-                tags=("static", "scale_label")
-            )
+        photo = ImageTk.PhotoImage(image)
+        self._static_gauge_cache[key] = photo
+        for renderer in self.gauge_renderers:
+            if renderer.params == key:
+                renderer.set_face(photo)
         
-        # Draw pointer pivot
-        pivot_color = UI_COLORS['ERROR'] if failed else UI_COLORS['PRIMARY']
-        canvas.create_oval(
-            CENTER_X - 5,
-            CENTER_Y - 5,
-            CENTER_X + 5,
-            CENTER_Y + 5,
-            fill=pivot_color,
-            outline="",
-            tags=("static", "pivot")
-        )
-        
-        # Add enhanced target marker (green triangle) - skip if failed
-        if not failed:
-            target_angle = 150 - (chamber_target * 300 / MAX_PRESSURE)
-            target_radian = math.radians(target_angle)
-            cos_val = math.cos(target_radian)
-            sin_val = math.sin(target_radian)
-            
-            # Create triangle points for the target marker
-            triangle_size = 12
-            p1_x = CENTER_X + (RADIUS + 8) * cos_val
-            p1_y = CENTER_Y - (RADIUS + 8) * sin_val
-            p2_x = CENTER_X + (RADIUS - triangle_size) * cos_val - triangle_size * sin_val
-            p2_y = CENTER_Y - (RADIUS - triangle_size) * sin_val - triangle_size * cos_val
-            p3_x = CENTER_X + (RADIUS - triangle_size) * cos_val + triangle_size * sin_val
-            p3_y = CENTER_Y - (RADIUS - triangle_size) * sin_val + triangle_size * cos_val
-            
-            canvas.create_polygon(
-                p1_x, p1_y, p2_x, p2_y, p3_x, p3_y,
-                fill=UI_COLORS['SUCCESS'],
-                outline='darkgreen',
-                width=2,
-                tags=("static", "target_marker")
-            )
-            
-            # Add enhanced threshold marker (red triangle)
-            threshold_angle = 150 - (chamber_threshold * 300 / MAX_PRESSURE)
-            threshold_radian = math.radians(threshold_angle)
-            cos_val = math.cos(threshold_radian)
-            sin_val = math.sin(threshold_radian)
-            
-            # Create triangle points for the threshold marker
-            p1_x = CENTER_X + (RADIUS + 8) * cos_val
-            p1_y = CENTER_Y - (RADIUS + 8) * sin_val
-            p2_x = CENTER_X + (RADIUS - triangle_size) * cos_val - triangle_size * sin_val
-            p2_y = CENTER_Y - (RADIUS - triangle_size) * sin_val - triangle_size * cos_val
-            p3_x = CENTER_X + (RADIUS - triangle_size) * cos_val + triangle_size * sin_val
-            p3_y = CENTER_Y - (RADIUS - triangle_size) * sin_val + triangle_size * cos_val
-            
-            canvas.create_polygon(
-                p1_x, p1_y, p2_x, p2_y, p3_x, p3_y,
-                fill=UI_COLORS['ERROR'],
-                outline='darkred',
-                width=2,
-                tags=("static", "threshold_marker")
-            )
+        self._evict_static_gauge_images()
+    
+    def _evict_static_gauge_images(self):
+        """
+        Evict the oldest faces that are not currently displayed.
         
-        # Draw unit text
-        unit_color = UI_COLORS['ERROR'] if failed else UI_COLORS['TEXT_SECONDARY']
-        canvas.create_text(
-            CENTER_X,
-            CENTER_Y + 40,
-            text="mbar",
-            font=UI_FONTS['GAUGE_UNIT'],
-            fill=unit_color,
-            tags=("static", "unit_text")
-        )
+        The cache keeps the images shown on any gauge alive, since Tk blanks
+        an image once its PhotoImage is collected.
+        """
+        if len(self._static_gauge_cache) > self._STATIC_GAUGE_CACHE_SIZE:
+            for old_key in list(self._static_gauge_cache):
+                if len(self._static_gauge_cache) <= self._STATIC_GAUGE_CACHE_SIZE:
+                    break
+                if all(renderer.params != old_key for renderer in self.gauge_renderers):
+                    del self._static_gauge_cache[old_key]
     
     def update_gauge_display(self, chamber_index: int, current_pressure: float = 0.0, failed: bool = False):
         """Update the dynamic parts of the enhanced pressure gauge display with failure highlighting."""
         try:
-            canvas = self.pressure_gauges[chamber_index]
-            
-            # Get chamber state for enabled status
-            chamber_state = self.test_manager.chamber_states[chamber_index]
-            chamber_enabled = chamber_state.enabled
-            
             # Skip update if chamber is disabled
-            if not chamber_enabled:
+            if not self.test_manager.chamber_states[chamber_index].enabled:
                 return
-                
-            # Get dimensions
-            GAUGE_SIZE = UI_DIMENSIONS['GAUGE_SIZE']
-            CENTER_X, CENTER_Y = GAUGE_SIZE // 2, GAUGE_SIZE // 2
-            RADIUS = (GAUGE_SIZE // 2) - 15
-            MAX_PRESSURE = PRESSURE_DEFAULTS['MAX_PRESSURE']
-            
-            # Constrain pressure value to valid range for display
-            display_pressure = max(0, min(current_pressure, MAX_PRESSURE))
-            
-            # Calculate pointer angle from pressure value
-            angle = 150 - (display_pressure * 300 / MAX_PRESSURE)
-            radian = math.radians(angle)
-            cos_val = math.cos(radian)
-            sin_val = math.sin(radian)
             
-            # Remove previous dynamic elements
-            canvas.delete("dynamic")
-            
-            # Draw pointer line with failure coloring
-            pointer_length = RADIUS - 20
-            pointer_color = UI_COLORS['ERROR'] if failed else UI_COLORS['PRIMARY']
-            canvas.create_line(
-                CENTER_X, CENTER_Y,
-                CENTER_X + pointer_length * cos_val,
-                CENTER_Y - pointer_length * sin_val,
-                fill=pointer_color,
-                width=4,
-                tags=("dynamic", "pointer")
-            )
-            
-            # Draw digital value display as integer with failure coloring
-            display_value = int(round(current_pressure))
-            value_color = UI_COLORS['ERROR'] if failed else UI_COLORS['PRIMARY']
-            canvas.create_text(
-                CENTER_X,
-                CENTER_Y + 20,
-                text=f"{display_value}",
-                font=UI_FONTS['VALUE'],
-                fill=value_color,
-                tags=("dynamic", "pressure_value")
-            )
+            self.gauge_renderers[chamber_index].draw_dynamic(current_pressure, failed)
             
         except Exception as e:
             self.logger.error(f"Error updating gauge display: {e}")
@@ -1012,7 +1472,6 @@ class MainTab:
     def draw_simplified_timeline(self, current_time: float, total_time: float):
         """Draw the simplified test timeline visualization without current time display."""
         canvas = self.timeline_canvas
-        canvas.delete("all")  # Clear previous drawing
         
         # Get canvas dimensions
         width = canvas.winfo_width()
@@ -1025,15 +1484,11 @@ class MainTab:
         # Timeline constants
         padding = 20
         bar_height = height // 2
+        bar_top = height // 2 - bar_height // 2
+        bar_bottom = height // 2 + bar_height // 2
         
-        # Draw timeline background
-        canvas.create_rectangle(
-            padding, height // 2 - bar_height // 2,
-            width - padding, height // 2 + bar_height // 2,
-            fill=UI_COLORS['BACKGROUND_ALT'],
-            outline=UI_COLORS['BORDER'],
-            width=1
-        )
+        # Position timeline background
+        canvas.coords(self._timeline_bg, padding, bar_top, width - padding, bar_bottom)
         
         # Calculate progress proportion
         if total_time > 0:
@@ -1041,25 +1496,16 @@ class MainTab:
         else:
             progress = 0
             
-        # Draw progress fill
+        # Resize progress fill (hidden when there is no progress)
         progress_width = (width - 2 * padding) * progress
         if progress_width > 0:
-            canvas.create_rectangle(
-                padding, height // 2 - bar_height // 2,
-                padding + progress_width, height // 2 + bar_height // 2,
-                fill=UI_COLORS['PRIMARY'],
-                outline="",
-            )
+            canvas.coords(self._progress_rect, padding, bar_top, padding + progress_width, bar_bottom)
+            canvas.itemconfigure(self._progress_rect, state='normal')
+        else:
+            canvas.itemconfigure(self._progress_rect, state='hidden')
         
-        # Draw labels - only start and end times (no current time)
-        # Start time
-        canvas.create_text(
-            padding, height // 2 + bar_height // 2 + 15,
-            text="0:00",
-            font=UI_FONTS['LABEL'],
-            fill=UI_COLORS['TEXT_PRIMARY'],
-            anchor='w'
-        )
+        # Position labels - only start and end times (no current time)
+        canvas.coords(self._timeline_start_label, padding, bar_bottom + 15)
         
         # End time (test duration)
         if total_time > 0:
@@ -1067,28 +1513,51 @@ class MainTab:
             time_text = f"{minutes}:{seconds:02d}"
         else:
             # Use configured test duration
-            test_duration = getattr(self.test_manager, 'test_duration', 300)
+            test_duration = self.test_manager.test_duration
             minutes, seconds = divmod(int(test_duration), 60)
             time_text = f"{minutes}:{seconds:02d}"
             
-        canvas.create_text(
-            width - padding, height // 2 + bar_height // 2 + 15,
-            text=time_text,
-            font=UI_FONTS['LABEL'],
-            fill=UI_COLORS['TEXT_PRIMARY'],
-            anchor='e'
-        )
+        canvas.coords(self._timeline_end_label, width - padding, bar_bottom + 15)
+        canvas.itemconfigure(self._timeline_end_label, text=time_text)
     
     def update_progress(self, current_time: float, total_time: float, progress_info: Dict = None):
-        """Update the test progress display - only for leak test phase."""
+        """
+        Record the test progress - only for leak test phase.
+        
+        Progress can arrive at sensor rate, so only the latest value is kept
+        here and the timeline redraw is coalesced by _schedule_timeline_flush.
+        """
         # Only update timeline during the actual leak test phase
         if progress_info and progress_info.get('phase') == 'testing':
             # Update timeline with leak test progress
-            test_duration = getattr(self.test_manager, 'test_duration', total_time)
-            self.draw_simplified_timeline(current_time, test_duration)
+            test_duration = self.test_manager.test_duration
+            self._pending_progress = (current_time, test_duration)
         else:
             # Clear timeline for non-testing phases
-            self.draw_simplified_timeline(0, 0)
+            self._pending_progress = (0, 0)
+        
+        self._schedule_timeline_flush()
+    
+    def _schedule_timeline_flush(self):
+        """Schedule one timeline redraw, at most _TIMELINE_MIN_INTERVAL apart."""
+        if self._timeline_flush_id is not None:
+            return  # Already dirty; the pending flush picks up the latest progress
+        if not self._tab_shown:
+            return  # Hidden; on_tab_selected schedules the catch-up redraw
+        
+        wait = self._TIMELINE_MIN_INTERVAL - (time.monotonic() - self._timeline_drawn_at)
+        if wait > 0:
+            self._timeline_flush_id = self.parent.after(int(wait * 1000) + 1, self._flush_timeline)
+        else:
+            self._timeline_flush_id = self.parent.after_idle(self._flush_timeline)
+    
+    def _flush_timeline(self):
+        """Redraw the timeline if progress changed since it was last drawn."""
+        self._timeline_flush_id = None
+        if self._pending_progress != self._drawn_progress:
+            self._drawn_progress = self._pending_progress
+            self._timeline_drawn_at = time.monotonic()
+            self.draw_simplified_timeline(*self._drawn_progress)
     
     def update_status(self, state: str, message: str = None):
         """Update the test status display with direct test manager messages."""
@@ -1099,10 +1568,70 @@ class MainTab:
         if message and hasattr(self, 'status_label'):
             self.status_label.config(text=message)
     
+    def _post_test_event(self, handler, args, view_only: bool = False):
+        """
+        Queue a callback from a worker thread for execution on the Tk main thread.
+        
+        Args:
+            handler: Method to call on the Tk thread
+            args: Positional arguments for the handler
+            view_only: True if the callback only refreshes the display; it is
+                then dropped if the tab was left (see on_tab_deselected) before
+                it could run, since on_tab_selected redraws everything anyway
+        """
+        if self._destroyed:
+            return
+        generation = self._view_generation if view_only else None
+        self._test_events.put((handler, args, generation))
+        try:
+            self.parent.event_generate('<<TestEvent>>', when='tail')
+        except tk.TclError as e:
+            # Widget destroyed or interpreter shutting down
+            self.logger.debug(f"Could not post test event: {e}")
+    
+    def _process_test_events(self, event=None):
+        """Drain queued TestManager callbacks and apply them to the UI."""
+        while True:
+            try:
+                handler, args, generation = self._test_events.get_nowait()
+            except queue.Empty:
+                break
+            if generation is not None and generation != self._view_generation:
+                continue  # Stale display update posted before the tab was left
+            try:
+                handler(*args)
+            except Exception as e:
+                self.logger.error(f"Error handling test event {handler.__name__}: {e}")
+    
+    def _on_pressure_update(self, pressures: List[float]):
+        """Mark chambers whose pressure changed since the last sample for redraw."""
+        for i, pressure in enumerate(pressures[:3]):
+            if pressure != self._last_pressures[i]:
+                self._last_pressures[i] = pressure
+                self._pending_chambers.add(i)
+        
+        # Coalesce all gauge updates of this event-loop pass into one flush;
+        # while hidden, marked chambers wait for on_tab_selected to redraw them
+        if self._pending_chambers and self._flush_gauges_id is None and self._tab_shown:
+            self._flush_gauges_id = self.parent.after_idle(self._flush_gauges)
+    
+    def _flush_gauges(self):
+        """Redraw all gauges marked by _on_pressure_update, then flush Tk once."""
+        self._flush_gauges_id = None
+        chamber_states = self.test_manager.chamber_states
+        renderers = self.gauge_renderers
+        last_pressures = self._last_pressures
+        pending = self._pending_chambers
+        for i in pending:
+            if chamber_states[i].enabled:
+                renderers[i].draw_dynamic(last_pressures[i])
+        pending.clear()
+        self.gauges_frame.update_idletasks()
+    
     def start_test(self):
         """FIXED: Start the test with proper mode-specific validation."""
         # Get current test mode
-        test_mode = self.settings_manager.get_setting('test_mode', "reference")
+        test_mode = self._get_mode()
         
         # Mode-specific validation
         if test_mode == "reference":
@@ -1119,7 +1648,6 @@ class MainTab:
         
         if success:
             # Update UI for test running state
-            self.test_running = True
             mode_text = "reference" if test_mode == "reference" else "manual"
             self.update_status("FILLING", f"Test started in {mode_text} mode - filling chambers")
         else:
@@ -1148,106 +1676,101 @@ class MainTab:
                 chamber_failed = not result.get('result', False)
                 self.update_chamber_display(i, failed=chamber_failed)
         
-        # Create a results frame if it doesn't exist
+        # Create the results widgets once; later results only reconfigure them
         if not hasattr(self, 'results_frame'):
-            self.results_frame = ttk.Frame(self.main_frame, style='Card.TFrame')
-            self.results_frame.pack(fill=tk.X, pady=(0, 10))
-        else:
-            # Clear previous results
-            for widget in self.results_frame.winfo_children():
-                widget.destroy()
+            self._create_results_widgets()
         
-        # Add overall result at the top
+        # Overall result banner
         result_bg_color = UI_COLORS['SUCCESS'] if overall_result else UI_COLORS['ERROR']
-        result_text_color = UI_COLORS['SECONDARY']
+        self._result_banner.configure(background=result_bg_color)
+        self._result_banner_label.configure(text=f"TEST {result_text}", background=result_bg_color)
+        
+        # Chamber results
+        for i, result in enumerate(chamber_results):
+            while len(self._result_widgets) <= i:
+                self._create_chamber_result_row(len(self._result_widgets))
+            row = self._result_widgets[i]
+            
+            # Hide disabled chambers without destroying their row
+            if not result.get('enabled', True):
+                row['frame'].grid_remove()
+                continue
+            
+            chamber_result = result.get('result', False)
+            row['target'].configure(text=f"{int(round(result.get('target_pressure', 0)))} mbar")
+            row['actual'].configure(text=f"{int(round(result.get('actual_pressure', 0)))} mbar")
+            row['verdict'].configure(
+                text="PASS" if chamber_result else "FAIL",
+                foreground=UI_COLORS['SUCCESS'] if chamber_result else UI_COLORS['ERROR']
+            )
+            row['frame'].grid()
+        
+        # Hide rows of chambers missing from these results
+        for row in self._result_widgets[len(chamber_results):]:
+            row['frame'].grid_remove()
+    
+    def _create_results_widgets(self):
+        """Create the results frame with its overall result banner (first result only)."""
+        self.results_frame = ttk.Frame(self.main_frame, style='Card.TFrame')
+        self.results_frame.pack(fill=tk.X, pady=(0, 10))
+        self._track_child_height(self.results_frame)
         
         result_frame = ttk.Frame(self.results_frame)
         result_frame.pack(fill=tk.X, pady=(0, 20))
         
-        # Add colored background for overall result
-        canvas = tk.Canvas(
+        # Colored background for overall result
+        self._result_banner = tk.Canvas(
             result_frame,
             height=60,
-            background=result_bg_color,
             highlightthickness=0
         )
-        canvas.pack(fill=tk.X)
-        
-        # Add result text
-        result_label = ttk.Label(
-            canvas,
-            text=f"TEST {result_text}",
-            foreground=result_text_color,
-            background=result_bg_color,
+        self._result_banner.pack(fill=tk.X)
+        
+        # Result text
+        self._result_banner_label = ttk.Label(
+            self._result_banner,
+            foreground=UI_COLORS['SECONDARY'],
             font=('Helvetica', 24, 'bold')
         )
-        result_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        self._result_banner_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
         
-        # Add chamber results
-        content_frame = ttk.Frame(self.results_frame, padding=20)
-        content_frame.pack(fill=tk.BOTH, expand=True)
+        # Chamber result rows, gridded so hidden rows keep their position
+        self._results_content = ttk.Frame(self.results_frame, padding=20)
+        self._results_content.pack(fill=tk.BOTH, expand=True)
+        self._results_content.columnconfigure(0, weight=1)
+        self._result_widgets = []
+    
+    def _create_chamber_result_row(self, chamber_index: int):
+        """Create the result labels for one chamber; values are filled in by show_test_results."""
+        # Create a frame for this chamber's results
+        chamber_frame = ttk.Frame(self._results_content)
+        chamber_frame.grid(row=chamber_index, column=0, sticky=tk.EW, pady=(0, 10))
         
-        for i, result in enumerate(chamber_results):
-            # Skip disabled chambers
-            if not result.get('enabled', True):
-                continue
-                
-            # Create a frame for this chamber's results
-            chamber_frame = ttk.Frame(content_frame)
-            chamber_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            # Chamber title
-            ttk.Label(
-                chamber_frame,
-                text=f"Chamber {i+1}",
-                font=UI_FONTS['SUBHEADER']
-            ).pack(anchor=tk.W)
-            
-            # Chamber result details
-            details_frame = ttk.Frame(chamber_frame)
-            details_frame.pack(fill=tk.X, padx=20)
-            
-            # Chamber target and actual pressure
-            ttk.Label(
-                details_frame,
-                text="Target Pressure:",
-                font=UI_FONTS['LABEL']
-            ).grid(row=0, column=0, sticky=tk.W, pady=2)
-            
-            ttk.Label(
-                details_frame,
-                text=f"{int(round(result.get('target_pressure', 0)))} mbar",
-                font=UI_FONTS['VALUE']
-            ).grid(row=0, column=1, sticky=tk.W, padx=10, pady=2)
-            
-            ttk.Label(
-                details_frame,
-                text="Actual Pressure:",
-                font=UI_FONTS['LABEL']
-            ).grid(row=1, column=0, sticky=tk.W, pady=2)
-            
-            ttk.Label(
-                details_frame,
-                text=f"{int(round(result.get('actual_pressure', 0)))} mbar",
-                font=UI_FONTS['VALUE']
-            ).grid(row=1, column=1, sticky=tk.W, padx=10, pady=2)
-            
-            # Chamber result
-            chamber_result = result.get('result', False)
-            result_color = UI_COLORS['SUCCESS'] if chamber_result else UI_COLORS['ERROR']
-            
+        # Chamber title
+        ttk.Label(
+            chamber_frame,
+            text=f"Chamber {chamber_index+1}",
+            font=UI_FONTS['SUBHEADER']
+        ).pack(anchor=tk.W)
+        
+        # Chamber result details
+        details_frame = ttk.Frame(chamber_frame)
+        details_frame.pack(fill=tk.X, padx=20)
+        
+        row = {'frame': chamber_frame}
+        for grid_row, (key, caption) in enumerate((('target', "Target Pressure:"),
+                                                   ('actual', "Actual Pressure:"),
+                                                   ('verdict', "Result:"))):
             ttk.Label(
                 details_frame,
-                text="Result:",
+                text=caption,
                 font=UI_FONTS['LABEL']
-            ).grid(row=2, column=0, sticky=tk.W, pady=2)
+            ).grid(row=grid_row, column=0, sticky=tk.W, pady=2)
             
-            ttk.Label(
-                details_frame,
-                text="PASS" if chamber_result else "FAIL",
-                foreground=result_color,
-                font=UI_FONTS['VALUE']
-            ).grid(row=2, column=1, sticky=tk.W, padx=10, pady=2)
+            row[key] = ttk.Label(details_frame, font=UI_FONTS['VALUE'])
+            row[key].grid(row=grid_row, column=1, sticky=tk.W, padx=10, pady=2)
+        
+        self._result_widgets.append(row)
     
     def _on_barcode_input(self, event=None):
         """Handle barcode input as user types or scanner inputs data."""
@@ -1263,22 +1786,23 @@ class MainTab:
             # Process the barcode
             self.handle_barcode_scan()
 
-    def _maintain_barcode_focus(self):
-        """Maintain focus on barcode scanner input field."""
-        if hasattr(self, 'barcode_entry') and self.barcode_entry.winfo_exists():
-            try:
-                # Only set focus if no other widget has focus or if focus is lost
-                current_focus = self.barcode_entry.focus_get()
-                if current_focus != self.barcode_entry:
-                    self.barcode_entry.focus_set()
-            except tk.TclError:
-                # Widget might be destroyed, stop trying to focus
-                return
-            
-            # Schedule next focus check (every 500ms)
-            self.parent.after(500, self._maintain_barcode_focus)
-    
+    def _on_barcode_focus_out(self, event=None):
+        """Take focus back to the barcode scanner input once the focus change settles."""
+        self.parent.after_idle(self._restore_barcode_focus)
     
+    def _restore_barcode_focus(self):
+        """Refocus the barcode entry while it is shown in reference mode."""
+        try:
+            # The entry stays pooled (unmapped) while manual mode or another tab is shown
+            if (self.current_test_mode == "reference" and
+                    self.barcode_entry.winfo_exists() and
+                    self.barcode_entry.winfo_viewable() and
+                    self.barcode_entry.focus_get() != self.barcode_entry):
+                self.barcode_entry.focus_set()
+        except (tk.TclError, KeyError):
+            # Widget destroyed between the focus change and this idle callback,
+            # or focus is in a widget Tkinter cannot map back (combobox popdown)
+            pass
     
     def update_all(self):
         """Update all UI elements with current data."""
@@ -1305,48 +1829,68 @@ class MainTab:
         if chamber_index < len(self.test_manager.chamber_states):
             chamber_state = self.test_manager.chamber_states[chamber_index]
             
-            # Re-initialize enhanced gauge with chamber state values and failure state
-            self.initialize_enhanced_pressure_gauge(
-                chamber_index,
-                target=chamber_state.pressure_target,
-                threshold=chamber_state.pressure_threshold,
-                tolerance=chamber_state.pressure_tolerance,
-                enabled=chamber_state.enabled,
-                failed=failed
+            # Re-initialize the static gauge only if its parameters changed;
+            # otherwise a refresh just redraws the pointer and value
+            params = (
+                chamber_state.pressure_target,
+                chamber_state.pressure_threshold,
+                chamber_state.pressure_tolerance,
+                chamber_state.enabled,
+                failed
             )
+            if params != self.gauge_renderers[chamber_index].params:
+                self.initialize_enhanced_pressure_gauge(
+                    chamber_index,
+                    target=chamber_state.pressure_target,
+                    threshold=chamber_state.pressure_threshold,
+                    tolerance=chamber_state.pressure_tolerance,
+                    enabled=chamber_state.enabled,
+                    failed=failed
+                )
             
             # Update pressure value if enabled
-            if chamber_state.enabled and hasattr(chamber_state, 'current_pressure'):
+            if chamber_state.enabled:
                 self.update_gauge_display(chamber_index, chamber_state.current_pressure, failed)
     
     def _start_ui_updates(self):
-        """Start regular UI updates for pressure gauges."""
+        """
+        Draw the initial pressure readings.
+        
+        Later readings are pushed by the TestManager pressure callback
+        (see _on_pressure_update), so no polling loop is scheduled.
+        """
         self.update_pressure_gauges()
         
     def update_pressure_gauges(self):
         """Update pressure displays with current readings."""
         try:
             # Update each chamber's pressure display
-            for i in range(3):
-                if i < len(self.test_manager.chamber_states):
-                    chamber_state = self.test_manager.chamber_states[i]
-                    if hasattr(chamber_state, 'enabled') and chamber_state.enabled:
-                        if hasattr(chamber_state, 'current_pressure'):
-                            self.update_gauge_display(i, chamber_state.current_pressure)
+            renderers = self.gauge_renderers
+            for i, chamber_state in enumerate(self.test_manager.chamber_states[:3]):
+                if chamber_state.enabled:
+                    renderers[i].draw_dynamic(chamber_state.current_pressure)
+            
+            # Redraw the timeline only if progress changed since it was last drawn
+            if self._pending_progress != self._drawn_progress:
+                self._drawn_progress = self._pending_progress
+                self.draw_simplified_timeline(*self._drawn_progress)
         except Exception as e:
             self.logger.error(f"Error updating pressure gauges: {e}")
-        
-        # Schedule next update (100ms interval is good for responsive gauges)
-        self.parent.after(100, self.update_pressure_gauges)
     
     def _rebuild_reference_section(self):
+        """Schedule a rebuild of the reference section, coalescing repeated requests."""
+        if self._rebuild_reference_id is None:
+            self._rebuild_reference_id = self.parent.after_idle(self._do_rebuild_reference_section)
+    
+    def _do_rebuild_reference_section(self):
         """FIXED: Recreate the reference section based on current test mode with focus restoration."""
+        self._rebuild_reference_id = None
         if not hasattr(self, 'ref_frame'):
             self.logger.debug("No reference frame to rebuild")
             return
             
         # Get the current mode
-        test_mode = self.settings_manager.get_setting('test_mode', "reference")
+        test_mode = self._get_mode()
         self.logger.info(f"Rebuilding reference section for mode: {test_mode}")
         
         # Store any current reference value (safely)
@@ -1362,24 +1906,20 @@ class MainTab:
         self.current_test_mode = test_mode
         
         try:
-            # Store current packed state of main_frame children
-            self.main_frame.update_idletasks()  # Ensure geometry is updated
-            
-            # Destroy existing frame
-            self.ref_frame.destroy()
-            
-            # Create new frame
-            self.ref_frame = ttk.Frame(self.main_frame, style='Card.TFrame')
-            
-            # STABLE POSITIONING: Always pack after the first child (status section)
-            if self.main_frame.winfo_children():
-                # Pack after the first child (status section)
-                self.ref_frame.pack(after=self.main_frame.winfo_children()[0], fill=tk.X, pady=(0, 10))
-            else:
-                # Fallback: pack at the beginning with proper fill and padding
-                self.ref_frame.pack(fill=tk.X, pady=(0, 10))
+            # Reuse the existing frame; only recreate it if it was destroyed
+            if not self.ref_frame.winfo_exists():
+                self.ref_frame = ttk.Frame(self.main_frame, style='Card.TFrame')
+                
+                # STABLE POSITIONING: Always pack after the first child (status section)
+                if self.main_frame.winfo_children():
+                    # Pack after the first child (status section)
+                    self.ref_frame.pack(after=self.main_frame.winfo_children()[0], fill=tk.X, pady=(0, 10))
+                else:
+                    # Fallback: pack at the beginning with proper fill and padding
+                    self.ref_frame.pack(fill=tk.X, pady=(0, 10))
+                self._track_child_height(self.ref_frame)
             
-            # Build content based on mode
+            # Build content based on mode (pooled mode content is reused)
             self._build_reference_content(test_mode, current_ref)
             
             # Ensure frame visibility and proper layout
@@ -1389,8 +1929,12 @@ class MainTab:
             if (test_mode == "reference" and 
                 hasattr(self, 'barcode_entry') and 
                 self.barcode_entry.winfo_exists()):
-                # Schedule focus after UI update
-                self.parent.after(100, lambda: self.barcode_entry.focus_set())
+                # Schedule focus after UI update (skipped if the tab is left meanwhile)
+                generation = self._view_generation
+                self.parent.after(
+                    100,
+                    lambda: generation == self._view_generation and self.barcode_entry.focus_set()
+                )
             
             self.logger.info("Reference section rebuilt successfully")
             
@@ -1400,6 +1944,7 @@ class MainTab:
             try:
                 self.ref_frame = ttk.Frame(self.main_frame, style='Card.TFrame')
                 self.ref_frame.pack(fill=tk.X, pady=(0, 10))
+                self._track_child_height(self.ref_frame)
                 
                 # Add minimal content
                 ttk.Label(
@@ -1412,10 +1957,40 @@ class MainTab:
             except Exception as recovery_error:
                 self.logger.error(f"Failed to create recovery reference section: {recovery_error}")
     
+    def _get_mode(self) -> str:
+        """Get the configured test mode without going through the settings manager."""
+        return self._test_mode
+    
     def on_setting_changed(self, setting_name: str, new_value):
-        """FIXED: Handle settings changes that affect the main tab with improved error handling."""
-        # Handle test mode changes
+        """
+        Record settings changes that affect the main tab and apply them once per burst.
+        
+        A settings save or reset notifies every key in quick succession, so the
+        UI work is deferred to _apply_setting_changes with only the latest values.
+        """
+        # Keep the cached test mode in sync (a reset may change it without a value)
         if setting_name == 'test_mode':
+            self._test_mode = new_value
+        elif setting_name == 'settings_reset':
+            self._test_mode = self.settings_manager.get_setting('test_mode', "reference")
+        
+        if (setting_name == 'test_mode' or setting_name.startswith('chamber_') or
+                setting_name == 'test_duration'):
+            self._pending_settings[setting_name] = new_value
+            if self._apply_settings_id is None:
+                self._apply_settings_id = self.parent.after(
+                    self._SETTINGS_DEBOUNCE_MS, self._apply_setting_changes
+                )
+    
+    def _apply_setting_changes(self):
+        """FIXED: Apply the settings changes recorded by on_setting_changed with improved error handling."""
+        self._apply_settings_id = None
+        changes = self._pending_settings
+        self._pending_settings = {}
+        
+        # Handle test mode changes
+        if 'test_mode' in changes:
+            new_value = changes['test_mode']
             self.logger.info(f"Test mode changing from {getattr(self, 'current_test_mode', 'unknown')} to: {new_value}")
             
             try:
@@ -1443,7 +2018,7 @@ class MainTab:
                     self.logger.error(f"Failed to restore previous mode: {restore_error}")
         
         # Handle other settings that might affect chamber configuration
-        elif setting_name.startswith('chamber_') or setting_name == 'test_duration':
+        elif changes:
             try:
                 # Update chamber displays if in manual mode
                 if getattr(self, 'current_test_mode', 'reference') == 'manual':
@@ -1455,6 +2030,11 @@ class MainTab:
             except Exception as e:
                 self.logger.error(f"Error updating chamber settings: {e}")
     
+    @property
+    def test_running(self) -> bool:
+        """Whether a test is in progress, read from the test manager (single source of truth)."""
+        return self.test_manager.is_running()
+    
     def get_test_state(self):
         """Get current test state for external access (e.g., physical controls)."""
         try:
@@ -1466,11 +2046,16 @@ class MainTab:
     def on_tab_selected(self):
         """Called when tab is selected - ensure barcode focus is restored."""
         try:
-            # Update all displays
+            self._tab_shown = True
+            
+            # Update all displays (also catches up on pressures and progress
+            # received while hidden, when no redraws were scheduled)
+            self._pending_chambers.clear()
             self.update_all()
+            self._schedule_timeline_flush()
             
             # Ensure current test mode is correctly displayed
-            current_mode = self.settings_manager.get_setting('test_mode', "reference")
+            current_mode = self._get_mode()
             if getattr(self, 'current_test_mode', None) != current_mode:
                 self.logger.info(f"Test mode sync needed: {getattr(self, 'current_test_mode', 'None')} -> {current_mode}")
                 self._rebuild_reference_section()
@@ -1487,40 +2072,81 @@ class MainTab:
     
     
     def on_tab_deselected(self):
-        """Called when tab is about to be hidden."""
-        try:
-            # Check if we can safely leave the tab (e.g. no test running)
-            if self.test_running:
-                # Return False to prevent tab change
-                return False
-            
-            # Allow tab change
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error in on_tab_deselected: {e}")
-            # Allow tab change on error to prevent getting stuck
-            return True
+        """Called when tab is about to be hidden; returns False to prevent the tab change."""
+        # Check if we can safely leave the tab (e.g. no test running)
+        if self.test_manager.is_running():
+            return False
+        
+        # Allow tab change; display updates still queued for this view are stale,
+        # including pending redraws (on_tab_selected catches up on their state)
+        self._view_generation += 1
+        self._tab_shown = False
+        self._cancel_scheduled('_flush_gauges_id', '_timeline_flush_id')
+        return True
+    
+    def _cancel_scheduled(self, *attrs: str):
+        """Cancel the after/after_idle callbacks whose ids are stored in the given attributes."""
+        after_cancel = self.parent.after_cancel
+        for attr in attrs:
+            after_id = getattr(self, attr)
+            setattr(self, attr, None)
+            if after_id is not None:
+                try:
+                    after_cancel(after_id)
+                except tk.TclError as e:
+                    self.logger.debug(f"after_cancel({after_id}) failed: {e}")
     
     def cleanup(self):
-        """Perform cleanup when tab is destroyed."""
+        """Perform cleanup when tab is destroyed (safe to call more than once)."""
+        if self._destroyed:
+            return
+        self._destroyed = True
+        
         try:
-            # Stop any scheduled UI updates
-            if hasattr(self, 'parent') and self.parent:
-                try:
-                    # Cancel the after callbacks if possible
-                    self.parent.after_cancel(self.update_pressure_gauges)
-                except:
-                    pass
-                    
+            # Cancel scheduled UI updates
+            self._cancel_scheduled('_flush_gauges_id', '_timeline_flush_id',
+                                   '_rebuild_reference_id', '_apply_settings_id')
+            
+            # Drop gauge faces that have not been rendered yet
+            if self._render_pool is not None:
+                self._render_pool.shutdown(wait=False, cancel_futures=True)
+            
             # Unregister from settings observer
-            if hasattr(self, 'settings_manager'):
+            settings_cb = self._settings_cb
+            settings_manager = self.settings_manager
+            if settings_cb is not None and settings_manager is not None:
                 try:
-                    self.settings_manager.unregister_observer(self.on_setting_changed)
-                except:
-                    pass
-                    
+                    settings_manager.unregister_observer(settings_cb)
+                except (KeyError, ValueError) as e:
+                    self.logger.debug(f"Settings observer unregister failed: {e}")
+                self._settings_cb = None
+            
+            # Remove the state trace; its Tcl command pins _handle_state_change
+            try:
+                self.test_state.trace_remove('write', self._state_trace_id)
+            except tk.TclError as e:
+                self.logger.debug(f"State trace removal failed: {e}")
+            
+            # Release the gauge PhotoImages and cached widget references, then
+            # the widget tree itself. The Tk variables are kept, since
+            # get_test_state is still queried while the rest of the app shuts down.
+            self._static_gauge_cache.clear()
+            self.gauge_renderers = []
+            self.pressure_gauges = []
+            self._mode_frames.clear()
+            self._child_heights.clear()
+            self._result_widgets = []
+            try:
+                self.main_frame.destroy()
+            except tk.TclError as e:
+                self.logger.debug(f"Main frame destroy failed: {e}")
+            
             self.logger.info("MainTab cleanup completed")
             
         except Exception as e:
-            self.logger.error(f"Error during MainTab cleanup: {e}")
\ No newline at end of file
+            self.logger.error(f"Error during MainTab cleanup: {e}")
+        finally:
+            # Drop the references that tie this tab to the long-lived managers:
+            # the TestManager callbacks close over self
+            self.test_manager.set_callbacks()
+            self.settings_manager = None
\ No newline at end of file
@@ -11,16 +11,57 @@ reference profiles for barcode-based testing.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional, Tuple, Callable, Union
 
 from multi_chamber_test.config.constants import UI_COLORS, UI_FONTS, UI_DIMENSIONS
 from multi_chamber_test.core.roles import has_access
 from multi_chamber_test.database.reference_db import ReferenceDatabase
 from multi_chamber_test.core.test_manager import TestManager
-from multi_chamber_test.ui.keypad import NumericKeypad, show_numeric_keypad, AlphanumericKeyboard, show_alphanumeric_keyboard
+from multi_chamber_test.ui.keypad import NumericKeypad, show_reusable_numeric_keypad, AlphanumericKeyboard, show_alphanumeric_keyboard
 from multi_chamber_test.ui.password_dialog import PasswordDialog
 
 
+def _setup_logger() -> logging.Logger:
+    """Configure logging for the reference tab once, at import."""
+    logger = logging.getLogger('ReferenceTab')
+    
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+logger = _setup_logger()
+
+# Treeview text for a chamber's enabled flag, indexed by the flag
+_YES_NO = ("No", "Yes")
+
+# Reference list columns as (column id, heading text, width)
+_REF_COLUMNS = (
+    ('Barcode', 'Barcode', 200),
+    *((f'Ch{ch}_{param}', f'Ch{ch} {param}', 90)
+      for ch in (1, 2, 3)
+      for param in ('Target', 'Threshold', 'Tolerance', 'Enabled')),
+    ('Duration', 'Duration', 80),
+)
+_REF_COLUMN_IDS = tuple(col[0] for col in _REF_COLUMNS)
+
+# Compact mode columns, with the chamber parameters folded into one summary
+_COMPACT_REF_COLUMNS = (
+    ('Barcode', 'Barcode', 200),
+    ('Chambers', 'Chambers (target/threshold/tolerance)', 520),
+    ('Duration', 'Duration', 80),
+)
+_COMPACT_REF_COLUMN_IDS = tuple(col[0] for col in _COMPACT_REF_COLUMNS)
+
+
 class ReferenceTab:
     """
     Reference management interface tab.
@@ -30,6 +71,25 @@ class ReferenceTab:
     Each reference contains test parameters for all chambers.
     """
     
+    # Rows inserted into the reference list at once; further rows are only
+    # inserted when the list is scrolled past _LOAD_MORE_AT of its content
+    _TREE_CHUNK_SIZE = 50
+    _LOAD_MORE_AT = 0.9
+    
+    # Typing pause (ms) after which the filter is applied
+    _FILTER_DELAY_MS = 150
+    
+    # ttk styles are shared by the whole process, so they are configured once
+    _styles_configured = False
+    
+    # Chamber parameters shown in the dialog when adding a reference
+    _DEFAULT_CHAMBER = {
+        'pressure_target': 150,
+        'pressure_threshold': 5,
+        'pressure_tolerance': 2,
+        'enabled': True
+    }
+    
     def __init__(self, parent, reference_db: ReferenceDatabase, test_manager: TestManager):
         """
         Initialize the ReferenceTab with the parent widget and required components.
@@ -39,8 +99,7 @@ class ReferenceTab:
             reference_db: ReferenceDatabase for reference management
             test_manager: TestManager for loading references into test mode
         """
-        self.logger = logging.getLogger('ReferenceTab')
-        self._setup_logger()
+        self.logger = logger
         
         self.parent = parent
         self.reference_db = reference_db
@@ -49,6 +108,43 @@ class ReferenceTab:
         # Store colors for easy access
         self.colors = UI_COLORS
         
+        # All references from the last database fetch, with lowercased
+        # barcodes for filtering and a barcode index for lookups without
+        # another query
+        self._all_refs: List[Dict[str, Any]] = []
+        self._barcodes_lc: List[str] = []
+        self._by_barcode: Dict[str, Dict[str, Any]] = {}
+        
+        # References currently listed, and how many of them are in the tree
+        self._view_refs: List[Dict[str, Any]] = []
+        self._rendered = 0
+        self._render_more_id = None
+        
+        # Pending after id of the debounced filter while the user is typing
+        self._filter_after_id = None
+        
+        # Add/edit dialog, built on first use and reused afterwards
+        self._ref_dialog = None
+        
+        # Numeric keypad of the dialog, withdrawn between edits
+        self._ref_keypad = None
+        
+        # Set when the cached references may be out of date with the database
+        self._dirty = True
+        
+        # Compact mode lists a per-row chamber summary instead of 12 chamber
+        # columns, with the full parameters in a detail pane for the selection
+        self._compact = True
+        
+        # Database calls run on a single worker thread so the UI stays
+        # responsive; finished calls are queued and handed back to the Tk
+        # thread through a virtual event (see _run_db)
+        self._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ReferenceDB')
+        self._db_results = queue.Queue()
+        self._loading = False
+        self._destroyed = False
+        self.parent.bind('<<ReferenceDbResult>>', self._process_db_results)
+        
         # Setup TTK styles
         self._setup_styles()
         
@@ -64,19 +160,11 @@ class ReferenceTab:
         # Load initial reference list
         self.load_references()
     
-    def _setup_logger(self):
-        """Configure logging for the reference tab."""
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        
-        if not self.logger.handlers:
-            self.logger.addHandler(handler)
-        
-        self.logger.setLevel(logging.INFO)
-    
     def _setup_styles(self):
         """Setup TTK styles for the interface."""
+        if ReferenceTab._styles_configured:
+            return
+        
         style = ttk.Style()
         
         # Card frame style
@@ -150,6 +238,8 @@ class ReferenceTab:
             background=[('selected', UI_COLORS['PRIMARY'])],
             foreground=[('selected', UI_COLORS['SECONDARY'])]
         )
+        
+        ReferenceTab._styles_configured = True
     
     def create_header_section(self):
         """Create the header section with title and description."""
@@ -188,63 +278,42 @@ class ReferenceTab:
         content_frame = ttk.Frame(list_frame, padding=15)
         content_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Detail pane for the selected reference, shown in compact mode
+        self.detail_frame = ttk.Frame(content_frame, style='Card.TFrame', padding=15)
+        self.detail_label = ttk.Label(
+            self.detail_frame,
+            style='CardText.TLabel',
+            justify=tk.LEFT,
+            width=28
+        )
+        self.detail_label.pack(anchor=tk.NW)
+        
         # Create treeview with scrollbars
         self.tree_frame = ttk.Frame(content_frame)
         self.tree_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Define columns
-        columns = (
-            'Barcode',
-            'Ch1_Target', 'Ch1_Threshold', 'Ch1_Tolerance', 'Ch1_Enabled',
-            'Ch2_Target', 'Ch2_Threshold', 'Ch2_Tolerance', 'Ch2_Enabled',
-            'Ch3_Target', 'Ch3_Threshold', 'Ch3_Tolerance', 'Ch3_Enabled',
-            'Duration'
-        )
-        
-        # Create treeview
+        # Create treeview; its columns are set by _configure_columns
         self.ref_tree = ttk.Treeview(
             self.tree_frame, 
-            columns=columns, 
             show='headings', 
             height=15,
             selectmode='browse'
         )
+        self._configure_columns()
         
-        # Configure column widths and headings
-        widths = {
-            'Barcode': 200,
-            'Duration': 80
-        }
-        
-        # Default width for chamber parameters
-        chamber_param_width = 90
-        
-        for col in columns:
-            # Format chamber parameter headers
-            if col.startswith('Ch'):
-                chamber_num = col[2]
-                param_type = col.split('_')[1]
-                display_text = f"Ch{chamber_num} {param_type}"
-                width = chamber_param_width
-            else:
-                display_text = col
-                width = widths.get(col, chamber_param_width)
-                
-            self.ref_tree.heading(col, text=display_text)
-            self.ref_tree.column(col, width=width, anchor='center')
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.VERTICAL, command=self.ref_tree.yview)
-        x_scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.HORIZONTAL, command=self.ref_tree.xview)
-        self.ref_tree.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+        # Add scrollbars (vertical scrolling also drives lazy row loading)
+        self.y_scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.VERTICAL, command=self.ref_tree.yview)
+        self.x_scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.HORIZONTAL, command=self.ref_tree.xview)
+        self.ref_tree.configure(yscrollcommand=self._on_yscroll, xscrollcommand=self.x_scrollbar.set)
         
         # Pack scrollbars and treeview
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.ref_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Bind double-click to load reference
         self.ref_tree.bind('<Double-1>', self.on_reference_double_click)
+        self.ref_tree.bind('<<TreeviewSelect>>', self._update_detail)
         
         # Filter frame
         filter_frame = ttk.Frame(content_frame)
@@ -256,7 +325,9 @@ class ReferenceTab:
             style='CardText.TLabel'
         ).pack(side=tk.LEFT)
         
+        # Filter as the user types, once typing pauses for _FILTER_DELAY_MS
         self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', self._schedule_filter)
         filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=30)
         filter_entry.pack(side=tk.LEFT, padx=10)
         
@@ -273,6 +344,73 @@ class ReferenceTab:
             style='Secondary.TButton',
             command=self.clear_filter
         ).pack(side=tk.LEFT, padx=5)
+        
+        self.compact_button = ttk.Button(
+            filter_frame,
+            style='Secondary.TButton',
+            command=self.toggle_compact
+        )
+        self.compact_button.pack(side=tk.RIGHT, padx=5)
+        self._update_compact_widgets()
+    
+    def _configure_columns(self):
+        """Set the treeview columns and row formatter for the current mode."""
+        if self._compact:
+            columns, column_ids = _COMPACT_REF_COLUMNS, _COMPACT_REF_COLUMN_IDS
+            self._row_format = self._format_compact_row
+        else:
+            columns, column_ids = _REF_COLUMNS, _REF_COLUMN_IDS
+            self._row_format = self._format_row
+        
+        self.ref_tree.configure(columns=column_ids)
+        for col, display_text, width in columns:
+            self.ref_tree.heading(col, text=display_text)
+            self.ref_tree.column(col, width=width, anchor='center')
+    
+    def _update_compact_widgets(self):
+        """Show or hide the detail pane and relabel the toggle for the current mode."""
+        if self._compact:
+            self.detail_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0), before=self.tree_frame)
+            self.compact_button.configure(text="All Columns")
+            self._update_detail()
+        else:
+            self.detail_frame.pack_forget()
+            self.compact_button.configure(text="Compact View")
+    
+    def toggle_compact(self):
+        """Switch between the compact and the full column layout."""
+        self._compact = not self._compact
+        selected = self.get_selected_reference()
+        
+        self._clear_tree()
+        self._configure_columns()
+        self._show_references(self._view_refs)
+        self._update_compact_widgets()
+        
+        if selected and self.ref_tree.exists(selected):
+            self.ref_tree.selection_set(selected)
+            self.ref_tree.see(selected)
+    
+    def _update_detail(self, event=None):
+        """Show the parameters of the selected reference in the detail pane."""
+        if not self._compact:
+            return
+        
+        barcode = self.get_selected_reference()
+        reference = self._by_barcode.get(barcode) if barcode else None
+        if reference is None:
+            self.detail_label.configure(text="Select a reference\nto see its parameters")
+            return
+        
+        lines = [f"Barcode: {reference['barcode']}",
+                 f"Test Duration: {reference['test_duration']} s"]
+        for i, chamber in enumerate(reference['chambers'], start=1):
+            lines.append("")
+            lines.append(f"Chamber {i}: {'Enabled' if chamber['enabled'] else 'Disabled'}")
+            lines.append(f"  Target: {chamber['pressure_target']:g} mbar")
+            lines.append(f"  Threshold: {chamber['pressure_threshold']:g} mbar")
+            lines.append(f"  Tolerance: {chamber['pressure_tolerance']:g} mbar")
+        self.detail_label.configure(text="\n".join(lines))
     
     def create_action_buttons(self):
         """Create the action buttons for reference management."""
@@ -332,10 +470,8 @@ class ReferenceTab:
     
     def on_reference_double_click(self, event):
         """Handle double-click on reference row."""
-        # Get the item ID at the click position
-        item_id = self.ref_tree.identify('item', event.x, event.y)
-        if item_id:
-            # Load the selected reference
+        # The first click of the double-click has already selected the row
+        if self.ref_tree.selection():
             self.load_reference()
     
     def show_auth_dialog(self, min_role: str, on_success: Optional[Callable] = None):
@@ -358,81 +494,97 @@ class ReferenceTab:
             on_success=auth_success
         )
     
+    def _run_db(self, func: Callable, args: tuple, on_done: Callable):
+        """
+        Run a database call on the worker thread.
+        
+        Args:
+            func: ReferenceDatabase method to call
+            args: Positional arguments for the call
+            on_done: Called on the Tk thread with the finished future
+        """
+        future = self._db_pool.submit(func, *args)
+        future.add_done_callback(lambda f: self._post_db_result(on_done, f))
+    
+    def _post_db_result(self, handler: Callable, future):
+        """Queue a finished database call from the worker thread for the Tk thread."""
+        if self._destroyed:
+            return
+        self._db_results.put((handler, future))
+        try:
+            self.parent.event_generate('<<ReferenceDbResult>>', when='tail')
+        except tk.TclError as e:
+            # Widget destroyed or interpreter shutting down
+            self.logger.debug(f"Could not post database result: {e}")
+    
+    def _process_db_results(self, event=None):
+        """Drain finished database calls and apply them to the UI."""
+        while True:
+            try:
+                handler, future = self._db_results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(future)
+            except Exception as e:
+                self.logger.error(f"Error handling database result {handler.__name__}: {e}")
+    
     def load_references(self):
         """Load and display all references from the database."""
+        if self._loading:
+            return
+        self._loading = True
+        
+        # Show a placeholder row, not selectable, while the query is in flight
+        with self._tree_detached():
+            self._clear_tree()
+            self.ref_tree.configure(selectmode='none')
+            self.ref_tree.insert('', 'end', values=("Loading...",))
+        
+        self._run_db(self.reference_db.get_all_references, (), self._on_references_loaded)
+    
+    def _on_references_loaded(self, future):
+        """Display the references fetched by load_references."""
+        self._loading = False
+        self.ref_tree.configure(selectmode='browse')
         try:
-            # Clear existing items
-            for item in self.ref_tree.get_children():
-                self.ref_tree.delete(item)
-            
-            # Get all references from the database
-            references = self.reference_db.get_all_references()
-            
-            # Add references to the treeview
-            for ref in references:
-                # Format the data for display
-                row_data = [
-                    ref['barcode'],  # Barcode
-                ]
-                
-                # Add chamber-specific data
-                for chamber in ref['chambers']:
-                    row_data.extend([
-                        chamber['pressure_target'],
-                        chamber['pressure_threshold'],
-                        chamber['pressure_tolerance'],
-                        "Yes" if chamber['enabled'] else "No"
-                    ])
-                
-                # Add test duration
-                row_data.append(ref['test_duration'])
-                
-                # Insert into treeview
-                self.ref_tree.insert('', 'end', values=row_data)
+            references = future.result()
+            self._all_refs = references
+            self._barcodes_lc = [ref['barcode'].lower() for ref in references]
+            self._by_barcode = {ref['barcode']: ref for ref in references}
+            self._dirty = False
+            self._show_references(references)
             
             self.logger.info(f"Loaded {len(references)} references")
             
         except Exception as e:
+            self._show_references(self._view_refs)
             self.logger.error(f"Error loading references: {e}")
             messagebox.showerror("Error", f"Failed to load references: {e}")
     
     def apply_filter(self):
-        """Apply filter to reference list."""
+        """
+        Apply filter to reference list.
+        
+        Filters the references of the last load_references call in memory;
+        the database is only queried again when the references change.
+        """
+        if self._filter_after_id is not None:
+            self.parent.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        
         filter_text = self.filter_var.get().strip()
         if not filter_text:
             # If no filter, show all
-            self.load_references()
+            self._show_references(self._all_refs)
             return
         
         try:
-            # Clear existing items
-            for item in self.ref_tree.get_children():
-                self.ref_tree.delete(item)
-            
-            # Get filtered references
-            references = self.reference_db.get_references_by_barcode_pattern(f"%{filter_text}%")
-            
-            # Add references to the treeview
-            for ref in references:
-                # Format the data for display
-                row_data = [
-                    ref['barcode'],  # Barcode
-                ]
-                
-                # Add chamber-specific data
-                for chamber in ref['chambers']:
-                    row_data.extend([
-                        chamber['pressure_target'],
-                        chamber['pressure_threshold'],
-                        chamber['pressure_tolerance'],
-                        "Yes" if chamber['enabled'] else "No"
-                    ])
-                
-                # Add test duration
-                row_data.append(ref['test_duration'])
-                
-                # Insert into treeview
-                self.ref_tree.insert('', 'end', values=row_data)
+            # Case-insensitive substring match, like the SQL LIKE '%text%' it replaces
+            needle = filter_text.lower()
+            references = [ref for ref, barcode in zip(self._all_refs, self._barcodes_lc)
+                          if needle in barcode]
+            self._show_references(references)
             
             self.logger.info(f"Found {len(references)} references matching '{filter_text}'")
             
@@ -440,10 +592,147 @@ class ReferenceTab:
             self.logger.error(f"Error filtering references: {e}")
             messagebox.showerror("Error", f"Failed to filter references: {e}")
     
+    def _show_references(self, references: List[Dict[str, Any]]):
+        """
+        Replace the listed references.
+        
+        Only the first _TREE_CHUNK_SIZE rows are inserted into the treeview;
+        _on_yscroll inserts the next chunk once the user scrolls near the end,
+        so the cost of showing the list does not grow with the reference count.
+        """
+        if self._render_more_id is not None:
+            self.parent.after_cancel(self._render_more_id)
+            self._render_more_id = None
+        
+        with self._tree_detached():
+            self._clear_tree()
+            
+            self._view_refs = references
+            self._rendered = 0
+            self._render_rows(self._TREE_CHUNK_SIZE)
+        
+        self._update_detail()
+    
+    def _clear_tree(self):
+        """Remove all rows from the treeview with a single delete call."""
+        children = self.ref_tree.get_children()
+        if children:
+            self.ref_tree.delete(*children)
+    
+    @contextmanager
+    def _tree_detached(self):
+        """
+        Unmap the treeview and mute its scroll commands during a bulk update.
+        
+        The tree is laid out and the scrollbars recomputed once on re-attach
+        instead of after every inserted or deleted row.
+        """
+        pack_info = self.ref_tree.pack_info()
+        self.ref_tree.pack_forget()
+        self.ref_tree.configure(yscrollcommand='', xscrollcommand='')
+        try:
+            yield
+        finally:
+            self.ref_tree.configure(yscrollcommand=self._on_yscroll, xscrollcommand=self.x_scrollbar.set)
+            self.ref_tree.pack(**pack_info)
+    
+    def _render_rows(self, count: int):
+        """Insert listed references into the treeview until count rows are shown."""
+        end = min(count, len(self._view_refs))
+        insert = self.ref_tree.insert
+        format_row = self._row_format
+        for ref in self._view_refs[self._rendered:end]:
+            insert('', 'end', iid=ref['barcode'], values=format_row(ref))
+        self._rendered = end
+    
+    def _add_listed_reference(self, reference: Dict[str, Any]):
+        """
+        Put a saved reference at the top of the list without reloading.
+        
+        Saving marks a reference as most recently used, so the top is where
+        the database ordering of load_references would put it.
+        """
+        barcode = reference['barcode']
+        self._remove_listed_reference(barcode)
+        
+        barcode_lc = barcode.lower()
+        self._all_refs.insert(0, reference)
+        self._barcodes_lc.insert(0, barcode_lc)
+        self._by_barcode[barcode] = reference
+        
+        # A filtered view only shows the reference if it matches the filter
+        if self._view_refs is not self._all_refs:
+            if self.filter_var.get().strip().lower() not in barcode_lc:
+                return
+            self._view_refs.insert(0, reference)
+        
+        self.ref_tree.insert('', 0, iid=barcode, values=self._row_format(reference))
+        self._rendered += 1
+    
+    def _remove_listed_reference(self, barcode: str):
+        """Drop a reference from the list without reloading."""
+        reference = self._by_barcode.pop(barcode, None)
+        if reference is None:
+            return
+        
+        i = self._all_refs.index(reference)
+        del self._all_refs[i]
+        del self._barcodes_lc[i]
+        
+        if self._view_refs is not self._all_refs and reference in self._view_refs:
+            self._view_refs.remove(reference)
+        
+        if self.ref_tree.exists(barcode):
+            self.ref_tree.delete(barcode)
+            self._rendered -= 1
+            self._update_detail()
+    
+    def _render_more(self):
+        """Insert the next chunk of listed references."""
+        self._render_more_id = None
+        self._render_rows(self._rendered + self._TREE_CHUNK_SIZE)
+    
+    def _on_yscroll(self, first: str, last: str):
+        """Update the scrollbar and schedule more rows when the end comes into view."""
+        self.y_scrollbar.set(first, last)
+        if (float(last) >= self._LOAD_MORE_AT and self._rendered < len(self._view_refs)
+                and self._render_more_id is None):
+            self._render_more_id = self.parent.after_idle(self._render_more)
+    
+    @staticmethod
+    def _format_row(ref: Dict[str, Any]) -> tuple:
+        """Format a reference as treeview row values."""
+        return (
+            ref['barcode'],
+            *[value
+              for chamber in ref['chambers']
+              for value in (chamber['pressure_target'],
+                            chamber['pressure_threshold'],
+                            chamber['pressure_tolerance'],
+                            _YES_NO[bool(chamber['enabled'])])],
+            ref['test_duration'],
+        )
+    
+    @staticmethod
+    def _format_compact_row(ref: Dict[str, Any]) -> tuple:
+        """Format a reference as compact treeview row values."""
+        summary = "   ".join(
+            f"Ch{i} {chamber['pressure_target']:g}/{chamber['pressure_threshold']:g}/"
+            f"{chamber['pressure_tolerance']:g}" if chamber['enabled'] else f"Ch{i} off"
+            for i, chamber in enumerate(ref['chambers'], start=1)
+        )
+        return (ref['barcode'], summary, ref['test_duration'])
+    
     def clear_filter(self):
         """Clear filter and show all references."""
         self.filter_var.set("")
-        self.load_references()
+        self.apply_filter()
+    
+    def _schedule_filter(self, *args):
+        """Restart the filter delay on every change of the filter text."""
+        if self._filter_after_id is not None:
+            self.parent.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.parent.after(self._FILTER_DELAY_MS, self.apply_filter)
     
     def get_selected_reference(self) -> Optional[str]:
         """
@@ -456,9 +745,9 @@ class ReferenceTab:
         if not selected:
             return None
             
-        # Get the barcode (first column)
-        values = self.ref_tree.item(selected[0], 'values')
-        return values[0] if values else None
+        # Rows are keyed by barcode; the item id keeps it as text, whereas
+        # the row values would turn numeric barcodes into numbers
+        return selected[0]
     
     def add_reference(self):
         """Show dialog to add a new reference."""
@@ -483,12 +772,21 @@ class ReferenceTab:
             messagebox.showwarning("Warning", "Please select a reference to edit")
             return
         
-        # Load reference and show dialog
-        reference = self.reference_db.load_reference(barcode)
+        # Show the dialog from the cached reference; query the database only
+        # if the cache does not have it
+        reference = self._by_barcode.get(barcode)
         if reference:
             self.show_reference_dialog(reference)
-        else:
-            messagebox.showerror("Error", f"Failed to load reference {barcode}")
+            return
+        
+        def on_loaded(future):
+            reference = future.result()
+            if reference:
+                self.show_reference_dialog(reference)
+            else:
+                messagebox.showerror("Error", f"Failed to load reference {barcode}")
+        
+        self._run_db(self.reference_db.load_reference, (barcode,), on_loaded)
     
     def delete_reference(self):
         """Delete the selected reference."""
@@ -508,14 +806,17 @@ class ReferenceTab:
             return
         
         # Delete reference
-        try:
-            if self.reference_db.delete_reference(barcode):
-                messagebox.showinfo("Success", f"Reference '{barcode}' deleted successfully")
-                self.load_references()  # Refresh list
-            else:
-                messagebox.showerror("Error", f"Failed to delete reference '{barcode}'")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error deleting reference: {e}")
+        def on_deleted(future):
+            try:
+                if future.result():
+                    messagebox.showinfo("Success", f"Reference '{barcode}' deleted successfully")
+                    self._remove_listed_reference(barcode)
+                else:
+                    messagebox.showerror("Error", f"Failed to delete reference '{barcode}'")
+            except Exception as e:
+                messagebox.showerror("Error", f"Error deleting reference: {e}")
+        
+        self._run_db(self.reference_db.delete_reference, (barcode,), on_deleted)
     
     def load_reference(self):
         """Load the selected reference for testing."""
@@ -528,6 +829,8 @@ class ReferenceTab:
         # Load reference into test manager
         try:
             if self.test_manager.set_test_mode("reference", barcode):
+                # Loading updated last_used, which orders the list
+                self.invalidate()
                 messagebox.showinfo("Success", f"Reference '{barcode}' loaded successfully")
                 # Switch to main tab
                 self.parent.event_generate("<<SwitchToMainTab>>")
@@ -540,17 +843,64 @@ class ReferenceTab:
         """
         Show dialog to add or edit a reference.
         
+        The dialog is built on first use and afterwards only withdrawn and
+        re-populated, so repeated Add/Edit opens skip widget creation.
+        
         Args:
             reference: Reference data for editing, or None for new reference
         """
+        if self._ref_dialog is None:
+            self._build_reference_dialog()
+        
+        dialog = self._ref_dialog
+        dialog.title("Add Reference" if reference is None else "Edit Reference")
+        
+        # Reset the dialog contents from the reference or the defaults
+        self._ref_barcode_var.set(reference['barcode'] if reference else "")
+        self._ref_barcode_entry.configure(state='readonly' if reference else 'normal')
+        
+        test_duration = reference['test_duration'] if reference else 90
+        self._ref_duration_var.set(test_duration)
+        self._ref_duration_label.config(text=f"{test_duration} s")
+        
+        for i, chamber_var in enumerate(self._ref_chamber_vars):
+            chamber_data = reference['chambers'][i] if reference else self._DEFAULT_CHAMBER
+            for key, var in chamber_var.items():
+                var.set(chamber_data[key])
+        
+        for var, label, unit in self._ref_value_labels:
+            label.config(text=f"{var.get()} {unit}")
+        
+        self._ref_canvas.yview_moveto(0)
+        dialog.deiconify()
+        dialog.grab_set()
+    
+    def _hide_reference_dialog(self):
+        """Release and withdraw the reference dialog for reuse."""
+        self._ref_dialog.grab_release()
+        self._ref_dialog.withdraw()
+    
+    def _on_dialog_mousewheel(self, event):
+        """Scroll the reference dialog content."""
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = int(-1*(event.delta/120))
+        self._ref_canvas.yview_scroll(delta, "units")
+    
+    def _build_reference_dialog(self):
+        """Create the add/edit reference dialog, initially withdrawn."""
         # Create dialog
         dialog = tk.Toplevel(self.parent)
-        dialog.title("Add Reference" if reference is None else "Edit Reference")
+        dialog.withdraw()
         dialog.configure(bg=UI_COLORS['BACKGROUND'])
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_reference_dialog)
+        self._ref_dialog = dialog
         
         # Make dialog modal
         dialog.transient(self.parent)
-        dialog.grab_set()
         
         # Set size based on screen dimensions
         screen_width = dialog.winfo_screenwidth()
@@ -563,6 +913,7 @@ class ReferenceTab:
         canvas = tk.Canvas(dialog, bg=UI_COLORS['BACKGROUND'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(dialog, orient=tk.VERTICAL, command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas, style='TFrame')
+        self._ref_canvas = canvas
         
         scrollable_frame.bind(
             "<Configure>",
@@ -575,32 +926,35 @@ class ReferenceTab:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind mousewheel for scrolling
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-        dialog.bind("<Destroy>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        # Bind mousewheel for scrolling on the dialog itself; every widget in
+        # the dialog carries it in its bindtags, so no global binding is needed
+        dialog.bind("<MouseWheel>", self._on_dialog_mousewheel)  # Windows and Mac
+        dialog.bind("<Button-4>", self._on_dialog_mousewheel)    # Linux scroll up
+        dialog.bind("<Button-5>", self._on_dialog_mousewheel)    # Linux scroll down
         
-        # Reference data
-        barcode_var = tk.StringVar(value=reference['barcode'] if reference else "")
-        test_duration_var = tk.IntVar(value=reference['test_duration'] if reference else 90)
+        # Reference data, set from the edited reference on every open
+        barcode_var = tk.StringVar()
+        test_duration_var = tk.IntVar()
         
         # Chamber data
         chamber_vars = []
         for i in range(3):
-            chamber_data = reference['chambers'][i] if reference else {
-                'pressure_target': 150,
-                'pressure_threshold': 5,
-                'pressure_tolerance': 2,
-                'enabled': True
-            }
-            
             chamber_var = {
-                'enabled': tk.BooleanVar(value=chamber_data['enabled']),
-                'pressure_target': tk.IntVar(value=chamber_data['pressure_target']),
-                'pressure_threshold': tk.IntVar(value=chamber_data['pressure_threshold']),
-                'pressure_tolerance': tk.IntVar(value=chamber_data['pressure_tolerance'])
+                'enabled': tk.BooleanVar(),
+                'pressure_target': tk.IntVar(),
+                'pressure_threshold': tk.IntVar(),
+                'pressure_tolerance': tk.IntVar()
             }
             chamber_vars.append(chamber_var)
         
+        # Value labels refreshed from their variables on every open
+        value_labels = []
+        
+        self._ref_barcode_var = barcode_var
+        self._ref_duration_var = test_duration_var
+        self._ref_chamber_vars = chamber_vars
+        self._ref_value_labels = value_labels
+        
         # Header
         header_frame = ttk.Frame(scrollable_frame, padding=(20, 20, 20, 10))
         header_frame.pack(fill=tk.X)
@@ -628,10 +982,7 @@ class ReferenceTab:
             font=UI_FONTS['VALUE']
         )
         barcode_entry.pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Read-only if editing
-        if reference:
-            barcode_entry.configure(state='readonly')
+        self._ref_barcode_entry = barcode_entry
         
         # Test duration section
         duration_frame = ttk.Frame(scrollable_frame, padding=(20, 10))
@@ -645,17 +996,18 @@ class ReferenceTab:
         
         duration_label = ttk.Label(
             duration_frame,
-            text=f"{test_duration_var.get()} s",
             style='Value.TLabel'
         )
         duration_label.pack(side=tk.LEFT, padx=(10, 0))
+        self._ref_duration_label = duration_label
         
         def edit_duration():
             def update_duration(value):
                 duration_label.config(text=f"{value} s")
                 test_duration_var.set(value)
             
-            show_numeric_keypad(
+            self._ref_keypad = show_reusable_numeric_keypad(
+                self._ref_keypad,
                 dialog,
                 test_duration_var,
                 "Test Duration",
@@ -672,30 +1024,24 @@ class ReferenceTab:
             command=edit_duration
         ).pack(side=tk.LEFT, padx=(10, 0))
         
-        # Chamber settings sections
+        # Chamber settings sections, one gridded frame per chamber
         for i, chamber_var in enumerate(chamber_vars):
-            chamber_frame = ttk.Frame(scrollable_frame, style='Card.TFrame')
+            chamber_frame = ttk.Frame(scrollable_frame, style='Card.TFrame', padding=10)
             chamber_frame.pack(fill=tk.X, padx=20, pady=10)
+            chamber_frame.columnconfigure(1, weight=1)
             
             # Chamber header with enable checkbox
-            header_frame = ttk.Frame(chamber_frame, padding=(10, 10, 10, 0))
-            header_frame.pack(fill=tk.X)
-            
             ttk.Label(
-                header_frame,
+                chamber_frame,
                 text=f"Chamber {i+1} Settings",
                 style='CardTitle.TLabel'
-            ).pack(side=tk.LEFT)
+            ).grid(row=0, column=0, columnspan=2, sticky='w')
             
             ttk.Checkbutton(
-                header_frame,
+                chamber_frame,
                 text="Enable",
                 variable=chamber_var['enabled']
-            ).pack(side=tk.RIGHT)
-            
-            # Chamber parameters
-            params_frame = ttk.Frame(chamber_frame, padding=(10, 0, 10, 10))
-            params_frame.pack(fill=tk.X)
+            ).grid(row=0, column=2, sticky='e')
             
             # Parameter rows
             param_data = [
@@ -704,22 +1050,19 @@ class ReferenceTab:
                 ("Pressure Tolerance", chamber_var['pressure_tolerance'], "mbar")
             ]
             
-            for name, var, unit in param_data:
-                param_frame = ttk.Frame(params_frame)
-                param_frame.pack(fill=tk.X, pady=5)
-                
+            for row, (name, var, unit) in enumerate(param_data, start=1):
                 ttk.Label(
-                    param_frame,
+                    chamber_frame,
                     text=f"{name}:",
                     style='CardText.TLabel'
-                ).pack(side=tk.LEFT)
+                ).grid(row=row, column=0, sticky='w', pady=5)
                 
                 value_label = ttk.Label(
-                    param_frame,
-                    text=f"{var.get()} {unit}",
+                    chamber_frame,
                     style='Value.TLabel'
                 )
-                value_label.pack(side=tk.LEFT, padx=(10, 0))
+                value_label.grid(row=row, column=1, sticky='w', padx=(10, 0), pady=5)
+                value_labels.append((var, value_label, unit))
                 
                 def make_edit_func(v, l, u, n):
                     return lambda: edit_param(v, l, u, n)
@@ -727,11 +1070,11 @@ class ReferenceTab:
                 edit_func = make_edit_func(var, value_label, unit, name)
                 
                 ttk.Button(
-                    param_frame,
+                    chamber_frame,
                     text="Edit",
                     style='Secondary.TButton',
                     command=edit_func
-                ).pack(side=tk.RIGHT)
+                ).grid(row=row, column=2, sticky='e', pady=5)
         
         def edit_param(var, label, unit, name):
             """Edit a parameter value."""
@@ -743,7 +1086,8 @@ class ReferenceTab:
             is_target = "Target" in name
             max_val = 600 if is_target else None
             
-            show_numeric_keypad(
+            self._ref_keypad = show_reusable_numeric_keypad(
+                self._ref_keypad,
                 dialog,
                 var,
                 name,
@@ -766,47 +1110,83 @@ class ReferenceTab:
                 messagebox.showerror("Error", "Please enter a barcode")
                 return
             
-            # Prepare chamber data
-            chamber_data = []
-            for var in chamber_vars:
-                chamber_data.append({
-                    'enabled': var['enabled'].get(),
-                    'pressure_target': var['pressure_target'].get(),
-                    'pressure_threshold': var['pressure_threshold'].get(),
-                    'pressure_tolerance': var['pressure_tolerance'].get()
-                })
+            # Prepare chamber data, reading each variable once
+            chamber_data = [{key: var.get() for key, var in chamber_var.items()}
+                            for chamber_var in chamber_vars]
+            test_duration = test_duration_var.get()
             
-            # Save reference
-            try:
-                if self.reference_db.save_reference(barcode, chamber_data, test_duration_var.get()):
-                    messagebox.showinfo("Success", f"Reference '{barcode}' saved successfully")
-                    dialog.destroy()
-                    self.load_references()  # Refresh list
-                else:
-                    messagebox.showerror("Error", f"Failed to save reference '{barcode}'")
-            except Exception as e:
-                messagebox.showerror("Error", f"Error saving reference: {e}")
+            # Save reference; the button stays disabled until the save is done
+            def on_saved(future):
+                save_button.state(['!disabled'])
+                try:
+                    if future.result():
+                        messagebox.showinfo("Success", f"Reference '{barcode}' saved successfully")
+                        self._hide_reference_dialog()
+                        
+                        # Update the list in place; pressures are stored in REAL
+                        # columns, so list them as floats like a reload would
+                        self._add_listed_reference({
+                            'barcode': barcode,
+                            'test_duration': test_duration,
+                            'chambers': [
+                                {key: float(value) if key.startswith('pressure_') else value
+                                 for key, value in chamber.items()}
+                                for chamber in chamber_data
+                            ]
+                        })
+                    else:
+                        messagebox.showerror("Error", f"Failed to save reference '{barcode}'")
+                except Exception as e:
+                    messagebox.showerror("Error", f"Error saving reference: {e}")
+            
+            save_button.state(['disabled'])
+            self._run_db(self.reference_db.save_reference,
+                         (barcode, chamber_data, test_duration), on_saved)
         
-        ttk.Button(
+        save_button = ttk.Button(
             button_frame,
             text="Save Reference",
             style='Action.TButton',
             command=save_reference
-        ).pack(side=tk.RIGHT, padx=(10, 0))
+        )
+        save_button.pack(side=tk.RIGHT, padx=(10, 0))
         
         ttk.Button(
             button_frame,
             text="Cancel",
             style='Secondary.TButton',
-            command=dialog.destroy
+            command=self._hide_reference_dialog
         ).pack(side=tk.RIGHT)
     
+    def invalidate(self):
+        """Have the next tab selection reload references from the database."""
+        self._dirty = True
+    
     def on_tab_selected(self):
         """Called when this tab is selected."""
-        # Reload references
-        self.load_references()
+        # Reload references only if they may have changed; saves and deletes
+        # made in this tab update the list in place
+        if self._dirty:
+            self.load_references()
     
     def on_tab_deselected(self):
         """Called when user switches away from this tab."""
         # No special action needed
-        pass
\ No newline at end of file
+        pass
+    
+    def cleanup(self):
+        """Stop the database worker and cancel pending UI callbacks."""
+        if self._destroyed:
+            return
+        self._destroyed = True
+        
+        for attr in ('_filter_after_id', '_render_more_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                try:
+                    self.parent.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+                setattr(self, attr, None)
+        
+        self._db_pool.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -7,19 +7,69 @@ This module provides the top-level SettingsTab class that serves as
 a router to the modular settings sections in the new UI layout.
 """
 
-import tkinter as tk
-from tkinter import ttk
+import atexit
 import logging
-import importlib
-from typing import Dict, Any, List, Optional, Callable
+import functools
+import queue
+import tkinter as tk
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing them at runtime would pull in
+    # the test manager subsystem with this module
+    from multi_chamber_test.config.settings import SettingsManager
+    from multi_chamber_test.core.test_manager import TestManager
+
+
+def _setup_logger() -> logging.Logger:
+    """
+    Configure logging for the settings tab once, at import.
+    
+    Records are handed to a QueueListener thread that owns the stream
+    handler, so logging from Tk event handlers never blocks the UI thread
+    on a stderr write.
+    """
+    logger = logging.getLogger('SettingsTab')
+    
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
+    
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+logger = _setup_logger()
 
-from multi_chamber_test.config.constants import UI_COLORS, UI_FONTS
-from multi_chamber_test.config.settings import SettingsManager
-from multi_chamber_test.core.test_manager import TestManager
-from multi_chamber_test.core.roles import get_role_manager, has_access
 
-# Import the new settings tab implementation
-from multi_chamber_test.ui.settings.settings_tab import SettingsTab as ModularSettingsTab
+@functools.lru_cache(maxsize=None)
+def _modular_settings_tab_cls():
+    """
+    Import the new settings tab implementation on first use.
+    
+    ModularSettingsTab pulls in every settings section module, so it is only
+    imported once a SettingsTab is actually created, not at application
+    startup; later calls return the cached class.
+    """
+    from multi_chamber_test.ui.settings.settings_tab import SettingsTab as ModularSettingsTab
+    return ModularSettingsTab
+
+
+def __getattr__(name):
+    """Keep ModularSettingsTab available as a lazy module attribute (PEP 562)."""
+    if name == 'ModularSettingsTab':
+        ModularSettingsTab = _modular_settings_tab_cls()
+        globals()['ModularSettingsTab'] = ModularSettingsTab
+        return ModularSettingsTab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SettingsTab:
@@ -30,7 +80,13 @@ class SettingsTab:
     compatibility with the original interface while using the new modular design.
     """
     
-    def __init__(self, parent, test_manager: TestManager, settings_manager: SettingsManager):
+    # Fixed attribute set; on_tab_deselected is bound per instance in __init__
+    __slots__ = (
+        'logger', 'parent', 'test_manager', 'settings_manager', 'settings_tab',
+        'on_tab_deselected', '_tab_select_id'
+    )
+    
+    def __init__(self, parent, test_manager: "TestManager", settings_manager: "SettingsManager"):
         """
         Initialize the SettingsTab with the parent widget and required components.
         
@@ -39,44 +95,54 @@ class SettingsTab:
             test_manager: TestManager for applying settings
             settings_manager: SettingsManager for storing/retrieving settings
         """
-        self.logger = logging.getLogger('SettingsTab')
-        self._setup_logger()
+        self.logger = logger
         
         self.parent = parent
         self.test_manager = test_manager
         self.settings_manager = settings_manager
         
-        # Create the modular settings tab implementation
-        self.main_frame = ttk.Frame(parent)
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Initialize the modular settings interface
-        self.settings_tab = ModularSettingsTab(
-            self.main_frame,
+        # Initialize the modular settings interface; it packs its own main
+        # frame into the parent, so no wrapper frame is needed here
+        modular_settings_tab = _modular_settings_tab_cls()
+        self.settings_tab = modular_settings_tab(
+            parent,
             test_manager,
             settings_manager
         )
-    
-    def _setup_logger(self):
-        """Configure logging for the settings tab."""
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
         
-        if not self.logger.handlers:
-            self.logger.addHandler(handler)
+        # Pending after_idle id of the coalesced tab selection refresh
+        self._tab_select_id = None
         
-        self.logger.setLevel(logging.INFO)
+        # The deselect hook is the modular implementation's own bound method,
+        # so main_window calls it without going through a wrapper method
+        self.on_tab_deselected = self.settings_tab.on_tab_deselected
     
     def on_tab_selected(self):
-        """Called when this tab is selected."""
-        # Delegate to modular implementation
+        """
+        Called when this tab is selected.
+        
+        Selections arriving before the event loop goes idle, e.g. when
+        quickly switching back and forth between tabs, are coalesced into a
+        single refresh of the modular implementation.
+        """
+        if self._tab_select_id is None:
+            self._tab_select_id = self.parent.after_idle(self._do_tab_selected)
+    
+    def _do_tab_selected(self):
+        """Run the coalesced tab selection refresh."""
+        self._tab_select_id = None
         self.settings_tab.on_tab_selected()
     
-    def on_tab_deselected(self):
-        """Called when user switches away from this tab."""
-        # Delegate to modular implementation
-        return self.settings_tab.on_tab_deselected()
+    def cleanup(self):
+        """Cancel the pending selection refresh and clean up the modular implementation."""
+        if self._tab_select_id is not None:
+            try:
+                self.parent.after_cancel(self._tab_select_id)
+            except tk.TclError:
+                pass
+            self._tab_select_id = None
+        
+        self.settings_tab.cleanup()
     
     def _go_back_to_main(self):
         """Navigate back to the main tab."""
@@ -13,10 +13,95 @@ import subprocess
 import logging
 import time
 import csv
+import ctypes
+import ctypes.util
+import errno
+import functools
+import io
 import json
+import re
+import select
+import tempfile
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable
+
+try:
+    # Faster JSON parsing for lsblk output when available
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Column headers of the CSV export sections
+_SUMMARY_HEADER = (
+    'Test ID', 'Timestamp', 'Operator ID', 'Operator Name', 'Test Mode', 'Reference',
+    'Duration (s)', 'Overall Result', 'Chamber 1 Result',
+    'Chamber 2 Result', 'Chamber 3 Result'
+)
+_DETAIL_HEADER = (
+    'Test ID', 'Chamber', 'Enabled', 'Target (mbar)',
+    'Threshold (mbar)', 'Tolerance (mbar)', 'Start Pressure (mbar)',
+    'Final Pressure (mbar)', 'Result'
+)
+
+# Row templates for the CSV export (same line endings as csv.writer)
+_SUMMARY_ROW = "{},{},{},{},{},{},{},{},{},{},{}\r\n"
+_DETAIL_ROW = "{},Chamber {},{},{},{},{},{},{},{}\r\n"
+
+# Cell values indexed by a bool
+_PASS_FAIL = ('FAIL', 'PASS')
+_YES_NO = ('No', 'Yes')
+_CHAMBER_RESULT = ("FAIL ({:.1f} mbar)".format, "PASS ({:.1f} mbar)".format)
+
+
+def _q(value: Any) -> str:
+    """
+    Format a free-text value as a CSV field.
+    
+    Args:
+        value: Field value (None is written as an empty field)
+        
+    Returns:
+        The field, quoted only when it contains a delimiter, quote or newline
+    """
+    if value is None:
+        return ''
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+@functools.lru_cache(maxsize=None)
+def _command_path(name: str) -> str:
+    """
+    Resolve an external command to an absolute path once per process.
+    
+    Args:
+        name: Command name (e.g. 'lsblk')
+        
+    Returns:
+        Absolute path of the command, or the bare name if it is not on PATH
+    """
+    return shutil.which(name) or name
+
+
+def _unescape_mount_field(field: str) -> str:
+    """
+    Decode the octal escapes (e.g. '\\040' for a space) used in mountinfo fields.
+    
+    Args:
+        field: Raw mountinfo field
+        
+    Returns:
+        The decoded path
+    """
+    if '\\' not in field:
+        return field
+    return re.sub(r'\\([0-7]{3})', lambda match: chr(int(match.group(1), 8)), field)
 
 
 class FileExporter:
@@ -24,6 +109,32 @@ class FileExporter:
     Utility class to export test result data to CSV on a USB stick or local path.
     """
 
+    # Export sections stay in memory up to this size before spilling to disk
+    _SPOOL_MAX_SIZE = 1024 * 1024
+    # Number of formatted CSV rows joined into a single buffer write
+    _WRITE_BATCH_ROWS = 1024
+    # Records between progress callbacks
+    _PROGRESS_INTERVAL = 1000
+    # Write buffer for the export file, sized for slow FAT32 USB sticks
+    _FILE_BUFFER_SIZE = 1024 * 1024
+    
+    # Kernel and udev views of the block devices
+    _SYS_BLOCK_DIR = '/sys/block'
+    _SYS_CLASS_BLOCK_DIR = '/sys/class/block'
+    _DISK_BY_ID_DIR = '/dev/disk/by-id'
+    _UDEV_DATA_DIR = '/run/udev/data'
+    _MOUNTINFO_PATH = '/proc/self/mountinfo'
+    _MOUNT_TABLE_CACHE_DURATION = 1.0
+    
+    # Auto-mount directories already created by an earlier instance
+    _ready_mount_dirs = set()
+    
+    # libc handle and whether mount(2) is permitted (None until first tried)
+    _libc = None
+    _mount_syscall_allowed: Optional[bool] = None
+    
+    # fallocate(2) mode flag from <linux/falloc.h>
+    _FALLOC_FL_KEEP_SIZE = 0x01
     
     def __init__(self):
         """Initialize the USB file exporter."""
@@ -41,6 +152,22 @@ class FileExporter:
         self._cached_usb_status = None
         self._cached_usb_path = None
         
+        # Cache for the USB block device scan (lsblk is slow to fork)
+        self._cached_scan: Tuple[List[str], List[Dict[str, str]], bool] = ([], [], False)
+        self._cached_scan_ts = 0.0
+        
+        # Cache for the mount table read from /proc/self/mountinfo
+        self._cached_mounts: Dict[str, str] = {}
+        self._cached_mounts_ts = 0.0
+        
+        # Change detection for is_usb_connected (see _usb_topology_unchanged)
+        self._mountinfo_file = None
+        self._mount_poller = None
+        self._last_block_devices = None
+        
+        # Mount points that passed a real write test
+        self._verified_mounts = set()
+        
         # Create auto-mount directory if it doesn't exist
         self._ensure_mount_directory()
     
@@ -56,9 +183,13 @@ class FileExporter:
         self.logger.setLevel(logging.INFO)
     
     def _ensure_mount_directory(self):
-        """Ensure the auto-mount directory exists."""
+        """Ensure the auto-mount directory exists (once per process)."""
+        if self.auto_mount_base in FileExporter._ready_mount_dirs:
+            return
+        
         try:
             os.makedirs(self.auto_mount_base, exist_ok=True)
+            FileExporter._ready_mount_dirs.add(self.auto_mount_base)
             self.logger.debug(f"Mount directory ensured: {self.auto_mount_base}")
         except Exception as e:
             self.logger.error(f"Failed to create mount directory: {e}")
@@ -77,9 +208,17 @@ class FileExporter:
             self._cached_usb_status is not None):
             return self._cached_usb_status
         
+        # Nothing mounted, unmounted, plugged in or removed since the drive was
+        # found accessible. A negative result is always rechecked: udev finishes
+        # setting up a new stick, and an auto-mount may succeed on retry,
+        # without changing the mount table or the block device listing
+        if self._usb_topology_unchanged() and self._cached_usb_status:
+            self._last_usb_check = current_time
+            return self._cached_usb_status
+        
         try:
             # Check for USB storage devices
-            usb_devices = self._get_usb_storage_devices()
+            usb_devices = self._get_usb_storage_devices_cached()
             
             if not usb_devices:
                 self._cached_usb_status = False
@@ -117,6 +256,47 @@ class FileExporter:
             self._last_usb_check = current_time
             return False
     
+    def _usb_topology_unchanged(self) -> bool:
+        """
+        Cheaply check whether mounts or block devices changed since the last call.
+        
+        The kernel flags a persistent /proc/self/mountinfo handle with
+        POLLPRI when the mount table changes; plugging in or removing a
+        stick shows up as a changed /sys/block listing. On any change the
+        device and mount caches are invalidated.
+        
+        Returns:
+            True if neither the mount table nor the block devices changed
+        """
+        try:
+            if self._mount_poller is None:
+                self._mountinfo_file = open(self._MOUNTINFO_PATH, 'rb', buffering=0)
+                self._mount_poller = select.poll()
+                self._mount_poller.register(self._mountinfo_file, select.POLLPRI | select.POLLERR)
+                mounts_changed = True
+            else:
+                mounts_changed = bool(self._mount_poller.poll(0))
+            
+            if mounts_changed:
+                # Reading the table to the end acknowledges the change
+                self._mountinfo_file.seek(0)
+                while self._mountinfo_file.read(65536):
+                    pass
+            
+            block_devices = set(os.listdir(self._SYS_BLOCK_DIR))
+            devices_changed = block_devices != self._last_block_devices
+            self._last_block_devices = block_devices
+            
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"USB change detection unavailable: {e}")
+            return False
+        
+        if mounts_changed or devices_changed:
+            self._invalidate_device_cache()
+            return False
+        
+        return True
+    
     def find_usb_path(self) -> Optional[str]:
         """
         Find the path to the first accessible FAT32 USB drive.
@@ -129,7 +309,7 @@ class FileExporter:
             return self._cached_usb_path
         
         try:
-            usb_devices = self._get_usb_storage_devices()
+            usb_devices = self._get_usb_storage_devices_cached()
             
             for device in usb_devices:
                 mount_point = self._get_mount_point(device)
@@ -148,6 +328,45 @@ class FileExporter:
             self.logger.error(f"Error finding USB path: {e}")
             return None
     
+    def _scan_usb_tree_cached(self, max_age: Optional[float] = None) -> Tuple[List[str], List[Dict[str, str]], bool]:
+        """
+        Get the USB block device scan, reusing a recent one.
+        
+        Args:
+            max_age: Maximum age of the cached scan in seconds
+                (defaults to the USB status cache duration)
+            
+        Returns:
+            Tuple as returned by _scan_usb_tree
+        """
+        if max_age is None:
+            max_age = self._usb_cache_duration
+        
+        current_time = time.time()
+        if current_time - self._cached_scan_ts >= max_age:
+            self._cached_scan = self._scan_usb_tree()
+            self._cached_scan_ts = current_time
+        
+        return self._cached_scan
+    
+    def _get_usb_storage_devices_cached(self, max_age: Optional[float] = None) -> List[str]:
+        """
+        Get the FAT32 USB device list, reusing a recent scan.
+        
+        Args:
+            max_age: Maximum age of the cached list in seconds
+                (defaults to the USB status cache duration)
+            
+        Returns:
+            List of device paths with FAT32 filesystem
+        """
+        return list(self._scan_usb_tree_cached(max_age)[0])
+    
+    def _invalidate_device_cache(self):
+        """Force the next device and mount lookups to rescan."""
+        self._cached_scan_ts = 0.0
+        self._cached_mounts_ts = 0.0
+    
     def _get_usb_storage_devices(self) -> List[str]:
         """
         Get list of USB storage device paths with FAT32 filesystem only.
@@ -155,55 +374,184 @@ class FileExporter:
         Returns:
             List of device paths (e.g., ['/dev/sda1', '/dev/sdb1']) with FAT32 filesystem
         """
+        return self._scan_usb_tree()[0]
+    
+    def _scan_usb_tree(self) -> Tuple[List[str], List[Dict[str, str]], bool]:
+        """
+        Scan USB block devices once and classify them by filesystem.
+        
+        Returns:
+            Tuple of (FAT32 device paths, incompatible devices as dicts with
+            'device', 'filesystem' and 'name', whether any USB disk was seen)
+        """
         usb_devices = []
+        incompatible_devices = []
+        
+        # Read sysfs or udev's by-id links directly, and only fork lsblk if neither works
+        usb_disks = self._list_usb_disks_sysfs()
+        if usb_disks is None:
+            usb_disks = self._list_usb_disks_by_id()
+        if usb_disks is None:
+            usb_disks = self._list_usb_disks_lsblk()
+        
+        for entries in usb_disks:
+            for name, fstype in entries:
+                device_path = f"/dev/{name}"
+                
+                # Only accept FAT32 (vfat) filesystems
+                if fstype == 'vfat':
+                    usb_devices.append(device_path)
+                    self.logger.debug(f"Found FAT32 USB device: {device_path}")
+                elif fstype:
+                    incompatible_devices.append({
+                        'device': device_path,
+                        'filesystem': fstype.upper(),
+                        'name': name
+                    })
+                    self.logger.info(f"Skipping USB device {name} with unsupported filesystem: {fstype}")
+        
+        if usb_devices:
+            self.logger.info(f"Found {len(usb_devices)} FAT32 USB device(s)")
+        else:
+            self.logger.debug("No FAT32 USB devices found")
+        
+        return usb_devices, incompatible_devices, bool(usb_disks)
+    
+    def _list_usb_disks_sysfs(self) -> Optional[List[List[Tuple[str, str]]]]:
+        """
+        List USB disks from /sys/block, with filesystem types from the udev database.
+        
+        Returns:
+            One list of (name, fstype) per USB disk, holding its partitions or
+            the disk itself if it has none; None if sysfs/udev cannot be used
+        """
+        try:
+            usb_disks = []
+            
+            with os.scandir(self._SYS_BLOCK_DIR) as disks:
+                for disk in disks:
+                    # USB disks sit below a USB controller in the device tree
+                    if '/usb' not in os.path.realpath(disk.path):
+                        continue
+                    
+                    with os.scandir(disk.path) as children:
+                        partitions = sorted(
+                            child.name for child in children
+                            if child.name.startswith(disk.name)
+                            and os.path.exists(os.path.join(child.path, 'partition'))
+                        )
+                    
+                    entries = []
+                    for name, dev_dir in ([(part, os.path.join(disk.path, part)) for part in partitions]
+                                          or [(disk.name, disk.path)]):
+                        fstype = self._read_udev_fstype(dev_dir)
+                        if fstype is None:
+                            return None
+                        entries.append((name, fstype))
+                    usb_disks.append(entries)
+            
+            return usb_disks
+            
+        except OSError as e:
+            self.logger.debug(f"sysfs USB scan unavailable, falling back to lsblk: {e}")
+            return None
+    
+    def _list_usb_disks_by_id(self) -> Optional[List[List[Tuple[str, str]]]]:
+        """
+        List USB disks from the usb-* links in /dev/disk/by-id.
+        
+        Returns:
+            One list of (name, fstype) per USB disk, holding its partitions or
+            the disk itself if it has none; None if the links cannot be used
+        """
+        try:
+            disks = {}
+            partitions = {}
+            
+            with os.scandir(self._DISK_BY_ID_DIR) as links:
+                for link in links:
+                    if not link.name.startswith('usb-'):
+                        continue
+                    
+                    name = os.path.basename(os.readlink(link.path))
+                    disk_link, sep, number = link.name.rpartition('-part')
+                    if sep and number.isdigit():
+                        partitions.setdefault(disk_link, []).append(name)
+                    else:
+                        disks[link.name] = name
+            
+            usb_disks = []
+            for disk_link, disk_name in sorted(disks.items()):
+                entries = []
+                for name in sorted(partitions.get(disk_link, ())) or [disk_name]:
+                    fstype = self._read_udev_fstype(os.path.join(self._SYS_CLASS_BLOCK_DIR, name))
+                    if fstype is None:
+                        return None
+                    entries.append((name, fstype))
+                usb_disks.append(entries)
+            
+            return usb_disks
+            
+        except OSError as e:
+            self.logger.debug(f"by-id USB scan unavailable, falling back to lsblk: {e}")
+            return None
+    
+    def _read_udev_fstype(self, dev_dir: str) -> Optional[str]:
+        """
+        Read the filesystem type udev recorded for a block device.
+        
+        Args:
+            dev_dir: sysfs directory of the disk or partition
+            
+        Returns:
+            Lower-case filesystem type ('' if none), or None if udev has no record
+        """
+        with open(os.path.join(dev_dir, 'dev')) as f:
+            dev_number = f.read().strip()
+        
+        try:
+            with open(os.path.join(self._UDEV_DATA_DIR, f"b{dev_number}")) as f:
+                for line in f:
+                    if line.startswith('E:ID_FS_TYPE='):
+                        return line[13:].strip().lower()
+        except FileNotFoundError:
+            return None
+        
+        return ''
+    
+    def _list_usb_disks_lsblk(self) -> List[List[Tuple[str, str]]]:
+        """
+        List USB disks using lsblk.
+        
+        Returns:
+            One list of (name, fstype) per USB disk, holding its partitions or
+            the disk itself if it has none
+        """
+        usb_disks = []
         
         try:
             # Use lsblk to get block devices
             result = subprocess.run(
-                ['lsblk', '-J', '-o', 'NAME,TRAN,TYPE,MOUNTPOINT,FSTYPE'],
+                [_command_path('lsblk'), '-J', '-o', 'NAME,TRAN,TYPE,MOUNTPOINT,FSTYPE'],
                 capture_output=True,
-                text=True,
-                timeout=10
+                timeout=2
             )
             
             if result.returncode != 0:
                 self.logger.warning("lsblk command failed")
-                return usb_devices
+                return usb_disks
             
-            # Parse JSON output
-            data = json.loads(result.stdout)
+            # Parse JSON output (raw bytes, no text decoding needed)
+            data = _json_loads(result.stdout)
             
             for device in data.get('blockdevices', []):
                 # Check if it's a USB device
                 if device.get('tran') == 'usb' and device.get('type') == 'disk':
-                    # Check for partitions
-                    children = device.get('children', [])
-                    if children:
-                        for child in children:
-                            fstype = child.get('fstype', '').lower()
-                            # Only accept FAT32 (vfat) filesystems
-                            if fstype == 'vfat':
-                                device_path = f"/dev/{child['name']}"
-                                usb_devices.append(device_path)
-                                self.logger.debug(f"Found FAT32 USB device: {device_path}")
-                            elif fstype and fstype != 'vfat':
-                                self.logger.info(f"Skipping USB device {child['name']} with unsupported filesystem: {fstype}")
-                    else:
-                        # No partitions, check the device itself
-                        fstype = device.get('fstype', '').lower()
-                        if fstype == 'vfat':
-                            device_path = f"/dev/{device['name']}"
-                            usb_devices.append(device_path)
-                            self.logger.debug(f"Found FAT32 USB device: {device_path}")
-                        elif fstype:
-                            self.logger.info(f"Skipping USB device {device['name']} with unsupported filesystem: {fstype}")
-            
-            if usb_devices:
-                self.logger.info(f"Found {len(usb_devices)} FAT32 USB device(s)")
-            else:
-                self.logger.debug("No FAT32 USB devices found")
-            
-            return usb_devices
+                    # Check the partitions, or the device itself if it has none
+                    usb_disks.append([
+                        (entry['name'], (entry.get('fstype') or '').lower())
+                        for entry in device.get('children') or [device]
+                    ])
             
         except subprocess.TimeoutExpired:
             self.logger.error("lsblk command timed out")
@@ -212,7 +560,40 @@ class FileExporter:
         except Exception as e:
             self.logger.error(f"Error getting USB devices: {e}")
         
-        return usb_devices
+        return usb_disks
+    
+    def _read_mount_table(self) -> Dict[str, str]:
+        """
+        Read the mount table, reusing a recent read.
+        
+        Returns:
+            Dictionary mapping device paths to their first mount point
+        """
+        current_time = time.time()
+        if current_time - self._cached_mounts_ts < self._MOUNT_TABLE_CACHE_DURATION:
+            return self._cached_mounts
+        
+        mounts = {}
+        with open(self._MOUNTINFO_PATH) as f:
+            for line in f:
+                # Fields: id parent major:minor root mount_point options [optional...] - fstype source super_options
+                fields, _, tail = line.partition(' - ')
+                fields = fields.split()
+                tail = tail.split()
+                if len(fields) < 5 or len(tail) < 2:
+                    continue
+                
+                mount_point = _unescape_mount_field(fields[4])
+                source = _unescape_mount_field(tail[1])
+                mounts.setdefault(source, mount_point)
+                
+                # Mounts made through /dev/disk/by-* links also match the real device
+                if source.startswith('/dev/disk/'):
+                    mounts.setdefault(os.path.realpath(source), mount_point)
+        
+        self._cached_mounts = mounts
+        self._cached_mounts_ts = current_time
+        return mounts
     
     def _get_mount_point(self, device_path: str) -> Optional[str]:
         """
@@ -224,13 +605,18 @@ class FileExporter:
         Returns:
             Mount point path or None if not mounted
         """
+        try:
+            return self._read_mount_table().get(device_path)
+        except OSError as e:
+            self.logger.debug(f"Cannot read {self._MOUNTINFO_PATH}, using findmnt: {e}")
+        
         try:
             # Check if already mounted
             result = subprocess.run(
-                ['findmnt', '-n', '-o', 'TARGET', device_path],
+                [_command_path('findmnt'), '-n', '-o', 'TARGET', device_path],
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=2
             )
             
             if result.returncode == 0:
@@ -265,16 +651,23 @@ class FileExporter:
             # Create mount point directory
             os.makedirs(mount_point, exist_ok=True)
             
+            # Mount directly when the process is allowed to
+            if self._mount_syscall(device_path, mount_point):
+                self.logger.info(f"Successfully mounted {device_path} at {mount_point}")
+                self._invalidate_device_cache()
+                return True
+            
             # Try to mount the device
             result = subprocess.run(
-                ['sudo', 'mount', device_path, mount_point],
+                [_command_path('sudo'), 'mount', device_path, mount_point],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=3
             )
             
             if result.returncode == 0:
                 self.logger.info(f"Successfully mounted {device_path} at {mount_point}")
+                self._invalidate_device_cache()
                 return True
             else:
                 self.logger.warning(f"Failed to mount {device_path}: {result.stderr}")
@@ -292,10 +685,97 @@ class FileExporter:
         
         return False
     
+    @classmethod
+    def _get_libc(cls) -> ctypes.CDLL:
+        """
+        Load the C library once per process.
+        
+        Returns:
+            libc handle with errno tracking enabled
+        """
+        if cls._libc is None:
+            cls._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        return cls._libc
+    
+    def _preallocate(self, fd: int, size: int):
+        """
+        Reserve disk space for a file without changing its size.
+        
+        Lets FAT allocate the clusters of the export in one go instead of
+        growing the chain with every write. Uses fallocate(2) with
+        FALLOC_FL_KEEP_SIZE, which vfat supports; posix_fallocate is avoided
+        because glibc emulates it by writing zeros. Failure is harmless.
+        
+        Args:
+            fd: File descriptor of the open export file
+            size: Expected final file size in bytes
+        """
+        try:
+            libc = self._get_libc()
+            fallocate = getattr(libc, 'fallocate64', None) or libc.fallocate
+            fallocate.argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64)
+            if fallocate(fd, self._FALLOC_FL_KEEP_SIZE, 0, size) != 0:
+                self.logger.debug(f"fallocate not supported: {os.strerror(ctypes.get_errno())}")
+        except (OSError, AttributeError) as e:
+            self.logger.debug(f"fallocate unavailable: {e}")
+    
+    def _mount_syscall(self, device_path: str, mount_point: str, fstype: str = 'vfat',
+                       flags: int = 0, data: str = '') -> bool:
+        """
+        Mount a device with the mount(2) system call.
+        
+        Avoids forking sudo and mount when the process already has the
+        privilege to mount (e.g. runs as root). A refusal is remembered so
+        later mounts go straight to sudo.
+        
+        Args:
+            device_path: Path to the device to mount
+            mount_point: Directory to mount it on
+            fstype: Filesystem type
+            flags: Mount flags (MS_*)
+            data: Filesystem-specific mount options
+            
+        Returns:
+            True if the device was mounted, False to fall back to sudo mount
+        """
+        if FileExporter._mount_syscall_allowed is False:
+            return False
+        
+        try:
+            libc_mount = self._get_libc().mount
+            libc_mount.argtypes = (
+                ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_ulong, ctypes.c_char_p
+            )
+            
+            result = libc_mount(
+                os.fsencode(device_path), os.fsencode(mount_point), fstype.encode(),
+                flags, data.encode()
+            )
+        except (OSError, AttributeError) as e:
+            self.logger.debug(f"mount(2) unavailable: {e}")
+            FileExporter._mount_syscall_allowed = False
+            return False
+        
+        if result == 0:
+            FileExporter._mount_syscall_allowed = True
+            return True
+        
+        err = ctypes.get_errno()
+        if err == errno.EPERM:
+            self.logger.debug("No privilege for mount(2), using sudo mount")
+            FileExporter._mount_syscall_allowed = False
+        else:
+            self.logger.debug(f"mount(2) failed for {device_path}: {os.strerror(err)}")
+        return False
+    
     def _is_accessible(self, path: str) -> bool:
         """
         Check if a path is accessible for writing.
         
+        Only the first check of a mount point writes a test file; later
+        checks use permission and filesystem flags so polling does not
+        write to the USB stick.
+        
         Args:
             path: Path to check
             
@@ -303,66 +783,75 @@ class FileExporter:
             True if path is accessible for writing, False otherwise
         """
         try:
-            if not os.path.exists(path):
+            if not os.path.isdir(path):
                 return False
             
-            if not os.path.isdir(path):
+            if not os.access(path, os.W_OK | os.X_OK):
+                return False
+            
+            # Catch FAT filesystems remounted read-only after errors
+            if os.statvfs(path).f_flag & os.ST_RDONLY:
                 return False
             
-            # Check if we can write to the directory
+            if path in self._verified_mounts:
+                return True
+            
+            # Check once that we can really write to the directory
             test_file = os.path.join(path, '.test_write')
             try:
                 with open(test_file, 'w') as f:
                     f.write('test')
                 os.remove(test_file)
-                return True
             except:
                 return False
+            
+            self._verified_mounts.add(path)
+            return True
                 
         except Exception as e:
             self.logger.debug(f"Path {path} not accessible: {e}")
             return False
     
-    def export_all_tests(self, test_data: Optional[List[Dict[str, Any]]] = None) -> bool:
+    def export_all_tests(self, test_data: Optional[Iterable[Dict[str, Any]]] = None,
+                         progress_cb: Optional[Callable[[int], None]] = None) -> int:
         """
         Export all test results to the FAT32 USB drive.
         
         Args:
-            test_data: Optional test data to export. If None, will try to load from database.
+            test_data: Optional test records (list or iterator) to export.
+                If None, records are streamed from the database.
+            progress_cb: Optional callback receiving the number of records
+                exported so far, called every 1000 records
             
         Returns:
-            True if export was successful, False otherwise
+            Number of records exported (0 if the export failed)
         """
         usb_path = self.find_usb_path()
         if not usb_path:
             self.logger.error("No accessible FAT32 USB drive found for export")
-            return False
+            return 0
         
         try:
             # Get test data if not provided
             if test_data is None:
                 test_data = self._load_test_data()
             
-            if not test_data:
-                self.logger.warning("No test data available to export")
-                return False
-            
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"all_test_results_{timestamp}.csv"
             file_path = os.path.join(usb_path, filename)
             
             # Export to CSV
-            success = self._export_to_csv(test_data, file_path)
+            record_count = self._export_to_csv(test_data, file_path, progress_cb)
             
-            if success:
-                self.logger.info(f"Successfully exported {len(test_data)} test records to {file_path}")
+            if record_count:
+                self.logger.info(f"Successfully exported {record_count} test records to {file_path}")
             
-            return success
+            return record_count
             
         except Exception as e:
             self.logger.error(f"Error exporting all tests: {e}")
-            return False
+            return 0
     
     def export_last_test(self, test_data: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -382,11 +871,12 @@ class FileExporter:
         try:
             # Get last test data if not provided
             if test_data is None:
-                all_tests = self._load_test_data()
-                if not all_tests:
+                # Keep only the newest record while streaming the rest past
+                last_tests = deque(self._load_test_data(), maxlen=1)
+                if not last_tests:
                     self.logger.warning("No test data available to export")
                     return False
-                test_data = all_tests[-1]  # Get the last test
+                test_data = last_tests[0]
             
             # Generate filename with timestamp
             test_timestamp = test_data.get('timestamp', datetime.now().isoformat())
@@ -396,137 +886,232 @@ class FileExporter:
             file_path = os.path.join(usb_path, filename)
             
             # Export single test to CSV
-            success = self._export_to_csv([test_data], file_path)
+            record_count = self._export_to_csv([test_data], file_path)
             
-            if success:
+            if record_count:
                 self.logger.info(f"Successfully exported last test result to {file_path}")
             
-            return success
+            return record_count > 0
             
         except Exception as e:
             self.logger.error(f"Error exporting last test: {e}")
             return False
     
-    def _load_test_data(self) -> List[Dict[str, Any]]:
+    def _load_test_data(self) -> Iterator[Dict[str, Any]]:
         """
-        Load test data from the TestResultDatabase.
+        Stream test data from the TestResultDatabase.
         
         Returns:
-            List of test data dictionaries
+            Iterator over test data dictionaries (oldest first)
         """
         try:
             # Import the correct TestResultDatabase from your module structure
             # Based on the export settings import path, this should be the correct path
             from multi_chamber_test.database.test_result_db import TestResultDatabase
             
-            self.logger.info("Loading test data from TestResultDatabase")
+            self.logger.info("Streaming test data from TestResultDatabase")
             db = TestResultDatabase()
-            test_data = db.get_all_results()
-            
-            self.logger.info(f"Successfully loaded {len(test_data)} test records from database")
-            return test_data
+            return db.iter_all_results()
             
         except ImportError as e:
             self.logger.error(f"Failed to import TestResultDatabase: {e}")
             self.logger.warning("TestResultDatabase module not available")
-            return []
+            return iter(())
         except Exception as e:
             self.logger.error(f"Error loading test data from database: {e}")
-            return []
+            return iter(())
     
-    def _export_to_csv(self, test_data: List[Dict[str, Any]], file_path: str) -> bool:
+    def _export_to_csv(self, test_data: Iterable[Dict[str, Any]], file_path: str,
+                       progress_cb: Optional[Callable[[int], None]] = None) -> int:
         """
         Export test data to a CSV file.
         
+        The records are consumed in a single pass, so test_data may be a
+        generator. Summary and detail rows are formatted by hand, spooled in
+        batches into separate buffers while the records are counted, then
+        written after the header in one preallocated sequential write that
+        is renamed into place when complete.
+        
         Args:
-            test_data: List of test data dictionaries
+            test_data: Iterable of test data dictionaries
             file_path: Path to save the CSV file
+            progress_cb: Optional callback receiving the number of records
+                processed so far, called every _PROGRESS_INTERVAL records
             
         Returns:
-            True if export was successful, False otherwise
+            Number of records written (0 if nothing was exported)
         """
+        batch_rows = self._WRITE_BATCH_ROWS
+        
+        # Report progress sparsely so it never dominates the row loop
+        progress_interval = self._PROGRESS_INTERVAL
+        
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
+            with tempfile.SpooledTemporaryFile(max_size=self._SPOOL_MAX_SIZE) as summary_buf, \
+                    tempfile.SpooledTemporaryFile(max_size=self._SPOOL_MAX_SIZE) as detail_buf:
+                summary_rows = []
+                detail_rows = []
+                record_count = 0
                 
-                # Write header section
-                writer.writerow(['Multi-Chamber Test Results Export'])
-                writer.writerow(['Export Date:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
-                writer.writerow(['Total Records:', len(test_data)])
-                writer.writerow([])  # Empty row
+                # Local bindings for the row loop
+                append_summary = summary_rows.append
+                append_detail = detail_rows.append
+                format_summary = _SUMMARY_ROW.format
+                format_detail = _DETAIL_ROW.format
                 
-                # Write test summary header
-                writer.writerow([
-                    'Test ID', 'Timestamp', 'Operator ID', 'Operator Name', 'Test Mode', 'Reference',
-                    'Duration (s)', 'Overall Result', 'Chamber 1 Result', 
-                    'Chamber 2 Result', 'Chamber 3 Result'
-                ])
-                
-                # Write test summary data
                 for record in test_data:
-                    # Get chamber results
-                    chambers = record.get('chambers', [])
-                    chamber_results = []
+                    record_count += 1
+                    rg = record.get
+                    test_id = rg('id', '')
+                    chambers = rg('chambers', [])
                     
-                    for i in range(3):
-                        if i < len(chambers):
-                            chamber = chambers[i]
-                            if chamber.get('enabled', False):
-                                result = 'PASS' if chamber.get('result', False) else 'FAIL'
-                                pressure = chamber.get('final_pressure', 0)
-                                chamber_results.append(f"{result} ({pressure:.1f} mbar)")
-                            else:
-                                chamber_results.append('Disabled')
-                        else:
-                            chamber_results.append('N/A')
+                    # Build the summary results and detail rows in one walk over the chambers
+                    chamber_results = ['N/A', 'N/A', 'N/A']
+                    for i, chamber in enumerate(chambers):
+                        cg = chamber.get
+                        enabled = bool(cg('enabled', False))
+                        passed = bool(cg('result', False))
+                        final_pressure = cg('final_pressure', 0)
+                        
+                        if i < 3:
+                            chamber_results[i] = _CHAMBER_RESULT[passed](final_pressure) if enabled else 'Disabled'
+                        
+                        append_detail(format_detail(
+                            test_id,
+                            i + 1,
+                            _YES_NO[enabled],
+                            cg('pressure_target', 0),
+                            cg('pressure_threshold', 0),
+                            cg('pressure_tolerance', 0),
+                            cg('start_pressure', 0),
+                            final_pressure,
+                            _PASS_FAIL[passed]
+                        ))
                     
-                    writer.writerow([
-                        record.get('id', ''),
-                        record.get('timestamp', ''),
-                        record.get('operator_id', 'N/A'),
-                        record.get('operator_name', 'N/A'),
-                        record.get('test_mode', 'Unknown'),
-                        record.get('reference', 'N/A'),
-                        record.get('test_duration', 0),
-                        'PASS' if record.get('overall_result', False) else 'FAIL',
+                    append_summary(format_summary(
+                        test_id,
+                        _q(rg('timestamp', '')),
+                        _q(rg('operator_id', 'N/A')),
+                        _q(rg('operator_name', 'N/A')),
+                        _q(rg('test_mode', 'Unknown')),
+                        _q(rg('reference', 'N/A')),
+                        rg('test_duration', 0),
+                        _PASS_FAIL[bool(rg('overall_result', False))],
                         chamber_results[0],
                         chamber_results[1],
                         chamber_results[2]
-                    ])
+                    ))
+                    
+                    if progress_cb is not None and not record_count % progress_interval:
+                        progress_cb(record_count)
+                    
+                    # Hand full batches to the buffers in one write each
+                    if len(summary_rows) >= batch_rows:
+                        summary_buf.write(''.join(summary_rows).encode('utf-8'))
+                        summary_rows.clear()
+                    if len(detail_rows) >= batch_rows:
+                        detail_buf.write(''.join(detail_rows).encode('utf-8'))
+                        detail_rows.clear()
+                
+                if not record_count:
+                    self.logger.warning("No test data available to export")
+                    return 0
                 
-                # Write detailed chamber data section
-                writer.writerow([])  # Empty row
-                writer.writerow(['Detailed Chamber Data'])
-                writer.writerow([
-                    'Test ID', 'Chamber', 'Enabled', 'Target (mbar)', 
-                    'Threshold (mbar)', 'Tolerance (mbar)', 'Start Pressure (mbar)',
-                    'Final Pressure (mbar)', 'Result'
-                ])
+                summary_buf.write(''.join(summary_rows).encode('utf-8'))
+                detail_buf.write(''.join(detail_rows).encode('utf-8'))
                 
-                # Write chamber details
-                for record in test_data:
-                    test_id = record.get('id', '')
-                    chambers = record.get('chambers', [])
+                # Header lines still go through the csv module
+                export_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                header = io.StringIO(newline='')
+                writer = csv.writer(header)
+                writer.writerow(('Multi-Chamber Test Results Export',))
+                writer.writerow(('Export Date:', export_date))
+                writer.writerow(('Total Records:', record_count))
+                writer.writerow(())  # Empty row
+                writer.writerow(_SUMMARY_HEADER)
+                
+                detail_header = io.StringIO(newline='')
+                writer = csv.writer(detail_header)
+                writer.writerow(())  # Empty row
+                writer.writerow(('Detailed Chamber Data',))
+                writer.writerow(_DETAIL_HEADER)
+                
+                header_bytes = header.getvalue().encode('utf-8')
+                detail_header_bytes = detail_header.getvalue().encode('utf-8')
+                file_size = len(header_bytes) + summary_buf.tell() + len(detail_header_bytes) + detail_buf.tell()
+                
+                # The spooled sections are the staging copy; write them out in
+                # one sequential pass under a temporary name, then rename it
+                part_path = file_path + '.part'
+                try:
+                    with open(part_path, 'wb', buffering=self._FILE_BUFFER_SIZE) as csvfile:
+                        self._preallocate(csvfile.fileno(), file_size)
+                        
+                        # Write header and test summary section
+                        csvfile.write(header_bytes)
+                        summary_buf.seek(0)
+                        self._copy_with_writeback(summary_buf, csvfile)
+                        
+                        # Write detailed chamber data section
+                        csvfile.write(detail_header_bytes)
+                        detail_buf.seek(0)
+                        self._copy_with_writeback(detail_buf, csvfile)
+                        
+                        # Make sure the data is on the USB stick before reporting success
+                        csvfile.flush()
+                        os.fsync(csvfile.fileno())
+                        
+                        # The export is not read back, so drop it from the page cache
+                        if hasattr(os, 'posix_fadvise'):
+                            os.posix_fadvise(csvfile.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
                     
-                    for i, chamber in enumerate(chambers):
-                        writer.writerow([
-                            test_id,
-                            f'Chamber {i + 1}',
-                            'Yes' if chamber.get('enabled', False) else 'No',
-                            chamber.get('pressure_target', 0),
-                            chamber.get('pressure_threshold', 0),
-                            chamber.get('pressure_tolerance', 0),
-                            chamber.get('start_pressure', 0),
-                            chamber.get('final_pressure', 0),
-                            'PASS' if chamber.get('result', False) else 'FAIL'
-                        ])
+                    os.replace(part_path, file_path)
+                except Exception:
+                    # Do not leave a truncated export behind on the stick
+                    try:
+                        os.remove(part_path)
+                    except OSError:
+                        pass
+                    raise
             
             self.logger.info(f"Successfully wrote CSV file to {file_path}")
-            return True
+            return record_count
             
         except Exception as e:
             self.logger.error(f"Error writing CSV file {file_path}: {e}")
-            return False
+            return 0
+    
+    def _copy_with_writeback(self, src, dst):
+        """
+        Copy a spooled export section into the export file chunk by chunk.
+        
+        After each chunk the kernel is asked to start writing it back, so
+        the USB stick is busy while the next chunk is copied instead of
+        everything draining at fsync time.
+        
+        Args:
+            src: Binary file object to copy from
+            dst: Buffered binary export file to copy into
+        """
+        chunk_size = self._FILE_BUFFER_SIZE
+        sync_file_range = getattr(os, 'sync_file_range', None)
+        
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(chunk)
+            
+            if sync_file_range is not None:
+                dst.flush()
+                end = dst.tell()
+                try:
+                    sync_file_range(dst.fileno(), max(0, end - len(chunk)), len(chunk),
+                                    os.SYNC_FILE_RANGE_WRITE)
+                except OSError as e:
+                    # Filesystem does not support it; fsync still covers the data
+                    self.logger.debug(f"sync_file_range unavailable: {e}")
+                    sync_file_range = None
     
     def get_usb_info(self) -> Dict[str, Any]:
         """
@@ -545,7 +1130,7 @@ class FileExporter:
         }
         
         try:
-            usb_devices = self._get_usb_storage_devices()
+            usb_devices = self._get_usb_storage_devices_cached()
             info['devices'] = usb_devices
             
             if usb_devices:
@@ -564,10 +1149,10 @@ class FileExporter:
                             
                             # Get filesystem type (should be vfat/FAT32)
                             result = subprocess.run(
-                                ['df', '-T', mount_point],
+                                [_command_path('df'), '-T', mount_point],
                                 capture_output=True,
                                 text=True,
-                                timeout=5
+                                timeout=2
                             )
                             if result.returncode == 0:
                                 lines = result.stdout.strip().split('\n')
@@ -603,7 +1188,7 @@ class FileExporter:
             if device_path:
                 devices_to_unmount = [device_path]
             else:
-                devices_to_unmount = self._get_usb_storage_devices()
+                devices_to_unmount = self._get_usb_storage_devices_cached()
             
             success = True
             for device in devices_to_unmount:
@@ -611,18 +1196,19 @@ class FileExporter:
                 if mount_point:
                     try:
                         # Sync first
-                        subprocess.run(['sync'], timeout=10)
+                        os.sync()
                         
                         # Unmount
                         result = subprocess.run(
-                            ['sudo', 'umount', mount_point],
+                            [_command_path('sudo'), 'umount', mount_point],
                             capture_output=True,
                             text=True,
-                            timeout=10
+                            timeout=3
                         )
                         
                         if result.returncode == 0:
                             self.logger.info(f"Successfully unmounted {device} from {mount_point}")
+                            self._verified_mounts.discard(mount_point)
                             
                             # Clean up mount point if we created it
                             if mount_point.startswith(self.auto_mount_base):
@@ -645,6 +1231,7 @@ class FileExporter:
             self._cached_usb_status = None
             self._cached_usb_path = None
             self._last_usb_check = 0
+            self._invalidate_device_cache()
             
             return success
             
@@ -671,54 +1258,11 @@ class FileExporter:
         }
         
         try:
-            # Use lsblk to get all USB block devices (not just FAT32)
-            result = subprocess.run(
-                ['lsblk', '-J', '-o', 'NAME,TRAN,TYPE,MOUNTPOINT,FSTYPE'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                self.logger.warning("lsblk command failed during compatibility check")
-                return compatibility_info
-            
-            # Parse JSON output
-            data = json.loads(result.stdout)
-            
-            for device in data.get('blockdevices', []):
-                # Check if it's a USB device
-                if device.get('tran') == 'usb' and device.get('type') == 'disk':
-                    compatibility_info['no_usb_devices'] = False
-                    
-                    # Check for partitions
-                    children = device.get('children', [])
-                    if children:
-                        for child in children:
-                            device_path = f"/dev/{child['name']}"
-                            fstype = child.get('fstype', '').lower()
-                            
-                            if fstype == 'vfat':
-                                compatibility_info['compatible_devices'].append(device_path)
-                            elif fstype:
-                                compatibility_info['incompatible_devices'].append({
-                                    'device': device_path,
-                                    'filesystem': fstype.upper(),
-                                    'name': child['name']
-                                })
-                    else:
-                        # No partitions, check the device itself
-                        device_path = f"/dev/{device['name']}"
-                        fstype = device.get('fstype', '').lower()
-                        
-                        if fstype == 'vfat':
-                            compatibility_info['compatible_devices'].append(device_path)
-                        elif fstype:
-                            compatibility_info['incompatible_devices'].append({
-                                'device': device_path,
-                                'filesystem': fstype.upper(),
-                                'name': device['name']
-                            })
+            # Share one lsblk scan with the other USB lookups
+            compatible, incompatible, any_usb_seen = self._scan_usb_tree_cached()
+            compatibility_info['compatible_devices'] = list(compatible)
+            compatibility_info['incompatible_devices'] = [dict(device) for device in incompatible]
+            compatibility_info['no_usb_devices'] = not any_usb_seen
             
             self.logger.info(f"USB compatibility check: {len(compatibility_info['compatible_devices'])} compatible, "
                            f"{len(compatibility_info['incompatible_devices'])} incompatible")
@@ -726,4 +1270,22 @@ class FileExporter:
         except Exception as e:
             self.logger.error(f"Error checking USB filesystem compatibility: {e}")
         
-        return compatibility_info
\ No newline at end of file
+        return compatibility_info
+
+
+# Shared instance so the USB, mount and capability caches outlive each caller
+_file_exporter = None
+_file_exporter_lock = threading.Lock()
+
+def get_file_exporter() -> FileExporter:
+    """
+    Get the global FileExporter instance.
+    
+    Returns:
+        FileExporter: Global instance of FileExporter
+    """
+    global _file_exporter
+    with _file_exporter_lock:
+        if _file_exporter is None:
+            _file_exporter = FileExporter()
+    return _file_exporter
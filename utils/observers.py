@@ -7,8 +7,88 @@ This module provides helper functions and mixins to add observer pattern
 capabilities to existing components in the system.
 """
 
+import functools
 import logging
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, Optional, Tuple
+
+from multi_chamber_test.config.constants import TIME_DEFAULTS, PRESSURE_DEFAULTS
+
+# Defaults applied on 'settings_reset'
+_DEFAULT_TEST_DURATION = TIME_DEFAULTS['TEST_DURATION']
+_DEFAULT_TARGET = PRESSURE_DEFAULTS['TARGET']
+_DEFAULT_THRESHOLD = PRESSURE_DEFAULTS['THRESHOLD']
+_DEFAULT_TOLERANCE = PRESSURE_DEFAULTS['TOLERANCE']
+
+
+def _set_test_duration(test_manager, value: Any):
+    """Apply a 'test_duration' setting change."""
+    test_manager.logger.info("Updating test duration to %s", value)
+    test_manager.test_duration = int(value)
+
+
+def _set_test_mode(test_manager, value: Any):
+    """Apply a 'test_mode' setting change."""
+    test_manager.logger.info("Updating test mode to %s", value)
+    # Only update mode, don't try to load reference
+    if value in ["manual", "reference"]:
+        test_manager.test_mode = value
+
+
+def _reset_test_settings(test_manager, value: Any):
+    """Apply a 'settings_reset' notification."""
+    test_manager.logger.info("Resetting all test settings to defaults")
+    # Reset test duration
+    test_manager.test_duration = _DEFAULT_TEST_DURATION
+    
+    # Reset chamber settings
+    for chamber_state in test_manager.chamber_states:
+        chamber_state.enabled = True
+        chamber_state.pressure_target = _DEFAULT_TARGET
+        chamber_state.pressure_threshold = _DEFAULT_THRESHOLD
+        chamber_state.pressure_tolerance = _DEFAULT_TOLERANCE
+
+
+# Per-chamber setting name -> (chamber state attribute, value converter, log label)
+_CHAMBER_SETTINGS = {
+    'pressure_target': ('pressure_target', float, 'target'),
+    'pressure_threshold': ('pressure_threshold', float, 'threshold'),
+    'pressure_tolerance': ('pressure_tolerance', float, 'tolerance'),
+    'enabled': ('enabled', bool, 'enabled state'),
+    'offset': ('offset', float, 'offset'),
+}
+
+
+# 'chamber<N>' (bulk update) or 'chamber<N>_<setting>'
+_CHAMBER_KEY_RE = re.compile(r'chamber(\d+)(?:_(.+))?$')
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_chamber_key(key: str) -> Optional[Tuple[int, Optional[str]]]:
+    """
+    Parse a 'chamber<N>' or 'chamber<N>_<setting>' key.
+    
+    Args:
+        key: The setting key (e.g. 'chamber2_pressure_target')
+        
+    Returns:
+        Tuple of (0-based chamber index, setting name or None for a bulk
+        update), or None if the key is not a chamber key
+    """
+    match = _CHAMBER_KEY_RE.match(key)
+    if match is None:
+        return None
+    # Convert from 1-based to 0-based index
+    return int(match.group(1)) - 1, match.group(2)
+
+
+# Handlers for the fixed TestManager setting keys; chamber keys are parsed separately
+_TEST_MANAGER_HANDLERS = {
+    'test_duration': _set_test_duration,
+    'test_mode': _set_test_mode,
+    'settings_reset': _reset_test_settings,
+}
+
 
 class TestManagerObserver:
     """
@@ -39,98 +119,62 @@ class TestManagerObserver:
             key: The setting key that changed
             value: The new value
         """
+        log = self.logger
         if self.running_test:
-            self.logger.debug(f"Ignoring setting change during active test: {key}")
+            log.debug("Ignoring setting change during active test: %s", key)
             return
-            
-        # Handle test duration changes
-        if key == 'test_duration':
-            self.logger.info(f"Updating test duration to {value}")
-            self.test_duration = int(value)
-            
-        # Handle test mode changes
-        elif key == 'test_mode':
-            self.logger.info(f"Updating test mode to {value}")
-            # Only update mode, don't try to load reference
-            if value in ["manual", "reference"]:
-                self.test_mode = value
-                
+        
+        # Handle fixed keys (test duration, test mode, global reset)
+        handler = _TEST_MANAGER_HANDLERS.get(key)
+        if handler is not None:
+            handler(self, value)
+            return
+        
+        # Everything else must be a chamber key
+        parsed = _parse_chamber_key(key)
+        if parsed is None:
+            return
+        
+        chamber_idx, setting_name = parsed
+        if not 0 <= chamber_idx < len(self.chamber_states):
+            return
+        
         # Handle chamber settings changes
-        elif key.startswith('chamber') and '_' in key:
-            # Extract chamber index and setting name
+        if setting_name is not None:
+            setting = _CHAMBER_SETTINGS.get(setting_name)
+            if setting is None:
+                return
+            
+            chamber_state = self.chamber_states[chamber_idx]
+            attribute, convert, label = setting
             try:
-                parts = key.split('_', 1)
-                chamber_str = parts[0]
-                setting_name = parts[1]
-                
-                # Convert from 1-based to 0-based index
-                chamber_idx = int(chamber_str[7:]) - 1  # Extract number after "chamber"
-                
-                if 0 <= chamber_idx < len(self.chamber_states):
-                    chamber_state = self.chamber_states[chamber_idx]
-                    
-                    if setting_name == 'pressure_target':
-                        chamber_state.pressure_target = float(value)
-                        self.logger.debug(f"Updated chamber {chamber_idx+1} target to {value}")
-                        
-                    elif setting_name == 'pressure_threshold':
-                        chamber_state.pressure_threshold = float(value)
-                        self.logger.debug(f"Updated chamber {chamber_idx+1} threshold to {value}")
-                        
-                    elif setting_name == 'pressure_tolerance':
-                        chamber_state.pressure_tolerance = float(value)
-                        self.logger.debug(f"Updated chamber {chamber_idx+1} tolerance to {value}")
-                        
-                    elif setting_name == 'enabled':
-                        chamber_state.enabled = bool(value)
-                        self.logger.debug(f"Updated chamber {chamber_idx+1} enabled state to {value}")
-                        
-                    elif setting_name == 'offset':
-                        # Handle offset changes if applicable
-                        if hasattr(chamber_state, 'offset'):
-                            chamber_state.offset = float(value)
-                            self.logger.debug(f"Updated chamber {chamber_idx+1} offset to {value}")
-            except (ValueError, IndexError) as e:
-                self.logger.error(f"Error processing chamber setting {key}: {e}")
+                # Offset is only applied if the chamber state supports it
+                if attribute != 'offset' or hasattr(chamber_state, 'offset'):
+                    setattr(chamber_state, attribute, convert(value))
+                    log.debug("Updated chamber %d %s to %s", chamber_idx + 1, label, value)
+            except ValueError as e:
+                log.error("Error processing chamber setting %s: %s", key, e)
         
         # Handle bulk chamber updates
-        elif key.startswith('chamber') and not '_' in key:
+        elif isinstance(value, dict):
             try:
-                # Check if it's a single chamber update
-                chamber_idx = int(key[7:]) - 1  # Convert from 1-based to 0-based
+                chamber = self.chamber_states[chamber_idx]
+                
+                if 'enabled' in value:
+                    chamber.enabled = bool(value['enabled'])
+                
+                if 'pressure_target' in value:
+                    chamber.pressure_target = float(value['pressure_target'])
+                
+                if 'pressure_threshold' in value:
+                    chamber.pressure_threshold = float(value['pressure_threshold'])
+                
+                if 'pressure_tolerance' in value:
+                    chamber.pressure_tolerance = float(value['pressure_tolerance'])
                 
-                if isinstance(value, dict) and 0 <= chamber_idx < len(self.chamber_states):
-                    chamber = self.chamber_states[chamber_idx]
-                    
-                    if 'enabled' in value:
-                        chamber.enabled = bool(value['enabled'])
-                    
-                    if 'pressure_target' in value:
-                        chamber.pressure_target = float(value['pressure_target'])
-                    
-                    if 'pressure_threshold' in value:
-                        chamber.pressure_threshold = float(value['pressure_threshold'])
-                    
-                    if 'pressure_tolerance' in value:
-                        chamber.pressure_tolerance = float(value['pressure_tolerance'])
-                    
-                    self.logger.info(f"Bulk update of chamber {chamber_idx+1} settings")
-            except (ValueError, IndexError):
+                log.info("Bulk update of chamber %d settings", chamber_idx + 1)
+            except ValueError:
                 pass
-        
-        # Handle global reset
-        elif key == 'settings_reset':
-            self.logger.info("Resetting all test settings to defaults")
-            # Reset test duration
-            from multi_chamber_test.config.constants import TIME_DEFAULTS, PRESSURE_DEFAULTS
-            self.test_duration = TIME_DEFAULTS['TEST_DURATION']
-            
-            # Reset chamber settings
-            for i in range(len(self.chamber_states)):
-                self.chamber_states[i].enabled = True
-                self.chamber_states[i].pressure_target = PRESSURE_DEFAULTS['TARGET']
-                self.chamber_states[i].pressure_threshold = PRESSURE_DEFAULTS['THRESHOLD']
-                self.chamber_states[i].pressure_tolerance = PRESSURE_DEFAULTS['TOLERANCE']
             
 
 class RoleManagerObserver:
@@ -164,15 +208,44 @@ class RoleManagerObserver:
         """
         # Handle login requirement changes
         if key == 'require_login':
-            self.logger.info(f"Updating require_login to {value}")
+            self.logger.info("Updating require_login to %s", value)
             self.set_require_login(bool(value))
             
         # Handle session timeout changes
         elif key == 'session_timeout':
-            self.logger.info(f"Updating session_timeout to {value}")
+            self.logger.info("Updating session_timeout to %s", value)
             self.set_session_timeout(int(value))
 
 
+# Observer-enabled subclasses, created once per (mixin, class) pair
+_observer_classes: Dict[Tuple[type, type], type] = {}
+
+
+def _add_mixin(obj, mixin: type):
+    """
+    Switch an object to a subclass of its class that also inherits a mixin.
+    
+    The mixin comes first in the MRO so its methods take precedence, as
+    methods bound onto the instance did, while lookups still go through
+    the class instead of the instance dictionary.
+    
+    Args:
+        obj: The instance to enhance
+        mixin: The observer mixin class to add
+    """
+    cls = type(obj)
+    if issubclass(cls, mixin):
+        return
+    
+    enhanced = _observer_classes.get((mixin, cls))
+    if enhanced is None:
+        enhanced = type(cls.__name__, (mixin, cls), {'__module__': cls.__module__})
+        enhanced.__qualname__ = cls.__qualname__
+        _observer_classes[(mixin, cls)] = enhanced
+    
+    obj.__class__ = enhanced
+
+
 def enhance_test_manager(test_manager, settings_manager=None):
     """
     Enhance an existing TestManager instance with observer capabilities.
@@ -184,9 +257,8 @@ def enhance_test_manager(test_manager, settings_manager=None):
     Returns:
         The enhanced TestManager instance
     """
-    # Add the observer methods to the test manager instance
-    test_manager.register_with_settings_manager = TestManagerObserver.register_with_settings_manager.__get__(test_manager)
-    test_manager.on_setting_changed = TestManagerObserver.on_setting_changed.__get__(test_manager)
+    # Add the observer methods to the test manager's class
+    _add_mixin(test_manager, TestManagerObserver)
     
     # Store settings manager reference if needed
     if not hasattr(test_manager, 'settings_manager') and settings_manager is not None:
@@ -210,9 +282,8 @@ def enhance_role_manager(role_manager, settings_manager=None):
     Returns:
         The enhanced RoleManager instance
     """
-    # Add the observer methods to the role manager instance
-    role_manager.register_with_settings_manager = RoleManagerObserver.register_with_settings_manager.__get__(role_manager)
-    role_manager.on_setting_changed = RoleManagerObserver.on_setting_changed.__get__(role_manager)
+    # Add the observer methods to the role manager's class
+    _add_mixin(role_manager, RoleManagerObserver)
     
     # Register with settings manager if provided
     if settings_manager is not None:
@@ -15,6 +15,72 @@ But the PIDControllerWrapper class doesn't have an 'update' method.
 import time
 from typing import Optional, Tuple
 
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to the plain Python step function
+    njit = None
+
+
+def _pid_step(setpoint: float, current_value: float, kp: float, ki: float, kd: float,
+              inv_ki: float, integral: float, last_input: float, has_last_input: bool,
+              delta_time: float, output_min: float, output_max: float) -> Tuple[float, float, float]:
+    """
+    Compute one PID step on plain floats (compiled with Numba when available).
+    
+    Args:
+        setpoint: The target value for the controller
+        current_value: Current process variable value
+        kp: Proportional gain
+        ki: Integral gain
+        kd: Derivative gain
+        inv_ki: 1 / max(ki, 1e-10), precomputed when the gains change
+        integral: Accumulated integral before this step
+        last_input: Process variable of the previous step
+        has_last_input: Whether last_input is valid
+        delta_time: Time since the previous step in seconds
+        output_min: Lower output limit
+        output_max: Upper output limit
+        
+    Returns:
+        Tuple of (output, new integral, error)
+    """
+    # Calculate error
+    error = setpoint - current_value
+    
+    # Proportional term
+    proportional = kp * error
+    
+    derivative = 0.0
+    if delta_time > 0:
+        inv_dt = 1.0 / delta_time
+        
+        # Integral term
+        integral += error * delta_time
+        
+        # Clamp integral to prevent windup
+        max_integral = (output_max - proportional) * inv_ki
+        min_integral = (output_min - proportional) * inv_ki
+        integral = integral if integral < max_integral else max_integral
+        integral = integral if integral > min_integral else min_integral
+        
+        # Derivative term
+        if has_last_input:
+            # Use derivative on measurement to avoid derivative kick
+            derivative_input = -(current_value - last_input) * inv_dt
+            derivative = kd * derivative_input
+    
+    # Calculate total output and apply output limits
+    output = proportional + ki * integral + derivative
+    output = output if output < output_max else output_max
+    output = output if output > output_min else output_min
+    
+    return output, integral, error
+
+
+if njit is not None:
+    _pid_step = njit(cache=True)(_pid_step)
+
 
 class PIDControllerWrapper:
     """
@@ -23,6 +89,13 @@ class PIDControllerWrapper:
     This class provides PID control with proper update method and reset functionality.
     """
     
+    # Fixed attribute set: read on every control cycle
+    __slots__ = (
+        'setpoint', 'kp', '_ki', 'kd', '_inv_ki', 'output_limits', 'output_min',
+        'output_max', 'sample_time', '_last_time', '_last_error', '_integral',
+        '_last_input', '_last_output'
+    )
+    
     def __init__(self, 
                  setpoint: float = 0.0,
                  kp: float = 1.0, 
@@ -53,74 +126,55 @@ class PIDControllerWrapper:
         # Sample time
         self.sample_time = sample_time
         
-        # Internal state
-        self._last_time = None
-        self._last_error = 0.0
-        self._integral = 0.0
-        self._last_input = None
-        
-        # Reset the controller
+        # Initialize the internal state
         self.reset()
     
+    @property
+    def ki(self) -> float:
+        """Integral gain."""
+        return self._ki
+    
+    @ki.setter
+    def ki(self, ki: float):
+        # Keep the inverse used by the anti-windup clamp in step with the gain
+        self._ki = ki
+        self._inv_ki = 1.0 / max(ki, 1e-10)
+    
     def update(self, current_value: float, dt: Optional[float] = None) -> float:
         """
         Update the PID controller with a new measurement.
         
         Args:
             current_value: Current process variable value
-            dt: Optional time delta. If None, uses internal timing
+            dt: Optional time delta. If None, uses internal timing. Use one
+                mode per controller: after calls with dt the stored time no
+                longer follows the clock, so a later call without dt would
+                get a wrong interval (call reset() before switching)
             
         Returns:
             PID controller output
         """
-        current_time = time.time()
-        
-        # Calculate time delta
+        # Calculate time delta; with an explicit dt the stored clock is
+        # advanced by dt and only read on the first update
         if dt is not None:
             delta_time = dt
-        elif self._last_time is None:
-            delta_time = 0.0
+            current_time = time.monotonic() if self._last_time is None else self._last_time + dt
         else:
-            delta_time = current_time - self._last_time
+            current_time = time.monotonic()
+            delta_time = 0.0 if self._last_time is None else current_time - self._last_time
             
         # Check if enough time has passed (sample time)
         if delta_time < self.sample_time and self._last_time is not None:
             # Return last output if not enough time has passed
-            return getattr(self, '_last_output', 0.0)
-        
-        # Calculate error
-        error = self.setpoint - current_value
-        
-        # Proportional term
-        proportional = self.kp * error
-        
-        # Integral term
-        if delta_time > 0:
-            self._integral += error * delta_time
-            
-            # Prevent integral windup
-            if self.output_limits:
-                # Clamp integral to prevent windup
-                max_integral = (self.output_max - proportional) / max(self.ki, 1e-10)
-                min_integral = (self.output_min - proportional) / max(self.ki, 1e-10)
-                self._integral = max(min_integral, min(max_integral, self._integral))
-        
-        integral = self.ki * self._integral
-        
-        # Derivative term
-        if delta_time > 0 and self._last_input is not None:
-            # Use derivative on measurement to avoid derivative kick
-            derivative_input = -(current_value - self._last_input) / delta_time
-            derivative = self.kd * derivative_input
-        else:
-            derivative = 0.0
+            return self._last_output
         
-        # Calculate total output
-        output = proportional + integral + derivative
-        
-        # Apply output limits
-        if self.output_limits:
-            output = max(self.output_min, min(self.output_max, output))
+        # Run the arithmetic on plain floats
+        last_input = self._last_input
+        output, self._integral, error = _pid_step(
+            self.setpoint, current_value, self.kp, self._ki, self.kd, self._inv_ki, self._integral,
+            0.0 if last_input is None else last_input, last_input is not None,
+            delta_time, self.output_min, self.output_max
+        )
         
         # Store values for next iteration
         self._last_time = current_time
@@ -173,9 +227,6 @@ class PIDControllerWrapper:
         Returns:
             Dictionary with P, I, D components and total output
         """
-        if not hasattr(self, '_last_output'):
-            return {'P': 0, 'I': 0, 'D': 0, 'output': 0}
-            
         error = self._last_error
         proportional = self.kp * error
         integral = self.ki * self._integral